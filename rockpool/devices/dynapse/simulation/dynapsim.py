@@ -156,6 +156,7 @@ class DynapSim(JaxModule):
         rng_key: Optional[FloatVector] = None,
         spiking_input: bool = False,
         spiking_output: bool = True,
+        checkpoint_every: Optional[int] = None,
         *args,
         **kwargs,
     ) -> None:
@@ -230,6 +231,8 @@ class DynapSim(JaxModule):
         :type spiking_input: bool, optional
         :param spiking_output: Whether this module produces spiking output, defaults to True
         :type spiking_output: bool, optional
+        :param checkpoint_every: If provided, evolve in chunks of ``checkpoint_every`` time-steps, each wrapped in ``jax.checkpoint``, so that memory used for backpropagation scales with ``T / checkpoint_every + checkpoint_every`` instead of ``T``, defaults to None
+        :type checkpoint_every: Optional[int], optional
         :raises ValueError: `shape` must be a one- or two-element tuple `(Nin, Nout)`
         :raises ValueError: Multapses are not currently supported in DynapSim pipeline!
         """
@@ -447,10 +450,13 @@ class DynapSim(JaxModule):
             for key in new_params:
                 self.__setattr__(key, new_params[key])
 
+        self._checkpoint_every = self._check_checkpoint_every(checkpoint_every)
+
         # - Define additional arguments required during initialisation
         self._init_args = {
             "has_rec": has_rec,
             "weight_init_func": Partial(weight_init_func),
+            "checkpoint_every": checkpoint_every,
         }
 
     @classmethod
@@ -680,7 +686,7 @@ class DynapSim(JaxModule):
                 timer_ref,
                 vmem,
             )
-            record_ts = (iahp, imem, isyn, spikes, vmem)
+            record_ts = (iahp, imem, isyn, spikes, vmem) if record else (spikes,)
             return state, record_ts
 
         # --- Evolve over spiking inputs --- #
@@ -688,7 +694,7 @@ class DynapSim(JaxModule):
         ## Map over batches
         @jax.vmap
         def scan_time(state, data):
-            return scan(forward, state, data)
+            return self._scan(forward, state, data, self._checkpoint_every)
 
         ## Scan
         state, record_ts = scan_time(initial_state, input_data)
@@ -705,6 +711,9 @@ class DynapSim(JaxModule):
             "vmem": state[6],
         }
 
+        if not record:
+            return record_ts[0], states, {}
+
         record_dict = {
             "iahp": record_ts[0],
             "imem": record_ts[1],
@@ -0,0 +1,199 @@
+"""
+Streaming noise generation shared by the Xylo AFE simulators
+
+Defines :py:class:`.StreamingNoiseMixin`, which provides reproducible, continuous band-limited noise for :py:class:`.syns61201.AFESim` and :py:class:`.syns65300.AFESim` in streaming mode.
+"""
+
+import numpy as np
+from scipy import signal
+
+from functools import lru_cache
+
+from rockpool.parameters import State
+from rockpool.typehints import P_ndarray
+
+__all__ = ["StreamingNoiseMixin"]
+
+# - Length of the white noise frames generated in streaming mode, in samples
+_NOISE_FRAME_LENGTH = 2**14
+
+# - Lowest frequency shaped by the streaming 1/f noise filter, in Hz. The noise spectrum is flat below this frequency
+_NOISE_F_MIN = 1.0
+
+# - Order of the streaming 1/f noise filter
+_NOISE_FILTER_ORDER = 8
+
+# - Number of time constants of the slowest filter pole used to warm up the noise filter
+_NOISE_WARMUP_TAUS = 5
+
+
+@lru_cache(maxsize=32)
+def _one_over_f_sos(Fs: float, F_KNEE: float, F_ALPHA: float) -> np.ndarray:
+    """
+    Design a causal filter which shapes white noise to a 1/f spectrum
+
+    The magnitude response approximates ``(F_KNEE / f) ** F_ALPHA`` for ``f < F_KNEE``, and ``1`` above ``F_KNEE``, as applied by ``_generateNoise`` in the Fourier domain. Below :py:data:`._NOISE_F_MIN` the response is flat. The filter is a cascade of first-order pole-zero pairs, with poles spaced logarithmically between :py:data:`._NOISE_F_MIN` and ``F_KNEE``, and is discretised with the bilinear transform.
+
+    Args:
+        Fs (float): Sampling frequency in Hz
+        F_KNEE (float): Knee frequency in Hz, above which the noise is white
+        F_ALPHA (float): Exponent of the 1/f amplitude spectrum
+
+    Returns: np.ndarray: The filter in ``sos`` format, with ``_NOISE_FILTER_ORDER // 2`` sections
+    """
+    num_sections = _NOISE_FILTER_ORDER // 2
+
+    # - Frequencies above the Nyquist frequency are all mapped to the Nyquist frequency by the bilinear transform
+    f_knee = min(F_KNEE, Fs / 2)
+    if F_ALPHA <= 0 or f_knee <= _NOISE_F_MIN:
+        return np.tile([1.0, 0.0, 0.0, 1.0, 0.0, 0.0], (num_sections, 1))
+
+    # - Each pole-zero pair contributes a slope of -1 between its pole and zero
+    ratio = (f_knee / _NOISE_F_MIN) ** (1 / (_NOISE_FILTER_ORDER - 1 + F_ALPHA))
+    poles = _NOISE_F_MIN * ratio ** np.arange(_NOISE_FILTER_ORDER)
+    zeros = poles * ratio**F_ALPHA
+
+    z, p, _ = signal.bilinear_zpk(-2 * np.pi * zeros, -2 * np.pi * poles, 1.0, Fs)
+    sos = signal.zpk2sos(z, p, 1.0)
+
+    # - Match the gain to the target spectrum in a least-squares sense on a log scale
+    f = np.geomspace(10 * _NOISE_F_MIN, Fs / 2, 200)[:-1]
+    _, h = signal.sosfreqz(sos, f, fs=Fs)
+    target = np.maximum(1.0, (F_KNEE / f) ** F_ALPHA)
+    sos[0, :3] *= np.exp(np.mean(np.log(target) - np.log(np.abs(h))))
+
+    return sos
+
+
+class StreamingNoiseMixin:
+    """
+    Mixin providing streaming noise sources for the Xylo AFE simulators
+
+    White noise is drawn in frames of fixed length, each with its own pRNG derived from the module seed, the noise source and the frame index. White noise is shaped to a 1/f spectrum by a causal filter (see :py:func:`._one_over_f_sos`), whose state is carried between calls. The noise is therefore continuous across frames and calls, and depends only on the seed, the number of samples read so far and the filter state.
+
+    Classes using this mixin must provide the attributes ``seed``, ``Fs`` and ``size_out``, and call :py:meth:`._init_streaming_noise` when registering their streaming states.
+    """
+
+    def _init_streaming_noise(self):
+        """
+        Register the states of the streaming noise sources (0: LNA, 1: BPF, 2: FWR)
+        """
+        self.noise_index: P_ndarray = State(
+            shape=(3,), init_func=lambda s: np.zeros(s, int)
+        )
+        """ (np.ndarray) Number of noise samples read so far from the LNA, BPF and FWR noise sources """
+
+        self.noise_filter_state: P_ndarray = State(
+            shape=(3, _NOISE_FILTER_ORDER // 2, 2, self.size_out), init_func=np.zeros
+        )
+        """ (np.ndarray) State of the 1/f noise filter of each noise source, in ``sosfilt`` format """
+
+        # - Entropy for streaming noise, if the module is not seeded
+        self._noise_entropy = np.random.SeedSequence().entropy
+        """ (int) Entropy used to derive streaming noise generators, if ``seed`` is ``None`` """
+
+        self._noise_cache = {}
+        """ (dict) The most recently generated white noise frame for each noise source """
+
+    def _noise_rng(self, *spawn_key: int) -> np.random.Generator:
+        """
+        Build a pRNG derived from the module seed and a spawn key
+
+        Args:
+            *spawn_key (int): Key identifying the noise source and block of noise
+
+        Returns: np.random.Generator: A new pRNG
+        """
+        entropy = self._noise_entropy if self.seed is None else int(self.seed)
+        return np.random.default_rng(
+            np.random.SeedSequence(entropy, spawn_key=spawn_key)
+        )
+
+    def _white_noise_frame(
+        self, source: int, frame_index: int, num_channels: int
+    ) -> np.ndarray:
+        """
+        Return a frame of unit-variance white noise from a noise source
+
+        Frames can be regenerated on demand; only the most recent frame of each source is cached.
+
+        Args:
+            source (int): Index of the noise source (0: LNA, 1: BPF, 2: FWR)
+            frame_index (int): Index of the noise frame
+            num_channels (int): Number of channels of noise to generate
+
+        Returns: np.ndarray: Noise frame with shape ``(_NOISE_FRAME_LENGTH, num_channels)``
+        """
+        key = (frame_index, num_channels)
+        cached_key, frame = self._noise_cache.get(source, (None, None))
+        if cached_key == key:
+            return frame
+
+        frame = self._noise_rng(source, 0, frame_index).standard_normal(
+            (_NOISE_FRAME_LENGTH, num_channels)
+        )
+        self._noise_cache[source] = (key, frame)
+
+        return frame
+
+    def _stream_noise(
+        self,
+        source: int,
+        T: int,
+        VRMS_SQHZ: float,
+        F_KNEE: float,
+        F_ALPHA: float,
+        num_channels: int,
+    ) -> np.ndarray:
+        """
+        Read band-limited noise from a noise source in streaming mode
+
+        The noise has the same spectrum as noise generated by ``_generateNoise``, limited below :py:data:`._NOISE_F_MIN`. The noise filter is warmed up on the first read after a reset, so that the noise is stationary from the first sample. The noise sequence is independent of the chunk sizes used in :py:meth:`.evolve`.
+
+        Args:
+            source (int): Index of the noise source (0: LNA, 1: BPF, 2: FWR)
+            T (int): Number of samples to read
+            VRMS_SQHZ (float):
+            F_KNEE (float):
+            F_ALPHA (float):
+            num_channels (int): Number of channels of noise to generate
+
+        Returns: np.ndarray: Generated noise with shape ``(T, num_channels)``
+        """
+        index = np.array(self.noise_index)
+        filter_state = np.array(self.noise_filter_state)
+        pos = int(index[source])
+        sos = _one_over_f_sos(float(self.Fs), float(F_KNEE), float(F_ALPHA))
+
+        # - Warm up the noise filter from rest, with noise that precedes the stream
+        zi = filter_state[source, :, :, :num_channels]
+        if pos == 0:
+            num_warmup = int(
+                np.ceil(_NOISE_WARMUP_TAUS * self.Fs / (2 * np.pi * _NOISE_F_MIN))
+            )
+            warmup = self._noise_rng(source, 1).standard_normal(
+                (num_warmup, num_channels)
+            )
+            _, zi = signal.sosfilt(sos, warmup, axis=0, zi=np.zeros_like(zi))
+
+        # - Read white noise from consecutive frames
+        white = np.empty((T, num_channels))
+        n = 0
+        while n < T:
+            frame_index, offset = divmod(pos + n, _NOISE_FRAME_LENGTH)
+            frame = self._white_noise_frame(source, frame_index, num_channels)
+
+            take = min(_NOISE_FRAME_LENGTH - offset, T - n)
+            white[n : n + take] = frame[offset : offset + take]
+            n += take
+
+        # - Shape the noise spectrum, keeping the filter state
+        noise, zi = signal.sosfilt(sos, white, axis=0, zi=zi)
+
+        index[source] = pos + T
+        filter_state[source, :, :, :num_channels] = zi
+        self.noise_index = index
+        self.noise_filter_state = filter_state
+
+        # - Noise in the bandwidth 0 - Fs/2
+        return noise * VRMS_SQHZ * np.sqrt(self.Fs / 2)
@@ -20,7 +20,7 @@ from scipy.signal import butter, lfilter
 from scipy import signal, fftpack
 import enum
 
-from typing import Union, Tuple
+from typing import Union, Tuple, Optional
 
 from logging import debug, info
 
@@ -30,12 +30,13 @@ debug = print
 from rockpool.typehints import P_int, P_float, P_bool, P_ndarray
 
 from .afe_spike_generation import _encode_spikes
+from ..afe_noise import StreamingNoiseMixin
 
 # Define exports
 __all__ = ["AFESim"]
 
 
-class AFESim(Module):
+class AFESim(StreamingNoiseMixin, Module):
     """
     A :py:class:`.Module` that simulates analog hardware for preprocessing audio and converting into spike features.
 
@@ -65,6 +66,7 @@ class AFESim(Module):
         add_mismatch: bool = True,
         seed: int = np.random.randint(2**32 - 1),
         num_workers: int = 1,
+        streaming: bool = False,
         *args,
         **kwargs,
     ):
@@ -87,6 +89,8 @@ class AFESim(Module):
             The AFE is subject to mismatch, this can be seeded by providing an integer seed. Default: random seed. Provide ``None`` to prevent seeding.
         num_workers: int
             Number of cpu units used to speed up filter computation. Default: 1.
+        streaming: bool
+            If ``True``, simulate the AFE causally and keep all filter, noise and event-generation states between calls to :py:meth:`.evolve`, so that a signal can be processed in chunks of arbitrary size. Default: ``False``, use zero-phase filtering over each full input.
         """
 
         ###### Check shape argument and Initialize the superclass ######
@@ -261,6 +265,9 @@ class AFESim(Module):
         self.num_workers: P_int = SimulationParameter(num_workers)
         """ int: number of independent CPU units used for simulating the filters in the filterbank. Default 1"""
 
+        self.streaming: P_bool = SimulationParameter(streaming)
+        """ bool: Flag indicating that the AFE is simulated causally, keeping state between calls to :py:meth:`.evolve`. Default `False` """
+
         ### Macro definitions related to noise ###
         self.VRMS_SQHZ_LNA: P_float = SimulationParameter(70e-9)
         self.F_KNEE_LNA: P_float = SimulationParameter(70e3)
@@ -371,6 +378,7 @@ class AFESim(Module):
             order=self.ORDER_BPF,
             num_workers=self.num_workers,
             use_lowpass=False,
+            streaming=self.streaming,
         )
 
         # - High-pass filter parameters (for AC coupling between microphone and LNA)
@@ -381,6 +389,27 @@ class AFESim(Module):
         self.lif_state: P_ndarray = State(np.zeros(self.size_out))
         """ (np.ndarray) Internal state of the LIF neurons used to generate events """
 
+        # - Reset streaming state
+        if self.streaming:
+            self._init_streaming_state()
+
+    def _init_streaming_state(self):
+        """
+        Register the states carried between calls to :py:meth:`.evolve` in streaming mode
+        """
+        self.hp_zi: P_ndarray = State(
+            shape=(len(self._HP_filt[1]) - 1, self.size_out), init_func=np.zeros
+        )
+        """ (np.ndarray) State of the causal high-pass filter, in ``lfilter`` format """
+
+        self.counter_state: P_ndarray = State(
+            shape=(self.size_out,), init_func=lambda s: np.zeros(s, int)
+        )
+        """ (np.ndarray) State of the digital counter used to down-sample events """
+
+        # - Noise sources
+        self._init_streaming_noise()
+
     ##### Utility functions: filters #####
     def _butter_bandpass(
         self, lowcut: float, highcut: float, fs: float, order: int = 2
@@ -467,6 +496,8 @@ class AFESim(Module):
         VRMS_SQHZ: float = 1e-6,
         F_KNEE: float = 1e3,
         F_ALPHA: float = 1.4,
+        num_channels: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
     ) -> np.ndarray:
         """
         Generate band-limited noise, for use in simulating the AFE architecture
@@ -477,8 +508,10 @@ class AFESim(Module):
             VRMS_SQHZ (float):
             F_KNEE (float):
             F_ALPHA (float):
+            num_channels (Optional[int]): If provided, generate independent noise for this many channels in a single batched FFT. Default: ``None``, generate a single channel
+            rng (Optional[np.random.Generator]): Random number generator to draw from. Default: ``None``, use the global ``numpy`` pRNG
 
-        Returns: np.ndarray: Generated noise with shape ``(T,)``
+        Returns: np.ndarray: Generated noise with shape ``(T,)``, or ``(T, num_channels)`` if ``num_channels`` is provided
         """
 
         def one_over_f(f: np.ndarray, knee: float, alpha: float) -> np.ndarray:
@@ -490,27 +523,32 @@ class AFESim(Module):
 
         W_NOISE_SIGMA = VRMS_SQHZ * np.sqrt(Fs / 2)  # Noise in the bandwidth 0 - Fs/2
 
-        wn = np.random.normal(0, W_NOISE_SIGMA, T)
-        s = fftpack.rfft(wn)
-        f = fftpack.rfftfreq(len(s)) * Fs
+        # - Generate noise for all channels along the last axis
+        shape = T if num_channels is None else (num_channels, T)
+        wn = (np.random if rng is None else rng).normal(0, W_NOISE_SIGMA, shape)
+        s = fftpack.rfft(wn, axis=-1)
+        f = fftpack.rfftfreq(s.shape[-1]) * Fs
         ff = s * one_over_f(f, F_KNEE, F_ALPHA)
-        x_t = fftpack.irfft(ff)
+        x_t = fftpack.irfft(ff, axis=-1)
 
-        return x_t
+        return x_t if num_channels is None else x_t.T
 
     #### Utility functions: spike generation #####
-    def _sampling_spikes(self, spikes: np.ndarray, count: int) -> np.ndarray:
+    def _sampling_spikes(
+        self, spikes: np.ndarray, count: int, offset: Union[int, np.ndarray] = 0
+    ) -> np.ndarray:
         """
         Down-sample events in a signal, by passing one in every ``N`` events
 
         Args:
             spikes (np.ndarray): Raster ``(T, N)`` of events
             count (int): Number of events to ignore before passing one event
+            offset (Union[int, np.ndarray]): Initial value of the event counter for each channel. Default: ``0``
 
         Returns: np.ndarray: Raster ``(T, N)`` of down-sampled events
         """
 
-        return (np.cumsum(spikes, axis=0) % count * spikes) == (count - 1)
+        return ((np.cumsum(spikes, axis=0) + offset) % count * spikes) == (count - 1)
 
     #### Utility functions: modelling the distortion #####
     def _MIC_evolve(
@@ -647,53 +685,85 @@ class AFESim(Module):
 
         ####  Add Noise #####
         if self.add_noise:
-            noise = self._generateNoise(
-                input.shape[0],
-                self.Fs,
-                self.VRMS_SQHZ_LNA,
-                self.F_KNEE_LNA,
-                self.F_ALPHA_LNA,
-            )
+            if self.streaming:
+                noise = self._stream_noise(
+                    0,
+                    input.shape[0],
+                    self.VRMS_SQHZ_LNA,
+                    self.F_KNEE_LNA,
+                    self.F_ALPHA_LNA,
+                    1,
+                )[:, 0]
+            else:
+                noise = self._generateNoise(
+                    input.shape[0],
+                    self.Fs,
+                    self.VRMS_SQHZ_LNA,
+                    self.F_KNEE_LNA,
+                    self.F_ALPHA_LNA,
+                )
             lna_out += noise
 
         #### filterbank processing ####
-        # - Expand lna_output dimensions and add offset
-        filter_in = np.tile(np.atleast_2d(lna_out).T, (1, self.size_out))
+        # - Add offset; the filter bank filters a single input channel for all filters
+        filter_in = np.atleast_2d(lna_out).T
 
         if self.add_offset:
-            filter_in += self.bpf_offset
+            filter_in = filter_in + self.bpf_offset[0]
 
         # - Perform the filtering
         filtered, _, _ = self._butter_filterbank(filter_in)
 
         # add noise
         if self.add_noise:
-            for i in range(self.size_out):
-                filtered[:, i] += self._generateNoise(
+            if self.streaming:
+                filtered += self._stream_noise(
+                    1,
+                    input.shape[0],
+                    self.VRMS_SQHZ_BPF,
+                    self.F_KNEE_BPF,
+                    self.F_ALPHA_BPF,
+                    self.size_out,
+                )
+            else:
+                filtered += self._generateNoise(
                     input.shape[0],
                     self.Fs,
                     self.VRMS_SQHZ_BPF,
                     self.F_KNEE_BPF,
                     self.F_ALPHA_BPF,
+                    num_channels=self.size_out,
                 )
 
         # - HP filt, additional noise, rectify
         # NOTE: HP filter should be essentially at the input where the AC coupling between microphone and LNA lies.
         # However, we can also do it at the output together with rectifier
-        rectified = np.zeros_like(filtered)
-        for i in range(self.size_out):
-            rectified[:, i] = abs(
-                signal.filtfilt(*self._HP_filt, filtered[:, i])
-                # rectified[:, i]
-                + self._generateNoise(
-                    input.shape[0],
-                    self.Fs,
-                    self.VRMS_SQHZ_FWR,
-                    self.F_KNEE_FWR,
-                    self.F_ALPHA_FWR,
-                )
+        if self.streaming:
+            # - Causal high-pass filter, keeping the filter state between calls
+            hp_out, self.hp_zi = signal.lfilter(
+                *self._HP_filt, filtered, axis=0, zi=self.hp_zi
+            )
+            fwr_noise = self._stream_noise(
+                2,
+                input.shape[0],
+                self.VRMS_SQHZ_FWR,
+                self.F_KNEE_FWR,
+                self.F_ALPHA_FWR,
+                self.size_out,
+            )
+        else:
+            hp_out = signal.filtfilt(*self._HP_filt, filtered, axis=0)
+            fwr_noise = self._generateNoise(
+                input.shape[0],
+                self.Fs,
+                self.VRMS_SQHZ_FWR,
+                self.F_KNEE_FWR,
+                self.F_ALPHA_FWR,
+                num_channels=self.size_out,
             )
 
+        rectified = np.abs(hp_out + fwr_noise)
+
         # Encoding to spike by integrating the FWR output for positive going(UP)
         spikes, new_state = _encode_spikes(
             initial_state=self.lif_state,
@@ -710,7 +780,15 @@ class AFESim(Module):
         self.lif_state = new_state
 
         if self.DIGITAL_COUNTER > 1:
-            spikes = self._sampling_spikes(spikes, self.DIGITAL_COUNTER)
+            if self.streaming:
+                # - Carry the digital counter between calls
+                counter = self.counter_state
+                self.counter_state = (counter + np.sum(spikes, axis=0)) % int(
+                    self.DIGITAL_COUNTER
+                )
+                spikes = self._sampling_spikes(spikes, self.DIGITAL_COUNTER, counter)
+            else:
+                spikes = self._sampling_spikes(spikes, self.DIGITAL_COUNTER)
 
         recording = (
             {
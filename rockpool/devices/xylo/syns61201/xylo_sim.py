@@ -5,7 +5,11 @@ XyloSim-backed module compatible with Xylo core v2. Requires XyloSim package.
 # - Rockpool imports
 from rockpool import TSContinuous, TSEvent
 
-from rockpool.devices.xylo.syns61300.xylo_sim import XyloSim as XyloSimV1
+from rockpool.devices.xylo.syns61300.xylo_sim import (
+    XyloSim as XyloSimV1,
+    _cached_synapse_lists,
+)
+from rockpool.devices.xylo.syns61300.xylo_sim_engine import XyloNumpyLayer
 
 from xylosim.v2 import XyloSynapse, XyloLayer
 
@@ -35,7 +39,11 @@ class XyloSim(XyloSimV1):
 
     @classmethod
     def from_config(
-        cls, config: XyloConfiguration, dt: float = 1e-3, output_mode: str = "Spike"
+        cls,
+        config: XyloConfiguration,
+        dt: float = 1e-3,
+        output_mode: str = "Spike",
+        engine: str = "xylosim",
     ) -> "XyloSim":
         """
         Create a XyloSim based layer to simulate the Xylo hardware, from a configuration
@@ -44,6 +52,7 @@ class XyloSim(XyloSimV1):
             config (XyloConfiguration): ``samna.xylo.XyloConfiguration`` object to specify all parameters. See samna documentation for details.
             dt (float, optional): Timestep for simulation. Defaults to 1e-3.
             output_mode (str, optional): readout mode. one of ["Isyn", "Vmem", "Spike"]. Defaults to "Spike".
+            engine (str, optional): Simulation engine to use. ``"xylosim"``: use the XyloSim back-end. ``"numpy"``: use the native numpy integer-exact engine, which supports batched evolution over inputs ``(B, T, Nin)``. Defaults to "xylosim".
 
         Returns:
             XyloSim: XyloSim object instance
@@ -53,6 +62,7 @@ class XyloSim(XyloSimV1):
         #     "from_config() not implemented for XyloSimV2 due to lacking samna support."
         # )
         cls.output_mode = output_mode
+        cls._check_engine(engine)
 
         # - Instantiate the class
         mod = cls(
@@ -62,47 +72,29 @@ class XyloSim(XyloSimV1):
             output_mode=cls.output_mode,
         )
 
+        # - Use the native numpy engine, if requested
+        if engine == "numpy":
+            mod._xylo_layer = XyloNumpyLayer.from_config(config, version="v2")
+            return mod
+
         # - Make a storage object for the extracted configuration
         class _(object):
             pass
 
         _xylo_sim_params = _()
 
-        # - Convert input weights to XyloSynapse objects
-        _xylo_sim_params.synapses_in = []
-        for pre, w_pre in enumerate(config.input.weights):
-            tmp = []
-            for post in np.where(w_pre)[0]:
-                tmp.append(XyloSynapse(post, 0, w_pre[post]))
-
-            if config.synapse2_enable:
-                w2_pre = config.input.syn2_weights[pre]
-                for post in np.where(w2_pre)[0]:
-                    tmp.append(XyloSynapse(post, 1, w2_pre[post]))
-
-            _xylo_sim_params.synapses_in.append(tmp)
-
-        # - Convert recurrent weights to XyloSynapse objects
-        _xylo_sim_params.synapses_rec = []
-        for pre, w_pre in enumerate(config.reservoir.weights):
-            tmp = []
-            for post in np.where(w_pre)[0]:
-                tmp.append(XyloSynapse(post, 0, w_pre[post]))
-
-            if config.synapse2_enable:
-                w2_pre = config.reservoir.syn2_weights[pre]
-                for post in np.where(w2_pre)[0]:
-                    tmp.append(XyloSynapse(post, 1, w2_pre[post]))
-
-            _xylo_sim_params.synapses_rec.append(tmp)
-
-        # - Convert output weights to XyloSynapse objects
-        _xylo_sim_params.synapses_out = []
-        for pre, w_pre in enumerate(config.readout.weights):
-            tmp = []
-            for post in np.where(w_pre)[0]:
-                tmp.append(XyloSynapse(post, 0, w_pre[post]))
-            _xylo_sim_params.synapses_out.append(tmp)
+        # - Convert weights to XyloSynapse objects
+        syn2 = config.synapse2_enable
+        (
+            _xylo_sim_params.synapses_in,
+            _xylo_sim_params.synapses_rec,
+            _xylo_sim_params.synapses_out,
+        ) = _cached_synapse_lists(
+            XyloSynapse,
+            [config.input.weights, config.input.syn2_weights if syn2 else None],
+            [config.reservoir.weights, config.reservoir.syn2_weights if syn2 else None],
+            [config.readout.weights],
+        )
 
         # - Configure reservoir neurons
         _xylo_sim_params.threshold = []
@@ -188,6 +180,7 @@ class XyloSim(XyloSimV1):
         dt: float = 1e-3,
         verify_config: bool = True,
         output_mode: str = "Spike",
+        engine: str = "xylosim",
     ) -> "XyloSim":
         """
         Instantiate a :py:class:`.XyloSim` module from a full set of parameters
@@ -211,6 +204,8 @@ class XyloSim(XyloSimV1):
             aliases (Optional[list]):
             dt (float): Simulation time step in seconds. Default: 1 ms
             verify_config (bool): Check for a valid configuraiton before applying it. Default ``True``.
+            output_mode (str): Readout mode. One of ``["Isyn", "Vmem", "Spike"]``. Default: ``"Spike"``
+            engine (str): Simulation engine to use. ``"xylosim"``: use the XyloSim back-end. ``"numpy"``: use the native numpy integer-exact engine, which supports batched evolution over inputs ``(B, T, Nin)``. Default: ``"xylosim"``
 
         Returns:
             :py:class:`.XyloSim`: A :py:class:`.Module` that emulates the Xylo hardware.
@@ -219,6 +214,7 @@ class XyloSim(XyloSimV1):
             ValueError: If ``verify_config`` is ``True`` and the configuration is not valid.
         """
         cls.output_mode = output_mode
+        cls._check_engine(engine)
 
         # - Extract network dimensions
         IN, IEN = weights_in.shape[0:2]
@@ -266,55 +262,55 @@ class XyloSim(XyloSimV1):
             create_key=cls.__create_key, config=None, dt=dt, output_mode=cls.output_mode
         )
 
+        # - Use the native numpy engine, if requested
+        if engine == "numpy":
+            mod._xylo_layer = XyloNumpyLayer(
+                weights_in=weights_in,
+                weights_rec=weights_rec,
+                weights_out=np.concatenate(
+                    (np.zeros((RSN - OEN, ON), int), weights_out)
+                ),
+                threshold=threshold,
+                threshold_out=threshold_out,
+                dash_mem=dash_mem,
+                dash_mem_out=dash_mem_out,
+                dash_syn=np.stack((dash_syn, dash_syn_2), axis=1),
+                dash_syn_out=dash_syn_out,
+                aliases=aliases,
+                weight_shift_inp=weight_shift_in,
+                weight_shift_rec=weight_shift_rec,
+                weight_shift_out=weight_shift_out,
+                bias=bias,
+                bias_out=bias_out,
+                has_bias=any([b != 0 for b in bias]) or any([b != 0 for b in bias_out]),
+                version="v2",
+            )
+            return mod
+
         # - Make a storage object for the extracted configuration
         class _(object):
             pass
 
         _xylo_sim_params = _()
 
-        # - Convert input weights to XyloSynapse objects
+        # - Convert weights to XyloSynapse objects
         if len(weights_in.shape) == 2:
             weights_in = np.expand_dims(weights_in, 2)
 
-        _xylo_sim_params.synapses_in = []
-        for pre, w_pre in enumerate(weights_in[:, :, 0]):
-            tmp = []
-            for post in np.where(w_pre)[0]:
-                tmp.append(XyloSynapse(post, 0, w_pre[post]))
-
-            if weights_in.shape[2] == 2:
-                w2_pre = weights_in[:, :, 1][pre]
-                for post in np.where(w2_pre)[0]:
-                    tmp.append(XyloSynapse(post, 1, w2_pre[post]))
-
-            _xylo_sim_params.synapses_in.append(tmp)
-
-        # - Convert recurrent weights to XyloSynapse objects
         if len(weights_rec.shape) == 2:
             weights_rec = np.expand_dims(weights_rec, 2)
 
-        _xylo_sim_params.synapses_rec = []
-        for pre, w_pre in enumerate(weights_rec[:, :, 0]):
-            tmp = []
-            for post in np.where(w_pre)[0]:
-                tmp.append(XyloSynapse(post, 0, w_pre[post]))
-
-            if weights_rec.shape[2] == 2:
-                w2_pre = weights_rec[:, :, 1][pre]
-                for post in np.where(w2_pre)[0]:
-                    tmp.append(XyloSynapse(post, 1, w2_pre[post]))
-
-            _xylo_sim_params.synapses_rec.append(tmp)
-
-        # - Convert output weights to XyloSynapse objects
-        _xylo_sim_params.synapses_out = [
-            [] for _ in range(RSN - OEN)
-        ]  # - Skip unconnected reservoir neurons
-        for pre, w_pre in enumerate(weights_out):
-            tmp = []
-            for post in np.where(w_pre)[0]:
-                tmp.append(XyloSynapse(post, 0, w_pre[post]))
-            _xylo_sim_params.synapses_out.append(tmp)
+        (
+            _xylo_sim_params.synapses_in,
+            _xylo_sim_params.synapses_rec,
+            _xylo_sim_params.synapses_out,
+        ) = _cached_synapse_lists(
+            XyloSynapse,
+            [weights_in[:, :, syn] for syn in range(weights_in.shape[2])],
+            [weights_rec[:, :, syn] for syn in range(weights_rec.shape[2])],
+            # - Skip unconnected reservoir neurons
+            [np.concatenate((np.zeros((RSN - OEN, ON), int), weights_out))],
+        )
 
         # - Configure reservoir neurons
         _xylo_sim_params.threshold = threshold
@@ -370,7 +366,12 @@ class XyloSim(XyloSimV1):
         *args,
         **kwargs,
     ):
+        # - Evolve using the numpy engine, if used
+        if isinstance(self._xylo_layer, XyloNumpyLayer):
+            return self._evolve_numpy(input_raster, record)
+
         # - Evolve using the xylo layer
+        input_raster = self._check_unbatched(input_raster)
         spike_out = np.array(self._xylo_layer.evolve(input_raster.astype(int).tolist()))
         if self.output_mode == "Spike":
             output = spike_out
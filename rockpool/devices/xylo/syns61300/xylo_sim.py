@@ -10,17 +10,115 @@ from rockpool.utilities.backend_management import backend_available
 
 from xylosim.v1 import XyloLayer
 
+from .xylo_sim_engine import XyloNumpyLayer
+
 # - Numpy
 import numpy as np
 
+# - Hashing and caching
+import hashlib
+from collections import OrderedDict
+
 # - Typing
-from typing import Optional, Union, Any, Dict
+from typing import Optional, Union, Any, Dict, List, Tuple
 
 XyloConfiguration = Union[Dict, Any]
 
 # - Define exports
 __all__ = ["XyloSim"]
 
+# - Cache of synapse lists, keyed by a hash of the weight matrices
+_synapse_cache: "OrderedDict[Tuple, Tuple[List, List, List]]" = OrderedDict()
+_SYNAPSE_CACHE_SIZE = 8
+
+
+def _synapse_lists(
+    synapse_cls: type, weights: List[Optional[np.ndarray]]
+) -> List[List[Any]]:
+    """
+    Build lists of synapse objects for each pre-synaptic neuron, from dense weight matrices
+
+    Non-zero weights are extracted in bulk in COO format, and grouped by pre-synaptic neuron with CSR row pointers. For each pre-synaptic neuron, synapses are ordered by synapse ID then by post-synaptic neuron, matching the order of the XyloSim back-end.
+
+    Args:
+        synapse_cls (type): The ``XyloSynapse`` class to instantiate, with signature ``synapse_cls(target_neuron_id, target_synapse_id, weight)``
+        weights (List[Optional[np.ndarray]]): A list of weight matrices ``(Npre, Npost)``, one per synapse ID. ``None`` entries are skipped.
+
+    Returns:
+        List[List[XyloSynapse]]: For each pre-synaptic neuron, the list of output synapses
+    """
+    num_pre = np.shape(weights[0])[0]
+    per_syn = []
+    for syn_id, w in enumerate(weights):
+        if w is None:
+            continue
+
+        # - COO extraction of non-zero weights, in row-major order
+        w = np.asarray(w)
+        pre, post = np.nonzero(w)
+        synapses = [
+            synapse_cls(p, syn_id, v)
+            for p, v in zip(post.tolist(), w[pre, post].tolist())
+        ]
+
+        # - CSR row pointers for each pre-synaptic neuron
+        indptr = np.searchsorted(pre, np.arange(num_pre + 1)).tolist()
+        per_syn.append((synapses, indptr))
+
+    # - Concatenate synapses for each pre-synaptic neuron, over synapse IDs
+    lists = [[] for _ in range(num_pre)]
+    for synapses, indptr in per_syn:
+        for n in range(num_pre):
+            lists[n] += synapses[indptr[n] : indptr[n + 1]]
+
+    return lists
+
+
+def _cached_synapse_lists(
+    synapse_cls: type,
+    weights_in: List[Optional[np.ndarray]],
+    weights_rec: List[Optional[np.ndarray]],
+    weights_out: List[Optional[np.ndarray]],
+) -> Tuple[List, List, List]:
+    """
+    Build input, recurrent and output synapse lists, reusing previously built lists for identical weights
+
+    Args:
+        synapse_cls (type): The ``XyloSynapse`` class to instantiate
+        weights_in (List[Optional[np.ndarray]]): Input weight matrices ``(Nin, Nhidden)``, one per synapse ID
+        weights_rec (List[Optional[np.ndarray]]): Recurrent weight matrices ``(Nhidden, Nhidden)``, one per synapse ID
+        weights_out (List[Optional[np.ndarray]]): Output weight matrices ``(Nhidden, Nout)``, one per synapse ID
+
+    Returns:
+        (List, List, List): ``(synapses_in, synapses_rec, synapses_out)``
+    """
+    # - Hash the weight matrices
+    h = hashlib.sha1()
+    for w in weights_in + [0] + weights_rec + [0] + weights_out:
+        w = np.asarray(w if w is not None else [], dtype=np.int64)
+        h.update(str(w.shape).encode())
+        h.update(w.tobytes())
+    key = (synapse_cls, h.hexdigest())
+
+    # - Return cached synapse lists, if available
+    if key in _synapse_cache:
+        _synapse_cache.move_to_end(key)
+        return _synapse_cache[key]
+
+    # - Build synapse lists in bulk
+    synapses = (
+        _synapse_lists(synapse_cls, weights_in),
+        _synapse_lists(synapse_cls, weights_rec),
+        _synapse_lists(synapse_cls, weights_out),
+    )
+
+    # - Store in cache, evicting the least-recently used entry
+    _synapse_cache[key] = synapses
+    if len(_synapse_cache) > _SYNAPSE_CACHE_SIZE:
+        _synapse_cache.popitem(last=False)
+
+    return synapses
+
 
 class XyloSim(Module):
     """
@@ -81,8 +179,8 @@ class XyloSim(Module):
         """ (float) Simulation time-step for this module """
 
         # - Empty attribute for the Xylo layer
-        self._xylo_layer: Optional[XyloLayer] = None
-        """ (XyloLayer) Handle to a XyloSim object """
+        self._xylo_layer: Optional[Union[XyloLayer, XyloNumpyLayer]] = None
+        """ (XyloLayer) Handle to a XyloSim object, or to a native numpy simulation engine """
 
         # - Readout mode
         assert output_mode in [
@@ -94,7 +192,11 @@ class XyloSim(Module):
 
     @classmethod
     def from_config(
-        cls, config: XyloConfiguration, dt: float = 1e-3, output_mode: str = "Spike"
+        cls,
+        config: XyloConfiguration,
+        dt: float = 1e-3,
+        output_mode: str = "Spike",
+        engine: str = "xylosim",
     ):
         """
         Creata a XyloSim based layer to simulate the Xylo hardware, from a configuration
@@ -104,9 +206,12 @@ class XyloSim(Module):
             Timestep for simulation, in seconds. Default: 1ms
         config: XyloConfiguration
             ``samna.xylo.XyloConfiguration`` object to specify all parameters. See samna documentation for details.
+        engine: str
+            Simulation engine to use. ``"xylosim"``: use the XyloSim back-end. ``"numpy"``: use the native numpy integer-exact engine, which supports batched evolution over inputs ``(B, T, Nin)``. Default: ``"xylosim"``
 
         """
         cls.output_mode = output_mode
+        cls._check_engine(engine)
 
         # - Import XyloSim
         from xylosim.v1 import XyloSynapse, XyloLayer
@@ -120,47 +225,29 @@ class XyloSim(Module):
             output_mode=cls.output_mode,
         )
 
+        # - Use the native numpy engine, if requested
+        if engine == "numpy":
+            mod._xylo_layer = XyloNumpyLayer.from_config(config, version="v1")
+            return mod
+
         # - Make a storage object for the extracted configuration
         class _(object):
             pass
 
         _xylo_sim_params = _()
 
-        # - Convert input weights to XyloSynapse objects
-        _xylo_sim_params.synapses_in = []
-        for pre, w_pre in enumerate(config.input.weights):
-            tmp = []
-            for post in np.where(w_pre)[0]:
-                tmp.append(XyloSynapse(post, 0, w_pre[post]))
-
-            if config.synapse2_enable:
-                w2_pre = config.input.syn2_weights[pre]
-                for post in np.where(w2_pre)[0]:
-                    tmp.append(XyloSynapse(post, 1, w2_pre[post]))
-
-            _xylo_sim_params.synapses_in.append(tmp)
-
-        # - Convert recurrent weights to XyloSynapse objects
-        _xylo_sim_params.synapses_rec = []
-        for pre, w_pre in enumerate(config.reservoir.weights):
-            tmp = []
-            for post in np.where(w_pre)[0]:
-                tmp.append(XyloSynapse(post, 0, w_pre[post]))
-
-            if config.synapse2_enable:
-                w2_pre = config.reservoir.syn2_weights[pre]
-                for post in np.where(w2_pre)[0]:
-                    tmp.append(XyloSynapse(post, 1, w2_pre[post]))
-
-            _xylo_sim_params.synapses_rec.append(tmp)
-
-        # - Convert output weights to XyloSynapse objects
-        _xylo_sim_params.synapses_out = []
-        for pre, w_pre in enumerate(config.readout.weights):
-            tmp = []
-            for post in np.where(w_pre)[0]:
-                tmp.append(XyloSynapse(post, 0, w_pre[post]))
-            _xylo_sim_params.synapses_out.append(tmp)
+        # - Convert weights to XyloSynapse objects
+        syn2 = config.synapse2_enable
+        (
+            _xylo_sim_params.synapses_in,
+            _xylo_sim_params.synapses_rec,
+            _xylo_sim_params.synapses_out,
+        ) = _cached_synapse_lists(
+            XyloSynapse,
+            [config.input.weights, config.input.syn2_weights if syn2 else None],
+            [config.reservoir.weights, config.reservoir.syn2_weights if syn2 else None],
+            [config.readout.weights],
+        )
 
         # - Configure reservoir neurons
         _xylo_sim_params.threshold = []
@@ -233,6 +320,7 @@ class XyloSim(Module):
         dt: float = 1e-3,
         verify_config: bool = True,
         output_mode: str = "Spike",
+        engine: str = "xylosim",
     ) -> "XyloSim":
         """
         Instantiate a :py:class:`.XyloSim` module from a full set of parameters
@@ -254,6 +342,8 @@ class XyloSim(Module):
             aliases (Optional[list]):
             dt (float): Simulation time step in seconds. Default: 1 ms
             verify_config (bool): Check for a valid configuraiton before applying it. Default ``True``.
+            output_mode (str): Readout mode. One of ``["Isyn", "Vmem", "Spike"]``. Default: ``"Spike"``
+            engine (str): Simulation engine to use. ``"xylosim"``: use the XyloSim back-end. ``"numpy"``: use the native numpy integer-exact engine, which supports batched evolution over inputs ``(B, T, Nin)``. Default: ``"xylosim"``
 
         Returns:
             :py:class:`.XyloSim`: A :py:class:`.Module` that emulates the Xylo hardware.
@@ -291,7 +381,59 @@ class XyloSim(Module):
             raise ValueError("Xylo configuration is not valid: " + status)
 
         # - Instantiate module from config
-        return cls.from_config(config, dt=dt, output_mode=cls.output_mode)
+        return cls.from_config(
+            config, dt=dt, output_mode=cls.output_mode, engine=engine
+        )
+
+    @staticmethod
+    def _check_engine(engine: str):
+        if engine not in ["xylosim", "numpy"]:
+            raise ValueError(
+                f"`engine` must be one of ['xylosim', 'numpy'], got {engine}."
+            )
+
+    def _evolve_numpy(self, input_raster: np.ndarray, record: bool = False):
+        """
+        Evolve the native numpy engine over a single ``(T, Nin)`` or batched ``(B, T, Nin)`` input raster
+        """
+        input_raster = np.asarray(input_raster)
+        is_batched = input_raster.ndim == 3
+        if not is_batched:
+            input_raster = input_raster[None, :, :]
+
+        # - Evolve all batches in lock-step
+        spikes_out, recording = self._xylo_layer.evolve(input_raster, record=record)
+
+        if self.output_mode == "Spike":
+            output = spikes_out
+        elif self.output_mode == "Vmem":
+            output = recording["Vmem_out"]
+        elif self.output_mode == "Isyn":
+            output = recording["Isyn_out"]
+
+        if not record:
+            recording = {}
+
+        # - Remove the batch dimension for unbatched input
+        if not is_batched:
+            output = output[0]
+            recording = {k: v[0] for k, v in recording.items()}
+
+        return output, {}, recording
+
+    def _check_unbatched(self, input_raster: np.ndarray) -> np.ndarray:
+        """
+        Ensure that the input to the XyloSim back-end is a single raster ``(T, Nin)``
+        """
+        input_raster = np.asarray(input_raster)
+        if input_raster.ndim == 3:
+            if input_raster.shape[0] > 1:
+                raise ValueError(
+                    "The XyloSim back-end does not support batched input. Use `engine = 'numpy'` when creating the module to evolve batches."
+                )
+            input_raster = input_raster[0]
+
+        return input_raster
 
     def evolve(
         self,
@@ -300,7 +442,12 @@ class XyloSim(Module):
         *args,
         **kwargs,
     ):
+        # - Evolve using the numpy engine, if used
+        if isinstance(self._xylo_layer, XyloNumpyLayer):
+            return self._evolve_numpy(input_raster, record)
+
         # - Evolve using the xylo layer
+        input_raster = self._check_unbatched(input_raster)
         spikes_out = np.array(self._xylo_layer.evolve(input_raster))
         if self.output_mode == "Spike":
             output = spikes_out
@@ -0,0 +1,491 @@
+"""
+Native numpy, integer-exact simulation engine for Xylo v1 and v2 cores
+
+This engine reproduces the integer dynamics of the ``xylosim`` ``XyloLayer`` back-end, but evolves a batch of input rasters ``(B, T, Nin)`` in lock-step using vectorised numpy operations.
+"""
+
+import numpy as np
+
+from typing import Optional, List, Tuple, Dict, Any
+
+__all__ = ["XyloNumpyLayer"]
+
+# - Hardware constants, matching the XyloSim back-end
+BITS_STATE = 16
+MAX_STATE = 2 ** (BITS_STATE - 1) - 1
+MIN_STATE = -(2 ** (BITS_STATE - 1))
+MAX_NUM_INP_SPIKES = 15
+MAX_NUM_SPIKES = 31
+MAX_NUM_OUT_SPIKES = 1
+
+
+def _wrap16(x: np.ndarray) -> np.ndarray:
+    """Wrap integer values to the signed 16-bit range, emulating a cast to ``int16_t``"""
+    return ((x - MIN_STATE) & 0xFFFF) + MIN_STATE
+
+
+def _clip16(x: np.ndarray) -> np.ndarray:
+    """Saturate integer values to the signed 16-bit range, emulating ``safe_add``"""
+    return np.clip(x, MIN_STATE, MAX_STATE)
+
+
+def _decay(v: np.ndarray, dash: np.ndarray) -> np.ndarray:
+    """
+    Bitshift decay of a state, with a minimum decay of one unit in the direction of zero
+
+    Args:
+        v (np.ndarray): Integer state to decay
+        dash (np.ndarray): Integer bitshift decay parameter, broadcastable to ``v``
+
+    Returns:
+        np.ndarray: The change ``dv`` to subtract from ``v``
+    """
+    dv = np.right_shift(v, dash)
+    return np.where(dv == 0, np.sign(v), dv)
+
+
+def _spike(
+    v: np.ndarray, threshold: np.ndarray, num_spikes: np.ndarray, max_spikes: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate multiple spikes per time-step, subtracting the threshold for each spike
+
+    Args:
+        v (np.ndarray): Integer membrane potentials ``(..., N)``
+        threshold (np.ndarray): Integer thresholds ``(N,)``
+        num_spikes (np.ndarray): Number of spikes already emitted by each neuron (e.g. from aliases) ``(..., N)``
+        max_spikes (int): Maximum number of spikes per neuron per time-step
+
+    Returns:
+        (np.ndarray, np.ndarray): ``(num_spikes, v)``, the updated spike counts and membrane potentials
+    """
+    threshold = np.broadcast_to(threshold, v.shape)
+    pos_th = threshold > 0
+    available = np.clip(max_spikes - num_spikes, 0, None)
+
+    # - Closed form for positive thresholds
+    k = np.where(
+        (v >= threshold) & pos_th,
+        np.minimum(v // np.where(pos_th, threshold, 1), available),
+        0,
+    )
+
+    # - Zero thresholds spike until the maximum is reached, without changing `v`
+    k = np.where((threshold == 0) & (v >= 0), available, k)
+    num_spikes = num_spikes + k
+    v = v - k * threshold
+
+    # - Negative thresholds: emulate the spike loop exactly, including wrap-around
+    neg_th = threshold < 0
+    if np.any(neg_th):
+        while True:
+            mask = neg_th & (v >= threshold) & (num_spikes < max_spikes)
+            if not np.any(mask):
+                break
+            num_spikes = num_spikes + mask
+            v = np.where(mask, _wrap16(v - threshold), v)
+
+    return num_spikes, v
+
+
+def _deliver(
+    state: np.ndarray,
+    spikes: List[np.ndarray],
+    weights: List[np.ndarray],
+) -> np.ndarray:
+    """
+    Deliver spike counts through weight matrices onto saturating synaptic states
+
+    Spikes are delivered in order of weight matrix, then pre-synaptic neuron index, with saturation applied after each contribution. This matches the delivery order of the XyloSim back-end. Where no intermediate sum can saturate, or where all contributions have the same sign, the result is computed with a single matrix product.
+
+    Args:
+        state (np.ndarray): Synaptic states ``(B, M)``
+        spikes (List[np.ndarray]): List of spike count arrays ``(B, Npre)``
+        weights (List[np.ndarray]): List of corresponding (shifted) weight matrices ``(Npre, M)``
+
+    Returns:
+        np.ndarray: The updated synaptic states ``(B, M)``
+    """
+    # - Positive and negative contributions, computed exactly in float64
+    pos = np.zeros(state.shape)
+    neg = np.zeros(state.shape)
+    for s, w in zip(spikes, weights):
+        if np.any(s):
+            s = s.astype(float)
+            pos += s @ np.clip(w, 0, None)
+            neg += s @ np.clip(w, None, 0)
+
+    pos = pos.astype(np.int64)
+    neg = neg.astype(np.int64)
+
+    # - Saturating sum, correct unless intermediate sums saturate with mixed signs
+    new_state = _clip16(state + pos + neg)
+
+    ambiguous = ((state + pos > MAX_STATE) & (neg < 0)) | (
+        (state + neg < MIN_STATE) & (pos > 0)
+    )
+    if np.any(ambiguous):
+        # - Replay the contributions in delivery order, for ambiguous synapses only
+        b_idx, m_idx = np.nonzero(ambiguous)
+        x = state[b_idx, m_idx]
+        for s, w in zip(spikes, weights):
+            s = s[b_idx]
+            w = w[:, m_idx]
+            for pre in range(w.shape[0]):
+                x = _clip16(x + s[:, pre] * w[pre])
+
+        new_state[b_idx, m_idx] = x
+
+    return new_state
+
+
+class XyloNumpyLayer:
+    """
+    Integer-exact numpy simulation of a Xylo v1 or v2 network, supporting batched evolution
+
+    The layer state consists of the reservoir membrane potentials and synaptic currents, the readout membrane potentials and synaptic currents, and the reservoir spike buffer to be delivered on the next time-step. The state is shared by all batches at the start of :py:meth:`.evolve`; after evolution the state of the first batch is retained.
+    """
+
+    def __init__(
+        self,
+        weights_in: np.ndarray,
+        weights_rec: np.ndarray,
+        weights_out: np.ndarray,
+        threshold: np.ndarray,
+        threshold_out: np.ndarray,
+        dash_mem: np.ndarray,
+        dash_mem_out: np.ndarray,
+        dash_syn: np.ndarray,
+        dash_syn_out: np.ndarray,
+        aliases: Optional[List[List[int]]] = None,
+        weight_shift_inp: int = 0,
+        weight_shift_rec: int = 0,
+        weight_shift_out: int = 0,
+        bias: Optional[np.ndarray] = None,
+        bias_out: Optional[np.ndarray] = None,
+        has_bias: bool = False,
+        version: str = "v1",
+    ):
+        """
+        Build a numpy Xylo simulation layer from dense network parameters
+
+        Args:
+            weights_in (np.ndarray): Integer input weights ``(Nin, Nhidden, Nsyn)``
+            weights_rec (np.ndarray): Integer recurrent weights ``(Nhidden, Nhidden, Nsyn)``
+            weights_out (np.ndarray): Integer readout weights ``(Nhidden, Nout)``
+            threshold (np.ndarray): Integer thresholds for the hidden neurons ``(Nhidden,)``
+            threshold_out (np.ndarray): Integer thresholds for the readout neurons ``(Nout,)``
+            dash_mem (np.ndarray): Membrane bitshift decays for the hidden neurons ``(Nhidden,)``
+            dash_mem_out (np.ndarray): Membrane bitshift decays for the readout neurons ``(Nout,)``
+            dash_syn (np.ndarray): Synaptic bitshift decays for the hidden neurons ``(Nhidden, Nsyn)``
+            dash_syn_out (np.ndarray): Synaptic bitshift decays for the readout neurons ``(Nout,)``
+            aliases (Optional[List[List[int]]]): For each hidden neuron, a list of hidden neurons that receive copies of its spikes. Default: no aliases
+            weight_shift_inp (int): Number of bits to left-shift the input weights. Default: ``0``
+            weight_shift_rec (int): Number of bits to left-shift the recurrent weights. Default: ``0``
+            weight_shift_out (int): Number of bits to left-shift the readout weights. Default: ``0``
+            bias (Optional[np.ndarray]): Integer biases for the hidden neurons ``(Nhidden,)``, used if ``has_bias`` is ``True``. Default: ``0``
+            bias_out (Optional[np.ndarray]): Integer biases for the readout neurons ``(Nout,)``, used if ``has_bias`` is ``True``. Default: ``0``
+            has_bias (bool): If ``True``, apply the biases to the membrane potentials. Only supported for ``version = "v2"``. Default: ``False``
+            version (str): The Xylo core dynamics to simulate; one of ``["v1", "v2"]``. Default: ``"v1"``
+        """
+        if version not in ["v1", "v2"]:
+            raise ValueError(f"`version` must be one of ['v1', 'v2'], got {version}.")
+
+        self.version = version
+
+        # - Ensure three-dimensional input and recurrent weights
+        weights_in = np.asarray(weights_in, dtype=np.int64)
+        weights_rec = np.asarray(weights_rec, dtype=np.int64)
+        if weights_in.ndim == 2:
+            weights_in = weights_in[:, :, None]
+        if weights_rec.ndim == 2:
+            weights_rec = weights_rec[:, :, None]
+
+        dash_syn = np.asarray(dash_syn, dtype=np.int64)
+        if dash_syn.ndim == 1:
+            dash_syn = dash_syn[:, None]
+
+        self.size_in = weights_in.shape[0]
+        self.size_hidden, self.num_syns = dash_syn.shape
+        self.size_out = np.shape(weights_out)[1]
+
+        def pad_syns(w: np.ndarray) -> np.ndarray:
+            padded = np.zeros(
+                (w.shape[0], self.size_hidden, self.num_syns), dtype=np.int64
+            )
+            padded[:, : w.shape[1], : w.shape[2]] = w
+            return padded
+
+        weights_in = pad_syns(weights_in)
+        weights_rec = pad_syns(weights_rec)
+
+        weights_out_full = np.zeros((self.size_hidden, self.size_out), dtype=np.int64)
+        weights_out_full[: np.shape(weights_out)[0]] = np.asarray(weights_out)
+
+        # - Apply weight bit-shifts, with the truncation to 16 bits of the hardware
+        self._w_in = _wrap16(np.left_shift(weights_in, int(weight_shift_inp))).reshape(
+            self.size_in, -1
+        )
+        self._w_rec = _wrap16(
+            np.left_shift(weights_rec, int(weight_shift_rec))
+        ).reshape(self.size_hidden, -1)
+        self._w_out = _wrap16(np.left_shift(weights_out_full, int(weight_shift_out)))
+
+        # - Neuron parameters
+        self._threshold = np.asarray(threshold, dtype=np.int64).reshape(-1)
+        self._threshold_out = np.asarray(threshold_out, dtype=np.int64).reshape(-1)
+        self._dash_mem = np.asarray(dash_mem, dtype=np.int64).reshape(-1)
+        self._dash_mem_out = np.asarray(dash_mem_out, dtype=np.int64).reshape(-1)
+        self._dash_syn = dash_syn
+        self._dash_syn_out = np.asarray(dash_syn_out, dtype=np.int64).reshape(-1, 1)
+
+        self.has_bias = bool(has_bias)
+        if self.has_bias and version == "v1":
+            raise ValueError("Biases are not supported by Xylo v1 cores.")
+
+        self._bias = (
+            np.zeros(self.size_hidden, np.int64)
+            if bias is None
+            else np.asarray(bias, dtype=np.int64).reshape(-1)
+        )
+        self._bias_out = (
+            np.zeros(self.size_out, np.int64)
+            if bias_out is None
+            else np.asarray(bias_out, dtype=np.int64).reshape(-1)
+        )
+
+        # - Aliases, as a map from source neuron to target neurons
+        aliases = [] if aliases is None else aliases
+        self._aliases = {
+            int(src): [int(t) for t in targets]
+            for src, targets in enumerate(aliases)
+            if len(targets) > 0
+        }
+        self._alias_targets = set(t for ts in self._aliases.values() for t in ts)
+        self._alias_neurons = sorted(set(self._aliases) | self._alias_targets)
+
+        self.reset_all()
+
+    @classmethod
+    def from_config(cls, config: Any, version: str = "v1") -> "XyloNumpyLayer":
+        """
+        Build a numpy Xylo simulation layer from a Xylo configuration object
+
+        Args:
+            config (XyloConfiguration): A ``samna`` Xylo configuration object
+            version (str): The Xylo core dynamics to simulate; one of ``["v1", "v2"]``. Default: ``"v1"``
+
+        Returns:
+            XyloNumpyLayer: The simulation layer
+        """
+        neurons = config.reservoir.neurons
+        neurons_out = config.readout.neurons
+
+        # - Collect dense weights, including the second synapse if enabled
+        weights_in = np.asarray(config.input.weights, dtype=np.int64)[:, :, None]
+        weights_rec = np.asarray(config.reservoir.weights, dtype=np.int64)[:, :, None]
+
+        if config.synapse2_enable:
+            weights_in = np.concatenate(
+                (
+                    weights_in,
+                    np.asarray(config.input.syn2_weights, dtype=np.int64)[:, :, None],
+                ),
+                axis=2,
+            )
+            weights_rec = np.concatenate(
+                (
+                    weights_rec,
+                    np.asarray(config.reservoir.syn2_weights, dtype=np.int64)[
+                        :, :, None
+                    ],
+                ),
+                axis=2,
+            )
+
+        has_bias = bool(getattr(config, "bias_enable", False))
+
+        return cls(
+            weights_in=weights_in,
+            weights_rec=weights_rec,
+            weights_out=np.asarray(config.readout.weights, dtype=np.int64),
+            threshold=[n.threshold for n in neurons],
+            threshold_out=[n.threshold for n in neurons_out],
+            dash_mem=[n.v_mem_decay for n in neurons],
+            dash_mem_out=[n.v_mem_decay for n in neurons_out],
+            dash_syn=[[n.i_syn_decay, n.i_syn2_decay] for n in neurons],
+            dash_syn_out=[n.i_syn_decay for n in neurons_out],
+            aliases=[[n.alias_target] if n.alias_target else [] for n in neurons],
+            weight_shift_inp=config.input.weight_bit_shift,
+            weight_shift_rec=config.reservoir.weight_bit_shift,
+            weight_shift_out=config.readout.weight_bit_shift,
+            bias=[n.v_mem_bias for n in neurons] if has_bias else None,
+            bias_out=[n.v_mem_bias for n in neurons_out] if has_bias else None,
+            has_bias=has_bias,
+            version=version,
+        )
+
+    def reset_all(self):
+        """Reset all neuron states and the spike buffer"""
+        self.v_mem = np.zeros(self.size_hidden, np.int64)
+        self.i_syn = np.zeros((self.size_hidden, self.num_syns), np.int64)
+        self.v_mem_out = np.zeros(self.size_out, np.int64)
+        self.i_syn_out = np.zeros((self.size_out, 1), np.int64)
+        self.recurrent_spikes = np.zeros(self.size_hidden, np.int64)
+
+    def _evolve_neurons(
+        self,
+        v_mem: np.ndarray,
+        i_syn: np.ndarray,
+        dash_mem: np.ndarray,
+        dash_syn: np.ndarray,
+        bias: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Decay the neuron states and integrate synaptic currents onto the membranes, before spiking"""
+        i_syn = i_syn - _decay(i_syn, dash_syn)
+        i_sum = i_syn.sum(-1)
+
+        if self.version == "v1":
+            v_mem = v_mem - _decay(v_mem, dash_mem)
+            v_mem = _clip16(v_mem + i_sum)
+        else:
+            dv_mem = _clip16(_wrap16(-_decay(v_mem, dash_mem)) + i_sum)
+            if self.has_bias:
+                dv_mem = _clip16(dv_mem + bias)
+            v_mem = _clip16(v_mem + dv_mem)
+
+        return v_mem, i_syn
+
+    def _spike_hidden(self, v_mem: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Generate hidden layer spikes, copying spikes to alias targets in neuron order"""
+        v_pre = v_mem
+        num_spikes, v_mem = _spike(
+            v_pre, self._threshold, np.zeros_like(v_pre), MAX_NUM_SPIKES
+        )
+
+        if not self._alias_neurons:
+            return num_spikes, v_mem
+
+        # - Replay the evolution of neurons involved in aliases, in order
+        buffer = np.zeros_like(num_spikes)
+        for n in self._alias_neurons:
+            if n in self._alias_targets:
+                buffer[:, n], v_mem[:, n] = _spike(
+                    v_pre[:, n], self._threshold[n], buffer[:, n], MAX_NUM_SPIKES
+                )
+            else:
+                buffer[:, n] = num_spikes[:, n]
+
+            for target in self._aliases.get(n, []):
+                buffer[:, target] = np.minimum(
+                    buffer[:, target] + buffer[:, n], MAX_NUM_SPIKES
+                )
+
+        num_spikes[:, self._alias_neurons] = buffer[:, self._alias_neurons]
+        return num_spikes, v_mem
+
+    def evolve(
+        self, input_raster: np.ndarray, record: bool = False
+    ) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Evolve the network over a batch of input rasters
+
+        Args:
+            input_raster (np.ndarray): Integer input spike counts ``(B, T, Nin)``
+            record (bool): If ``True``, return recordings of the internal states. Default: ``False``
+
+        Returns:
+            (np.ndarray, dict): ``(output_spikes, recording)``. ``output_spikes`` is an integer array ``(B, T, Nout)``. ``recording`` contains the arrays ``"Vmem"``, ``"Isyn"``, ``"Isyn2"``, ``"Spikes"`` ``(B, T, Nhidden)`` and ``"Vmem_out"``, ``"Isyn_out"`` ``(B, T, Nout)``.
+        """
+        input_raster = np.clip(np.asarray(input_raster, dtype=np.int64), 0, None)
+        batches, num_timesteps, _ = input_raster.shape
+        input_raster = np.minimum(input_raster, MAX_NUM_INP_SPIKES)
+
+        # - Broadcast the current state over batches
+        v_mem = np.tile(self.v_mem, (batches, 1))
+        i_syn = np.tile(self.i_syn.reshape(-1), (batches, 1))
+        v_mem_out = np.tile(self.v_mem_out, (batches, 1))
+        i_syn_out = np.tile(self.i_syn_out.reshape(-1), (batches, 1))
+        spikes = np.tile(self.recurrent_spikes, (batches, 1))
+
+        # - Allocate outputs and state records
+        out_spikes = np.zeros((batches, num_timesteps, self.size_out), np.int64)
+        v_mem_out_ts = np.zeros((batches, num_timesteps, self.size_out), np.int64)
+        i_syn_out_ts = np.zeros((batches, num_timesteps, self.size_out), np.int64)
+
+        if record:
+            v_mem_ts = np.zeros((batches, num_timesteps, self.size_hidden), np.int64)
+            i_syn_ts = np.zeros(
+                (batches, num_timesteps, self.size_hidden, self.num_syns), np.int64
+            )
+            spikes_ts = np.zeros((batches, num_timesteps, self.size_hidden), np.int64)
+
+        # - Loop over time, evolving all batches in lock-step
+        for t in range(num_timesteps):
+            # - Deliver input and recurrent spikes to hidden neurons
+            rec_spikes = np.minimum(spikes, MAX_NUM_SPIKES)
+            i_syn = _deliver(
+                i_syn, [input_raster[:, t], rec_spikes], [self._w_in, self._w_rec]
+            )
+
+            # - Deliver recurrent spikes to readout neurons
+            i_syn_out = _deliver(i_syn_out, [rec_spikes], [self._w_out])
+
+            # - Evolve hidden neurons
+            v_mem, i_syn3 = self._evolve_neurons(
+                v_mem,
+                i_syn.reshape(batches, self.size_hidden, self.num_syns),
+                self._dash_mem,
+                self._dash_syn,
+                self._bias,
+            )
+            i_syn = i_syn3.reshape(batches, -1)
+            spikes, v_mem = self._spike_hidden(v_mem)
+
+            # - Evolve readout neurons
+            v_mem_out, i_syn_out = self._evolve_neurons(
+                v_mem_out,
+                i_syn_out[:, :, None],
+                self._dash_mem_out,
+                self._dash_syn_out,
+                self._bias_out,
+            )
+            i_syn_out = i_syn_out[:, :, 0]
+            out_spikes[:, t], v_mem_out = _spike(
+                v_mem_out,
+                self._threshold_out,
+                np.zeros_like(v_mem_out),
+                MAX_NUM_OUT_SPIKES,
+            )
+
+            # - Record states
+            v_mem_out_ts[:, t] = v_mem_out
+            i_syn_out_ts[:, t] = i_syn_out
+
+            if record:
+                v_mem_ts[:, t] = v_mem
+                i_syn_ts[:, t] = i_syn3
+                spikes_ts[:, t] = spikes
+
+        # - Retain the state of the first batch
+        self.v_mem = v_mem[0]
+        self.i_syn = i_syn[0].reshape(self.size_hidden, self.num_syns)
+        self.v_mem_out = v_mem_out[0]
+        self.i_syn_out = i_syn_out[0].reshape(self.size_out, 1)
+        self.recurrent_spikes = spikes[0]
+
+        # - Build the recording dictionary
+        recording = {"Vmem_out": v_mem_out_ts, "Isyn_out": i_syn_out_ts}
+        if record:
+            recording.update(
+                {
+                    "Vmem": v_mem_ts,
+                    "Isyn": i_syn_ts[..., 0],
+                    "Isyn2": i_syn_ts[..., 1]
+                    if self.num_syns > 1
+                    else np.zeros_like(v_mem_ts),
+                    "Spikes": spikes_ts,
+                }
+            )
+
+        return out_spikes, recording
@@ -7,13 +7,14 @@ from rockpool.nn.modules.module import Module
 from rockpool.nn.modules.native.filter_bank import ButterFilter
 from rockpool.timeseries import TSEvent, TSContinuous
 from rockpool.parameters import Parameter, State, SimulationParameter, ParameterBase
+from ..afe_noise import StreamingNoiseMixin
 
 # - Other imports
 import numpy as np
 from scipy.signal import butter, lfilter
 from scipy import signal, fftpack
 
-from typing import Union, Tuple
+from typing import Union, Tuple, Optional
 
 P_int = Union[int, ParameterBase]
 P_float = Union[float, ParameterBase]
@@ -22,6 +23,7 @@ P_array = Union[np.array, ParameterBase]
 # - Define exports
 __all__ = ["AFESim"]
 
+
 # - Try to use Jax as speedup
 try:
     import jax
@@ -112,7 +114,7 @@ except:
         return np.array(data_up), cdc
 
 
-class AFESim(Module):
+class AFESim(StreamingNoiseMixin, Module):
     """
     A :py:class:`.Module` that simulates analog hardware for preprocessing audio
 
@@ -142,6 +144,7 @@ class AFESim(Module):
         add_noise: bool = True,
         seed: int = np.random.randint(2**32 - 1),
         num_workers: int = 1,
+        streaming: bool = False,
         *args,
         **kwargs,
     ):
@@ -173,6 +176,10 @@ class AFESim(Module):
             Enables / disables the simulated noise generated be the AFE. Default: ``True``, include noise
         seed: int
             The AFE is subject to mismatch, this can be seeded by providing an integer seed. Default: random seed. Provide ``None`` to prevent seeding.
+        num_workers: int
+            Number of cpu units used to speed up filter computation. Default: 1.
+        streaming: bool
+            If ``True``, simulate the AFE causally and keep all filter, noise and event-generation states between calls to :py:meth:`.evolve`, so that a signal can be processed in chunks of arbitrary size. Requires ``manual_scaling``. Default: ``False``, use zero-phase filtering over each input chunk.
         """
 
         # - Check shape argument
@@ -329,6 +336,16 @@ class AFESim(Module):
         )
         """ bool: Flag indicating that noise should be simulated during operation. Default `True` """
 
+        if streaming and (manual_scaling is None or manual_scaling <= 0.0):
+            raise ValueError(
+                "`streaming` requires `manual_scaling`, since automatic scaling depends on the full input signal."
+            )
+
+        self.streaming: Union[bool, ParameterBase] = SimulationParameter(
+            streaming, shape=()
+        )
+        """ bool: Flag indicating that the AFE is simulated causally, keeping state between calls to :py:meth:`.evolve`. Default `False` """
+
         # - Generate the sub-modules
         self.butter_filterbank = ButterFilter(
             frequency=self.fcs,
@@ -337,6 +354,7 @@ class AFESim(Module):
             order=self.ORDER_BPF,
             num_workers=num_workers,
             use_lowpass=False,
+            streaming=streaming,
         )
 
         # - High-pass filter parameters
@@ -350,6 +368,26 @@ class AFESim(Module):
         self._last_input = None
         """ (np.ndarray) The last chunk of input, to avoid artefacts at the beginning of an input chunk """
 
+        if self.streaming:
+            self._init_streaming_state()
+
+    def _init_streaming_state(self):
+        """
+        Register the states carried between calls to :py:meth:`.evolve` in streaming mode
+        """
+        self.hp_zi: Union[np.ndarray, State] = State(
+            shape=(len(self._HP_filt[1]) - 1, self.size_out), init_func=np.zeros
+        )
+        """ (np.ndarray) State of the causal high-pass filter, in ``lfilter`` format """
+
+        self.counter_state: Union[np.ndarray, State] = State(
+            shape=(self.size_out,), init_func=lambda s: np.zeros(s, int)
+        )
+        """ (np.ndarray) State of the digital counter used to down-sample events """
+
+        # - Noise sources
+        self._init_streaming_noise()
+
     def _butter_bandpass(
         self, lowcut: float, highcut: float, fs: float, order: int = 2
     ) -> Tuple[float, float]:
@@ -434,6 +472,8 @@ class AFESim(Module):
         VRMS_SQHZ: float = 1e-6,
         F_KNEE: float = 1e3,
         F_ALPHA: float = 1.4,
+        num_channels: Optional[int] = None,
+        rng: Optional[np.random.Generator] = None,
     ) -> np.ndarray:
         """
         Generate band-limited noise, for use in simulating the AFE architecture
@@ -444,8 +484,10 @@ class AFESim(Module):
             VRMS_SQHZ (float):
             F_KNEE (float):
             F_ALPHA (float):
+            num_channels (Optional[int]): If provided, generate independent noise for this many channels in a single batched FFT. Default: ``None``, generate a single channel
+            rng (Optional[np.random.Generator]): Random number generator to draw from. Default: ``None``, use the global ``numpy`` pRNG
 
-        Returns: np.ndarray: Generated noise with shape ``(T,)``
+        Returns: np.ndarray: Generated noise with shape ``(T,)``, or ``(T, num_channels)`` if ``num_channels`` is provided
         """
 
         def one_over_f(f: np.ndarray, knee: float, alpha: float) -> np.ndarray:
@@ -457,26 +499,31 @@ class AFESim(Module):
 
         W_NOISE_SIGMA = VRMS_SQHZ * np.sqrt(Fs / 2)  # Noise in the bandwidth 0 - Fs/2
 
-        wn = np.random.normal(0, W_NOISE_SIGMA, T)
-        s = fftpack.rfft(wn)
-        f = fftpack.rfftfreq(len(s)) * Fs
+        # - Generate noise for all channels along the last axis
+        shape = T if num_channels is None else (num_channels, T)
+        wn = (np.random if rng is None else rng).normal(0, W_NOISE_SIGMA, shape)
+        s = fftpack.rfft(wn, axis=-1)
+        f = fftpack.rfftfreq(s.shape[-1]) * Fs
         ff = s * one_over_f(f, F_KNEE, F_ALPHA)
-        x_t = fftpack.irfft(ff)
+        x_t = fftpack.irfft(ff, axis=-1)
 
-        return x_t
+        return x_t if num_channels is None else x_t.T
 
-    def _sampling_signal(self, spikes: np.ndarray, count: int) -> np.ndarray:
+    def _sampling_signal(
+        self, spikes: np.ndarray, count: int, offset: Union[int, np.ndarray] = 0
+    ) -> np.ndarray:
         """
         Down-sample events in a signal, by passing one in every ``N`` events
 
         Args:
             spikes (np.ndarray): Raster ``(T, N)`` of events
             count (int): Number of events to ignore before passing one event
+            offset (Union[int, np.ndarray]): Initial value of the event counter for each channel. Default: ``0``
 
         Returns: np.ndarray: Raster ``(T, N)`` of down-sampled events
         """
 
-        return (np.cumsum(spikes, axis=0) % count * spikes) == (count - 1)
+        return ((np.cumsum(spikes, axis=0) + offset) % count * spikes) == (count - 1)
 
         # sam_count = 1
         # sampled = []
@@ -512,15 +559,16 @@ class AFESim(Module):
         # - Make sure input is 1D (number of channels is already checked by _auto_batch)
         input = input[0, :, 0]
 
-        # - Set up the previous input chunk
-        if self._last_input is None:
-            self._last_input = np.zeros_like(input)
-
         # - Augment input data to avoid artefacts, and save for next time
+        # - In streaming mode all states are kept instead, so no augmentation is needed
         input_length = input.shape[0]
-        this_input = input
-        input = np.concatenate((self._last_input, input))
-        self._last_input = this_input
+        if not self.streaming:
+            if self._last_input is None:
+                self._last_input = np.zeros_like(input)
+
+            this_input = input
+            input = np.concatenate((self._last_input, input))
+            self._last_input = this_input
 
         input_offset = self.MAX_INPUT_OFFSET
         if self.manual_scaling > 0.0:
@@ -535,21 +583,35 @@ class AFESim(Module):
         lna_out = y_scaled * (1 + lna_distortion) * lna_gain_v + self.lna_offset
 
         #######  Add Noise ###############
-        noise = self._generateNoise(
-            input.shape[0],
-            self.Fs,
-            self.VRMS_SQHZ_LNA,
-            self.F_KNEE_LNA,
-            self.F_ALPHA_LNA,
-        )
+        if self.streaming:
+            noise = self._stream_noise(
+                0,
+                input.shape[0],
+                self.VRMS_SQHZ_LNA,
+                self.F_KNEE_LNA,
+                self.F_ALPHA_LNA,
+                1,
+            )[:, 0]
+        else:
+            noise = self._generateNoise(
+                input.shape[0],
+                self.Fs,
+                self.VRMS_SQHZ_LNA,
+                self.F_KNEE_LNA,
+                self.F_ALPHA_LNA,
+            )
 
         lna_out = lna_out + noise
 
-        # - Expand lna_output dimensions
-        lna_out = np.tile(np.atleast_2d(lna_out).T, (1, self.size_out))
+        # - Expand lna_output dimensions, without copying
+        lna_out = np.broadcast_to(
+            np.atleast_2d(lna_out).T, (lna_out.shape[0], self.size_out)
+        )
 
-        # - Perform the filtering
-        filtered, _, _ = self.butter_filterbank(lna_out + self.bpf_offset * 0.001)
+        # - Perform the filtering; the filter bank filters a single input channel for all filters
+        filtered, _, _ = self.butter_filterbank(
+            lna_out[:, :1] + self.bpf_offset[0] * 0.001
+        )
 
         # bpfs = [
         #     self._butter_bandpass_filter(
@@ -564,13 +626,23 @@ class AFESim(Module):
 
         # add noise
         if self.add_noise:
-            for i in range(self.size_out):
-                filtered[:, i] += self._generateNoise(
+            if self.streaming:
+                filtered += self._stream_noise(
+                    1,
+                    input.shape[0],
+                    self.VRMS_SQHZ_BPF,
+                    self.F_KNEE_BPF,
+                    self.F_ALPHA_BPF,
+                    self.size_out,
+                )
+            else:
+                filtered += self._generateNoise(
                     input.shape[0],
                     self.Fs,
                     self.VRMS_SQHZ_BPF,
                     self.F_KNEE_BPF,
                     self.F_ALPHA_BPF,
+                    num_channels=self.size_out,
                 )
 
         # bpfs = [
@@ -585,20 +657,32 @@ class AFESim(Module):
         # rectified = signal.filtfilt(*self._HP_filt, filtered)
 
         # - HP filt, additional noise, rectify
-        rectified = np.zeros_like(filtered)
-        for i in range(self.size_out):
-            rectified[:, i] = abs(
-                signal.filtfilt(*self._HP_filt, filtered[:, i])
-                # rectified[:, i]
-                + self._generateNoise(
-                    input.shape[0],
-                    self.Fs,
-                    self.VRMS_SQHZ_FWR,
-                    self.F_KNEE_FWR,
-                    self.F_ALPHA_FWR,
-                )
+        if self.streaming:
+            # - Causal high-pass filter, keeping the filter state between calls
+            hp_out, self.hp_zi = signal.lfilter(
+                *self._HP_filt, filtered, axis=0, zi=self.hp_zi
+            )
+            fwr_noise = self._stream_noise(
+                2,
+                input.shape[0],
+                self.VRMS_SQHZ_FWR,
+                self.F_KNEE_FWR,
+                self.F_ALPHA_FWR,
+                self.size_out,
+            )
+        else:
+            hp_out = signal.filtfilt(*self._HP_filt, filtered, axis=0)
+            fwr_noise = self._generateNoise(
+                input.shape[0],
+                self.Fs,
+                self.VRMS_SQHZ_FWR,
+                self.F_KNEE_FWR,
+                self.F_ALPHA_FWR,
+                num_channels=self.size_out,
             )
 
+        rectified = np.abs(hp_out + fwr_noise)
+
         # Encoding to spike by integrating the FWR output for positive going(UP)
         spikes, new_state = _encode_spikes(
             self.lif_state,
@@ -620,7 +704,15 @@ class AFESim(Module):
         # )
 
         if self.DIGITAL_COUNTER > 1:
-            spikes = self._sampling_signal(spikes, self.DIGITAL_COUNTER)
+            if self.streaming:
+                # - Carry the digital counter between calls
+                counter = self.counter_state
+                self.counter_state = (counter + np.sum(spikes, axis=0)) % int(
+                    self.DIGITAL_COUNTER
+                )
+                spikes = self._sampling_signal(spikes, self.DIGITAL_COUNTER, counter)
+            else:
+                spikes = self._sampling_signal(spikes, self.DIGITAL_COUNTER)
 
         # - Trim data to this chunk
         spikes = spikes[-input_length:, :]
@@ -130,12 +130,15 @@ class FFwdStackMixin(ABC):
             # - Push data through submodule
             input_data, substate, subrec = mod(input_data, record=record)
             new_state_dict.update({submod_name: substate})
-            record_dict.update(
-                {
-                    submod_name: subrec,
-                    f"{submod_name}_output": input_data,
-                }
-            )
+
+            # - Only keep intermediate outputs if recording
+            if record:
+                record_dict.update(
+                    {
+                        submod_name: subrec,
+                        f"{submod_name}_output": input_data,
+                    }
+                )
 
             # - Push data through weight
             if isinstance(input_data, tuple):
@@ -146,7 +149,8 @@ class FFwdStackMixin(ABC):
         mod = getattr(self, self._submodule_names[-1])
         input_data, substate, subrec = mod(input_data, record=record)
         new_state_dict.update({self._submodule_names[-1]: substate})
-        record_dict.update({self._submodule_names[-1]: subrec})
+        if record:
+            record_dict.update({self._submodule_names[-1]: subrec})
 
         # - Return output, state and record
         return input_data, new_state_dict, record_dict
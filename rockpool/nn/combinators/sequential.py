@@ -122,16 +122,31 @@ class SequentialMixin(ABC):
             # - Push data through submodule
             x, substate, subrec = mod(x, record=record)
             new_state_dict.update({submod_name: substate})
-            record_dict.update(
-                {
-                    submod_name: subrec,
-                    f"{submod_name}_output": copy(x),
-                }
-            )
+
+            # - Only keep intermediate outputs if recording
+            if record:
+                record_dict.update(
+                    {
+                        submod_name: subrec,
+                        f"{submod_name}_output": self._record_output(x),
+                    }
+                )
 
         # - Return output, state and record
         return x, new_state_dict, record_dict
 
+    def _record_output(self, output: Any) -> Any:
+        """
+        Prepare the output of a submodule to be stored in the record dictionary
+
+        Args:
+            output (Any): The output of a submodule
+
+        Returns:
+            Any: A copy of ``output``, which is not affected if the output is later modified in place
+        """
+        return copy(output)
+
     def __getitem__(self, item: Union[int, str]) -> Module:
         """
         Permit indexing into the sequence of modules
@@ -212,21 +227,9 @@ try:
         The :py:class:`.Sequential` combinator for Jax modules
         """
 
-        @classmethod
-        def tree_unflatten(cls, aux_data, children):
-            """Unflatten a tree of modules from Jax to Rockpool"""
-            params, sim_params, state, modules, init_params = children
-            _name, _shape, _submodulenames = aux_data
-            modules = tuple(modules.values())
-            obj = cls(*modules)
-            obj._name = _name
-
-            # - Restore configuration
-            obj = obj.set_attributes(params)
-            obj = obj.set_attributes(state)
-            obj = obj.set_attributes(sim_params)
-
-            return obj
+        def _record_output(self, output: Any) -> Any:
+            # - Jax arrays are immutable, so outputs are recorded without copying
+            return output
 
 except:
 
@@ -238,6 +241,10 @@ except:
         The :py:class:`.Sequential` combinator for Jax modules
         """
 
+        def _record_output(self, output: Any) -> Any:
+            # - Jax arrays are immutable, so outputs are recorded without copying
+            return output
+
         def __init__(self):
             raise ImportError(
                 "'Jax' and 'Jaxlib' backend not found. Modules relying on Jax will not be available."
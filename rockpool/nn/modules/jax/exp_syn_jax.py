@@ -44,6 +44,7 @@ class ExpSynJax(JaxModule):
         rng_key: Optional[rt.JaxRNGKey] = None,
         spiking_input: bool = True,
         spiking_output: bool = False,
+        checkpoint_every: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -55,6 +56,7 @@ class ExpSynJax(JaxModule):
             tau (Optional[np.ndarray]): Concrete initialisation data for the time constants of the synapses, in seconds. Default: 10 ms individual for all synapses.
             noise_std (float): The std. dev after 1s of noise added independently to each synapse
             dt (float): The timestep of this module, in seconds. Default: 1 ms.
+            checkpoint_every (Optional[int]): If provided, evolve in chunks of ``checkpoint_every`` time-steps, each wrapped in :py:func:`jax.checkpoint`, so that memory used for backpropagation scales with ``T / checkpoint_every + checkpoint_every`` instead of ``T``. Default: ``None``, do not checkpoint.
         """
         # - Call super-class initialisation
         super().__init__(
@@ -98,6 +100,11 @@ class ExpSynJax(JaxModule):
         )
         """ (torch.tensor) Synaptic current state for each synapse ``(1, N)`` """
 
+        self._checkpoint_every = self._check_checkpoint_every(checkpoint_every)
+
+        # - Define additional arguments required during initialisation
+        self._init_args = {"checkpoint_every": checkpoint_every}
+
     def evolve(
         self,
         input_data: np.array,
@@ -131,7 +138,7 @@ class ExpSynJax(JaxModule):
         # - Map over batches
         @jax.vmap
         def scan_time(isyn, input_data):
-            return scan(forward, isyn, input_data)
+            return self._scan(forward, isyn, input_data, self._checkpoint_every)
 
         # - Scan over the input
         isyn, output = scan_time(isyn, input_data + noise_ts)
@@ -18,6 +18,8 @@ class LIFODEJax(LIFJax):
 
     """
 
+    _supports_scan = False
+
     def evolve(
         self,
         input_data: np.ndarray,
@@ -27,7 +29,7 @@ class LIFODEJax(LIFJax):
 
         Args:
             input_data (np.ndarray): Input array of shape ``(T, Nin)`` to evolve over
-            record (bool): If ``True``,
+            record (bool): If ``True``, return the recorded synaptic, recurrent and membrane states over time. If ``False`` (default), only the output spikes are recorded over time.
 
         Returns:
             (np.ndarray, dict, dict): output, new_state, record_state
@@ -52,6 +54,7 @@ class LIFODEJax(LIFJax):
 
         # - Get evolution constants
         noise_zeta = self.noise_std * np.sqrt(self.dt)
+        has_rec = hasattr(self, "w_rec")
 
         # - Generate membrane noise trace
         key1, subkey = rand.split(self.rng_key)
@@ -63,27 +66,16 @@ class LIFODEJax(LIFJax):
         def forward(
             state: Tuple[np.ndarray, np.ndarray, np.ndarray],
             inputs_t: Tuple[np.ndarray, np.ndarray],
-        ) -> Tuple[
-            Tuple[np.ndarray, np.ndarray, np.ndarray],
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-        ]:
+        ) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], dict]:
             """
             Single-step LIF dynamics for a recurrent LIF layer
 
             :param LayerState state:
             :param Tuple[np.ndarray, np.ndarray] inputs_t: (spike_inputs_ts, current_inputs_ts)
 
-            :return: (state, Irec_ts, spikes_ts, Vmem_ts, Isyn_ts)
+            :return: (state, records)
                 state:          (Tuple[np.ndarray, np.ndarray, np.ndarray]) Layer state at end of evolution
-                Irec_ts:        (np.ndarray) Recurrent input received at each neuron over time [T, N]
-                spikes_ts:      (np.ndarray) Logical spiking raster for each neuron [T, N]
-                Vmem_ts:        (np.ndarray) Membrane voltage of each neuron over time [T, N]
-                Isyn_ts:        (np.ndarray) Synaptic input current received by each neuron over time [T, N]
+                records:        (dict) Spiking output of each neuron ``"spikes"`` [N]. If ``record`` is ``True``, also the membrane voltage ``"vmem"`` [N], synaptic current ``"isyn"`` [N, Nsyn] and, for recurrent layers, the recurrent input ``"irec"`` [N, Nsyn] of each neuron
             """
             # - Unpack inputs
             (sp_in_t, noise_in_t) = inputs_t
@@ -93,8 +85,11 @@ class LIFODEJax(LIFJax):
 
             # - Apply synaptic and recurrent input
             d_isyn = -isyn + sp_in_t
-            irec = np.dot(spikes, self.w_rec).reshape(self.size_out, self.n_synapses)
-            d_isyn = d_isyn + irec
+            if has_rec:
+                irec = np.dot(spikes, self.w_rec).reshape(
+                    self.size_out, self.n_synapses
+                )
+                d_isyn = d_isyn + irec
             isyn = isyn + d_isyn * self.dt / self.tau_syn
 
             # - Integrate membrane potentials
@@ -107,34 +102,50 @@ class LIFODEJax(LIFJax):
             # - Apply subtractive membrane reset
             vmem = vmem - spikes * self.threshold
 
-            # - Return state and outputs
-            return (spikes, isyn, vmem), (irec, spikes, vmem, isyn)
+            # - Return state and outputs, recording internal states only if requested
+            records = {"spikes": spikes}
+            if record:
+                records.update({"isyn": isyn, "vmem": vmem})
+                if has_rec:
+                    records["irec"] = irec
+
+            return (spikes, isyn, vmem), records
 
         # - Map over batches
         @jax.vmap
         def scan_time(spikes, isyn, vmem, input_data, noise_ts):
-            return scan(forward, (spikes, isyn, vmem), (input_data, noise_ts))
+            return self._scan(
+                forward,
+                (spikes, isyn, vmem),
+                (input_data, noise_ts),
+                self._checkpoint_every,
+            )
 
         # - Evolve over spiking inputs
-        state, (irec_ts, spikes_ts, vmem_ts, isyn_ts) = scan_time(
+        (spikes, isyn, vmem), records = scan_time(
             spikes, isyn, vmem, input_data, noise_ts
         )
 
         # - Generate return arguments
-        outputs = spikes_ts
+        outputs = records["spikes"]
         states = {
-            "spikes": spikes_ts[0, -1],
-            "isyn": isyn_ts[0, -1],
-            "vmem": vmem_ts[0, -1],
+            "spikes": spikes[0],
+            "isyn": isyn[0],
+            "vmem": vmem[0],
             "rng_key": key1,
         }
 
-        record_dict = {
-            "irec": irec_ts,
-            "spikes": spikes_ts,
-            "isyn": isyn_ts,
-            "vmem": vmem_ts,
-        }
+        record_dict = (
+            {
+                # - Feed-forward layers receive no recurrent input
+                "irec": records["irec"] if has_rec else np.zeros_like(records["isyn"]),
+                "spikes": records["spikes"],
+                "isyn": records["isyn"],
+                "vmem": records["vmem"],
+            }
+            if record
+            else {}
+        )
 
         # - Return outputs
         return outputs, states, record_dict
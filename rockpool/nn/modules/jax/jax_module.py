@@ -7,14 +7,18 @@ __all__ = ["JaxModule"]
 from rockpool.nn.modules.module import Module
 
 # - Jax imports
-from jax.tree_util import register_pytree_node
+import jax
+from jax.tree_util import register_pytree_node, tree_leaves, tree_map
+from jax.lax import scan
 import jax.numpy as np
+import numpy as onp
 
 # - Other imports
 from copy import deepcopy
+from functools import partial
 import operator as op
 from abc import ABC
-from typing import Optional, Tuple, Union
+from typing import Any, Callable, Optional, Tuple, Union
 from rockpool.typehints import Tree
 
 
@@ -63,6 +67,16 @@ class JaxModule(Module, ABC):
             )
             JaxModule._rockpool_pytree_registry.append(cls)
 
+    def __call__(self, input_data, *args, **kwargs):
+        # - A traced `record` flag cannot select which states to record, so record all states
+        if args and isinstance(args[0], jax.core.Tracer):
+            args = (True,) + args[1:]
+
+        if isinstance(kwargs.get("record", None), jax.core.Tracer):
+            kwargs["record"] = True
+
+        return super().__call__(input_data, *args, **kwargs)
+
     def _auto_batch(
         self,
         data: np.ndarray,
@@ -126,38 +140,165 @@ class JaxModule(Module, ABC):
         )
         return data, states
 
+    @staticmethod
+    def _check_checkpoint_every(checkpoint_every: Optional[int]) -> Optional[int]:
+        """
+        Validate the ``checkpoint_every`` argument of a module that evolves with :py:meth:`._scan`
+
+        Args:
+            checkpoint_every (Optional[int]): The number of time-steps per checkpointed chunk, or ``None`` to disable checkpointing
+
+        Returns:
+            Optional[int]: ``checkpoint_every``
+
+        Raises:
+            ValueError: If ``checkpoint_every`` is not ``None`` or a positive integer
+        """
+        if checkpoint_every is None:
+            return None
+
+        if (
+            isinstance(checkpoint_every, bool)
+            or not isinstance(checkpoint_every, (int, onp.integer))
+            or checkpoint_every < 1
+        ):
+            raise ValueError(
+                f"`checkpoint_every` must be `None` or a positive integer. Found {checkpoint_every!r}."
+            )
+
+        return int(checkpoint_every)
+
+    def _scan(
+        self,
+        forward: Callable[[Any, Any], Tuple[Any, Any]],
+        state: Tree,
+        inputs: Tree,
+        checkpoint_every: Optional[int] = None,
+    ) -> Tuple[Tree, Tree]:
+        """
+        Scan a single-step update function over time, with optional gradient checkpointing
+
+        Usage:
+            >>> state, outputs = self._scan(forward, state, inputs, self._checkpoint_every)
+
+            If ``checkpoint_every`` is ``None``, this is equivalent to ``jax.lax.scan(forward, state, inputs)``. Otherwise, time-steps are evolved in chunks of ``checkpoint_every`` steps, each wrapped in :py:func:`jax.checkpoint`. Only the state at the start of each chunk is stored for the backward pass, and the intermediate states of each chunk are recomputed during backpropagation. For ``T`` time-steps and chunks of ``K`` steps, memory used for backpropagation scales with ``T / K + K`` instead of ``T``.
+
+        Args:
+            forward (Callable): The single-step update function ``forward(state, inputs_t) -> (state, outputs_t)``
+            state (Tree): The initial state
+            inputs (Tree): The inputs to scan over, with a leading time dimension ``(T, ...)``
+            checkpoint_every (Optional[int]): The number of time-steps per checkpointed chunk. Default: ``None``, do not checkpoint
+
+        Returns:
+            (Tree, Tree) state, outputs
+            ``state`` is the final state. ``outputs`` contains the outputs of ``forward``, stacked over time ``(T, ...)``
+        """
+        num_timesteps = tree_leaves(inputs)[0].shape[0]
+        if checkpoint_every is None or num_timesteps == 0:
+            return scan(forward, state, inputs)
+
+        num_chunks, num_remaining = divmod(num_timesteps, checkpoint_every)
+
+        @partial(jax.checkpoint, prevent_cse=False)
+        def forward_chunk(state, inputs_chunk):
+            return scan(forward, state, inputs_chunk)
+
+        # - Evolve over whole chunks
+        chunked_outputs = []
+        if num_chunks > 0:
+            inputs_chunked = tree_map(
+                lambda x: x[: num_chunks * checkpoint_every].reshape(
+                    (num_chunks, checkpoint_every) + x.shape[1:]
+                ),
+                inputs,
+            )
+            state, outputs = scan(forward_chunk, state, inputs_chunked)
+            chunked_outputs.append(
+                tree_map(
+                    lambda y: y.reshape((num_chunks * checkpoint_every,) + y.shape[2:]),
+                    outputs,
+                )
+            )
+
+        # - Evolve over any remaining time-steps
+        if num_remaining > 0:
+            state, outputs = forward_chunk(
+                state, tree_map(lambda x: x[num_chunks * checkpoint_every :], inputs)
+            )
+            chunked_outputs.append(outputs)
+
+        return state, tree_map(lambda *y: np.concatenate(y), *chunked_outputs)
+
     def tree_flatten(self) -> Tuple[tuple, tuple]:
         """Flatten this module tree for Jax"""
+        # - Configuration flags and sizes are static, so that they are not traced by Jax
+        init_args = {
+            k: v
+            for k, v in self._init_args.items()
+            if not isinstance(v, (bool, int, str))
+        }
+        static_init_args = tuple(
+            (k, v)
+            for k, v in self._init_args.items()
+            if isinstance(v, (bool, int, str))
+        )
+
+        # - Record the module configuration, without any attribute data
+        __registered_attributes, __modules = self._get_attribute_registry()
+        template = _ModuleTemplate(
+            {
+                k: v
+                for k, v in self.__dict__.items()
+                if k not in __registered_attributes
+                and k not in __modules
+                and k not in _ModuleTemplate.restored_keys
+            },
+            {k: tuple(v[1:]) for k, v in __registered_attributes.items()},
+        )
+
         return (
             (
                 self.parameters(),
                 self.simulation_parameters(),
                 self.state(),
                 self.modules(),
-                self._init_args,
+                init_args,
             ),
-            (self._name, self._shape, self._submodulenames),
+            (self._name, self._shape, self._submodulenames, static_init_args, template),
         )
 
     @classmethod
     def tree_unflatten(cls, aux_data, children):
         """Unflatten a tree of modules from Jax to Rockpool"""
         params, sim_params, state, modules, init_args = children
-        _name, _shape, _submodulenames = aux_data
-        obj = cls(shape=_shape, **init_args)
-        obj._name = _name
+        _name, _shape, _submodulenames, static_init_args, template = aux_data
+
+        # - Build the module without calling `__init__()`, so that no attributes are re-initialised
+        obj = cls.__new__(cls)
+        obj.__dict__.update(template.attributes)
+        obj.__dict__.update(
+            _in_Module_init=False,
+            _force_set_attributes=False,
+            _name=_name,
+            _shape=_shape,
+            _submodulenames=list(_submodulenames),
+            _init_args={**init_args, **dict(static_init_args)},
+            _ModuleBase__registered_attributes={
+                k: [None, *v] for k, v in template.registry.items()
+            },
+            _ModuleBase__modules={},
+        )
 
-        # - Assign modules if necessary
+        # - Assign modules
+        __registered_attributes, __modules = obj._get_attribute_registry()
         for name, mod in modules.items():
-            if not hasattr(obj, name):
-                setattr(obj, name, mod)
+            __modules[name] = [mod, type(mod).__name__]
+            obj.__dict__[name] = mod
 
         # - Restore configuration
-        obj._force_set_attributes = True
-        obj = obj.set_attributes(params)
-        obj = obj.set_attributes(state)
-        obj = obj.set_attributes(sim_params)
-        obj._force_set_attributes = False
+        _restore_attributes(obj, params)
+        _restore_attributes(obj, state)
+        _restore_attributes(obj, sim_params)
 
         return obj
 
@@ -252,3 +393,86 @@ class JaxModule(Module, ABC):
         Module.reset_parameters(self)
         Module.reset_parameters(mod)
         return mod
+
+
+class _ModuleTemplate:
+    """
+    The configuration of a :py:class:`.JaxModule`, stored in the Jax tree definition
+
+    Contains the non-registered attributes of the module, and the attribute registry without attribute data. Templates compare equal if they contain equal configuration values, such that modules with different configurations do not share compiled functions. Values that cannot be hashed, such as arrays, are compared by identity. Initialisation functions in the registry are not compared, so that separately constructed modules with the same configuration share compiled functions.
+    """
+
+    __slots__ = ("attributes", "registry", "_key")
+
+    restored_keys = frozenset(
+        {
+            "_ModuleBase__registered_attributes",
+            "_ModuleBase__modules",
+            "_name",
+            "_shape",
+            "_submodulenames",
+            "_init_args",
+        }
+    )
+    """Attributes that are restored from the tree, and not stored in the template"""
+
+    def __init__(self, attributes: dict, registry: dict):
+        self.attributes = attributes
+        self.registry = registry
+
+        # - Hashable summary of the configuration, used for comparison
+        self._key = (
+            tuple((k, _config_key(v)) for k, v in attributes.items()),
+            tuple(
+                (k, attr_type, family, shape)
+                for k, (attr_type, family, _, shape) in registry.items()
+            ),
+        )
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, _ModuleTemplate) and self._key == other._key
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+
+def _config_key(value: Any) -> Any:
+    """
+    Return a hashable key for a configuration value
+
+    Hashable values are keyed by type and value, so that for example ``True`` and ``1`` differ. Other values are keyed by identity. The template holding the value keeps it alive, so its identity is not reused while the key is in use.
+
+    Args:
+        value (Any): The configuration value
+
+    Returns:
+        Any: A hashable key, which compares equal for equal configuration values
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return ("id", id(value))
+
+    return (type(value), value)
+
+
+def _restore_attributes(mod: JaxModule, attributes: Tree) -> None:
+    """
+    Assign a tree of attributes to a module and its submodules in place, without copying or validation
+
+    Used when unflattening a module. Attribute values may be arbitrary leaves provided by Jax, such as tracers.
+
+    Args:
+        mod (JaxModule): The module to assign attributes to
+        attributes (Tree): The tree of attributes to assign
+    """
+    __registered_attributes, __modules = mod._get_attribute_registry()
+
+    for k, v in attributes.items():
+        if k in __modules:
+            _restore_attributes(__modules[k][0], v)
+        else:
+            __registered_attributes[k][0] = v
+            if v is not None:
+                __registered_attributes[k][4] = onp.shape(v)
+            mod.__dict__[k] = v
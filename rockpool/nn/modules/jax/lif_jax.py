@@ -22,7 +22,14 @@ from jax.lax import scan
 import jax.random as rand
 
 from typing import Optional, Tuple, Union, Callable
-from rockpool.typehints import FloatVector, P_ndarray, JaxRNGKey, P_float, P_int
+from rockpool.typehints import (
+    FloatVector,
+    P_ndarray,
+    JaxRNGKey,
+    P_float,
+    P_int,
+    P_bool,
+)
 
 __all__ = ["LIFJax"]
 
@@ -72,6 +79,31 @@ def step_pwl_jvp(primals, tangents):
     return primal_out, tangent_out
 
 
+def decay_scan(inputs: np.ndarray, decay: FloatVector, state: np.ndarray) -> np.ndarray:
+    """
+    Solve the linear recurrence :math:`x_t = \\beta (x_{t-1} + i_t)` for all time-steps with a parallel prefix scan
+
+    Args:
+        inputs (np.ndarray): Input :math:`i_t` for each time-step ``(B, T, ...)``
+        decay (FloatVector): Decay factor :math:`\\beta`, broadcastable to ``(...)``
+        state (np.ndarray): Initial state :math:`x_{-1}` ``(B, ...)``
+
+    Returns:
+        np.ndarray: The state :math:`x_t` for each time-step ``(B, T, ...)``
+    """
+    # - Fold the initial state into the first time-step
+    inputs = inputs.at[:, 0].add(state)
+    decays = np.broadcast_to(decay, inputs.shape)
+
+    # - Compose affine updates `x -> a * x + b`
+    def combine(first, second):
+        (a_first, b_first), (a_second, b_second) = first, second
+        return a_first * a_second, a_second * b_first + b_second
+
+    _, states = jax.lax.associative_scan(combine, (decays, decays * inputs), axis=1)
+    return states
+
+
 class LIFJax(JaxModule):
     """
     A leaky integrate-and-fire spiking neuron model, with a Jax backend
@@ -103,6 +135,9 @@ class LIFJax(JaxModule):
     Neurons therefore share a common resting potential of ``0``, have individual firing thresholds, and perform subtractive reset of ``-V_{thr}``.
     """
 
+    _supports_scan: bool = True
+    """ (bool) ``True`` if this class implements the ``use_scan`` evolution mode """
+
     def __init__(
         self,
         shape: Union[Tuple, int],
@@ -119,6 +154,8 @@ class LIFJax(JaxModule):
         rng_key: Optional[JaxRNGKey] = None,
         spiking_input: bool = False,
         spiking_output: bool = True,
+        use_scan: P_bool = False,
+        checkpoint_every: Optional[int] = None,
         *args,
         **kwargs,
     ):
@@ -138,6 +175,8 @@ class LIFJax(JaxModule):
             max_spikes_per_dt (float): The maximum number of events that will be produced in a single time-step. Default: ``2**16``.
             dt (float): The time step for the forward-Euler ODE solver. Default: 1ms
             rng_key (Optional[Any]): The Jax RNG seed to use on initialisation. By default, a new seed is generated.
+            use_scan (bool): If ``True``, solve the synaptic currents for all time-steps in parallel with :py:func:`jax.lax.associative_scan`, leaving only the membrane dynamics as a sequential scan. Only available for feed-forward modules. Default: ``False``, evolve all dynamics step by step.
+            checkpoint_every (Optional[int]): If provided, evolve in chunks of ``checkpoint_every`` time-steps, each wrapped in :py:func:`jax.checkpoint`, so that memory used for backpropagation scales with ``T / checkpoint_every + checkpoint_every`` instead of ``T``. Default: ``None``, do not checkpoint.
         """
         # - Check shape argument
         if np.size(shape) == 1:
@@ -185,8 +224,17 @@ class LIFJax(JaxModule):
                 cast_fn=np.array,
             )
             """ (Tensor) Recurrent weights `(Nout, Nin)` """
-        else:
-            self.w_rec = np.zeros((self.size_out, self.size_in))
+
+        if use_scan and not self._supports_scan:
+            raise ValueError(f"`use_scan` is not supported by {type(self).__name__}")
+
+        if has_rec and use_scan:
+            raise ValueError("`use_scan` may only be used if `has_rec` is `False`")
+
+        self._use_scan = use_scan
+        """ (bool) If ``True``, solve synaptic dynamics over all time-steps in parallel """
+
+        self._checkpoint_every = self._check_checkpoint_every(checkpoint_every)
 
         # - Set parameters
         self.tau_mem: P_ndarray = Parameter(
@@ -260,6 +308,8 @@ class LIFJax(JaxModule):
         self._init_args = {
             "has_rec": has_rec,
             "weight_init_func": Partial(weight_init_func),
+            "use_scan": use_scan,
+            "checkpoint_every": checkpoint_every,
         }
 
     def evolve(
@@ -271,7 +321,7 @@ class LIFJax(JaxModule):
 
         Args:
             input_data (np.ndarray): Input array of shape ``(T, Nin)`` to evolve over
-            record (bool): If ``True``,
+            record (bool): If ``True``, return the recorded synaptic, recurrent and membrane states over time. If ``False`` (default), only the output spikes are recorded over time.
 
         Returns:
             (np.ndarray, dict, dict): output, new_state, record_state
@@ -305,31 +355,22 @@ class LIFJax(JaxModule):
             subkey, shape=(n_batches, n_timesteps, self.size_out)
         )
 
+        has_rec = hasattr(self, "w_rec")
+
         # - Single-step LIF dynamics
         def forward(
             state: Tuple[np.ndarray, np.ndarray, np.ndarray],
             inputs_t: Tuple[np.ndarray, np.ndarray],
-        ) -> Tuple[
-            Tuple[np.ndarray, np.ndarray, np.ndarray],
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-        ]:
+        ) -> Tuple[Tuple[np.ndarray, np.ndarray, np.ndarray], dict]:
             """
             Single-step LIF dynamics for a recurrent LIF layer
 
             :param LayerState state:
             :param Tuple[np.ndarray, np.ndarray] inputs_t: (spike_inputs_ts, current_inputs_ts)
 
-            :return: (state, Irec_ts, spikes_ts, Vmem_ts, Isyn_ts)
+            :return: (state, records)
                 state:          (Tuple[np.ndarray, np.ndarray, np.ndarray]) Layer state at end of evolution
-                Irec_ts:        (np.ndarray) Recurrent input received at each neuron over time [T, N]
-                spikes_ts:      (np.ndarray) Logical spiking raster for each neuron [T, N]
-                Vmem_ts:        (np.ndarray) Membrane voltage of each neuron over time [T, N]
-                Isyn_ts:        (np.ndarray) Synaptic input current received by each neuron over time [T, N]
+                records:        (dict) Spiking output of each neuron ``"spikes"`` [N]. If ``record`` is ``True``, also the membrane voltage ``"vmem"`` [N], synaptic current ``"isyn"`` [N, Nsyn] and, for recurrent layers, the recurrent input ``"irec"`` [N, Nsyn] of each neuron
             """
             # - Unpack inputs
             (sp_in_t, noise_in_t) = inputs_t
@@ -339,8 +380,11 @@ class LIFJax(JaxModule):
 
             # - Apply synaptic and recurrent input
             isyn = isyn + sp_in_t
-            irec = np.dot(spikes, self.w_rec).reshape(self.size_out, self.n_synapses)
-            isyn = isyn + irec
+            if has_rec:
+                irec = np.dot(spikes, self.w_rec).reshape(
+                    self.size_out, self.n_synapses
+                )
+                isyn = isyn + irec
 
             # - Decay synaptic and membrane state
             vmem *= alpha
@@ -355,34 +399,88 @@ class LIFJax(JaxModule):
             # - Apply subtractive membrane reset
             vmem = vmem - spikes * self.threshold
 
-            # - Return state and outputs
-            return (spikes, isyn, vmem), (irec, spikes, vmem, isyn)
+            # - Return state and outputs, recording internal states only if requested
+            records = {"spikes": spikes}
+            if record:
+                records.update({"isyn": isyn, "vmem": vmem})
+                if has_rec:
+                    records["irec"] = irec
 
-        # - Map over batches
-        @jax.vmap
-        def scan_time(spikes, isyn, vmem, input_data, noise_ts):
-            return scan(forward, (spikes, isyn, vmem), (input_data, noise_ts))
+            return (spikes, isyn, vmem), records
 
-        # - Evolve over spiking inputs
-        state, (irec_ts, spikes_ts, vmem_ts, isyn_ts) = scan_time(
-            spikes, isyn, vmem, input_data, noise_ts
-        )
+        # - Single-step membrane dynamics, for synaptic currents solved in advance
+        def forward_membrane(
+            state: Tuple[np.ndarray, np.ndarray],
+            drive_t: np.ndarray,
+        ) -> Tuple[Tuple[np.ndarray, np.ndarray], dict]:
+            spikes, vmem = state
+
+            # - Decay and integrate membrane potentials
+            vmem = vmem * alpha + drive_t
+
+            # - Detect next spikes (with custom gradient)
+            spikes = step_pwl(vmem, self.threshold, 0.5, self.max_spikes_per_dt)
+
+            # - Apply subtractive membrane reset
+            vmem = vmem - spikes * self.threshold
+
+            records = {"spikes": spikes, "vmem": vmem} if record else {"spikes": spikes}
+            return (spikes, vmem), records
+
+        if self._use_scan:
+            # - Solve synaptic currents for all time-steps in parallel
+            isyn_ts = decay_scan(input_data, beta, isyn)
+            drive_ts = isyn_ts.sum(-1) + noise_ts + self.bias
+
+            # - Map over batches
+            @jax.vmap
+            def scan_time(spikes, vmem, drive_ts):
+                return self._scan(
+                    forward_membrane, (spikes, vmem), drive_ts, self._checkpoint_every
+                )
+
+            # - Evolve membranes over time
+            (spikes, vmem), records = scan_time(spikes, vmem, drive_ts)
+            isyn = isyn_ts[:, -1]
+            if record:
+                records["isyn"] = isyn_ts
+
+        else:
+            # - Map over batches
+            @jax.vmap
+            def scan_time(spikes, isyn, vmem, input_data, noise_ts):
+                return self._scan(
+                    forward,
+                    (spikes, isyn, vmem),
+                    (input_data, noise_ts),
+                    self._checkpoint_every,
+                )
+
+            # - Evolve over spiking inputs
+            (spikes, isyn, vmem), records = scan_time(
+                spikes, isyn, vmem, input_data, noise_ts
+            )
 
         # - Generate return arguments
-        outputs = spikes_ts
+        outputs = records["spikes"]
         states = {
-            "spikes": spikes_ts[0, -1],
-            "isyn": isyn_ts[0, -1],
-            "vmem": vmem_ts[0, -1],
+            "spikes": spikes[0],
+            "isyn": isyn[0],
+            "vmem": vmem[0],
             "rng_key": key1,
         }
 
-        record_dict = {
-            "irec": irec_ts,
-            "spikes": spikes_ts,
-            "isyn": isyn_ts,
-            "vmem": vmem_ts,
-        }
+        record_dict = (
+            {
+                # - Feed-forward layers receive no recurrent input
+                "irec": records["irec"] if has_rec else np.zeros_like(records["isyn"]),
+                "spikes": records["spikes"],
+                "isyn": records["isyn"],
+                "vmem": records["vmem"],
+            }
+            if record
+            else {}
+        )
 
         # - Return outputs
         return outputs, states, record_dict
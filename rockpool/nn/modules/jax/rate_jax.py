@@ -100,6 +100,7 @@ class RateJax(JaxModule):
         noise_std: float = 0.0,
         dt: float = 1e-3,
         rng_key: Optional[int] = None,
+        checkpoint_every: Optional[int] = None,
         *args: list,
         **kwargs: dict,
     ):
@@ -117,6 +118,7 @@ class RateJax(JaxModule):
             dt (float): The Euler solver time-step. Default: ``1e-3``
             noise_std (float): The std. dev. of normally-distributed noise added to the neural state at each time step. Default: ``0.``
             rng_key (Any): A Jax PRNG key to initialise the module with. Default: not provided, the module PRNG will be initialised with a random number.
+            checkpoint_every (Optional[int]): If provided, evolve in chunks of ``checkpoint_every`` time-steps, each wrapped in :py:func:`jax.checkpoint`, so that memory used for backpropagation scales with ``T / checkpoint_every + checkpoint_every`` instead of ``T``. Default: ``None``, do not checkpoint.
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
         """
@@ -220,11 +222,14 @@ class RateJax(JaxModule):
         self.act_fn: P_Callable = SimulationParameter(Partial(act_fn))
         """ (Callable) Activation function """
 
+        self._checkpoint_every = self._check_checkpoint_every(checkpoint_every)
+
         # - Define additional arguments required during initialisation
         self._init_args = {
             "has_rec": has_rec,
             "weight_init_func": Partial(weight_init_func),
             "activation_func": Partial(act_fn),
+            "checkpoint_every": checkpoint_every,
         }
 
     def evolve(
@@ -247,7 +252,7 @@ class RateJax(JaxModule):
             :param x:       np.ndarray Current state and activation of reservoir units
             :param inp:    np.ndarray Inputs to each reservoir unit for the current step
 
-            :return:    (new_state, new_activation), (rec_input, activation)
+            :return:    (new_state, new_activation), records
             """
             state, activation = x
 
@@ -255,7 +260,12 @@ class RateJax(JaxModule):
             state += alpha * (-state + inp + self.bias + rec_input)
             activation = self.act_fn(state, self.threshold)
 
-            return (state, activation), (rec_input, state, activation)
+            # - Record internal states only if requested
+            records = {"activation": activation}
+            if record:
+                records.update({"rec_input": rec_input, "x": state})
+
+            return (state, activation), records
 
         # - Generate noise trace
         key1, subkey = rand.split(self.rng_key)
@@ -265,24 +275,26 @@ class RateJax(JaxModule):
         # - Map over batches
         @jax.vmap
         def scan_time(state0, act0, inputs):
-            return scan(forward, (state0, act0), inputs)
+            return self._scan(forward, (state0, act0), inputs, self._checkpoint_every)
 
         # - Use `scan` to evaluate reservoir
-        (x1, _), (rec_inputs, res_state, outputs) = scan_time(
-            x0, self.act_fn(x0, self.threshold), inputs
-        )
+        (x1, _), records = scan_time(x0, self.act_fn(x0, self.threshold), inputs)
 
         new_state = {
             "x": x1[0],
             "rng_key": key1,
         }
 
-        record_dict = {
-            "rec_input": rec_inputs,
-            "x": res_state,
-        }
+        record_dict = (
+            {
+                "rec_input": records["rec_input"],
+                "x": records["x"],
+            }
+            if record
+            else {}
+        )
 
-        return outputs, new_state, record_dict
+        return records["activation"], new_state, record_dict
 
     def as_graph(self) -> GraphModuleBase:
         # - Generate a GraphModule for the neurons
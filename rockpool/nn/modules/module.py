@@ -4,7 +4,7 @@ Contains the module base classes for Rockpool
 # - Rockpool imports
 import collections
 
-from rockpool.parameters import ParameterBase
+from rockpool.parameters import ParameterBase, _InitData
 from rockpool.timeseries import TimeSeries
 
 try:
@@ -33,6 +33,7 @@ class ModuleBase(ABC):
         spiking_input: bool = False,
         spiking_output: bool = False,
         *args,
+        snapshot_init_data: bool = True,
         **kwargs,
     ):
         """
@@ -42,6 +43,7 @@ class ModuleBase(ABC):
             shape (Optional[Union[Tuple, int]]): The shape of the defined module
             spiking_input (bool): Whether this module receives spiking input. Default: False
             spiking_output (bool): Whether this module produces spiking output. Default: False
+            snapshot_init_data (bool): If ``True``, keep a private copy of concrete initialisation data that could be modified in place (numpy arrays and torch tensors), which is restored by :py:meth:`.reset_parameters` and :py:meth:`.reset_state`. If ``False``, keep only a reference to the initialisation data, to avoid doubling the memory used by large pretrained networks. Immutable data such as Jax arrays is never copied. Default: ``True``
             *args: Additional positional arguments
             **kwargs: Additional keyword arguments
         """
@@ -52,6 +54,9 @@ class ModuleBase(ABC):
         self._force_set_attributes = False
         """ (bool) If ``True``, do not sanity-check attributes when setting. """
 
+        self._snapshot_init_data = snapshot_init_data
+        """ (bool) If ``True``, copy mutable concrete initialisation data when registering attributes """
+
         # - Initialise co-classes etc.
         super().__init__(*args, **kwargs)
 
@@ -214,12 +219,19 @@ class ModuleBase(ABC):
         # - Get attribute registry
         __registered_attributes, __modules = self._get_attribute_registry()
 
+        # - Take a snapshot of concrete initialisation data, if requested
+        init_func = val.init_func
+        if isinstance(init_func, _InitData) and getattr(
+            self, "_snapshot_init_data", True
+        ):
+            init_func = init_func.snapshot()
+
         # - Record attribute in attribute registry
         __registered_attributes[name]: dict = [
             val.data,
             type(val).__name__,
             val.family,
-            val.init_func,
+            init_func,
             val.shape,
         ]
         """The attribute registry for this module"""
@@ -3,14 +3,13 @@ Modules implementing filter banks
 """
 
 from typing import Union, Iterable
-from itertools import product
-from multiprocessing import Pool
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 from scipy.signal import butter, sosfilt, sosfreqz
 
 from rockpool.nn.modules.module import Module
-from rockpool.parameters import SimulationParameter
+from rockpool.parameters import SimulationParameter, State
 
 from typing import Optional, Tuple
 from rockpool.typehints import P_int, P_float, P_bool
@@ -35,6 +34,7 @@ class FilterBankBase(Module):
         normalize: bool = False,
         num_workers: int = 1,
         use_lowpass: bool = True,
+        streaming: bool = False,
         *args,
         **kwargs,
     ):
@@ -50,6 +50,7 @@ class FilterBankBase(Module):
                                         responses in the range [-1, 1]). Default: ``False``
         :param int num_workers:         Number of CPU cores to use in simulation. Default: ``1``
         :param bool use_lowpass:        Iff ``True``, use a low-pass filter following the band-pass filters. Default: ``True``
+        :param bool streaming:          Iff ``True``, keep the filter states between calls to :py:meth:`.evolve`, so that a signal can be filtered in consecutive chunks. Cannot be used with ``normalize`` or ``mean_subtraction``. Default: ``False``
         """
 
         # - Correct the shape, if passed as an integer
@@ -100,6 +101,13 @@ class FilterBankBase(Module):
         self.use_lowpass: P_bool = SimulationParameter(use_lowpass, shape=())
         """ (bool) Iff ``True``, perform a low-pass filter after filtering """
 
+        if streaming and (normalize or mean_subtraction):
+            raise ValueError(
+                "`streaming` cannot be used with `normalize` or `mean_subtraction`, which require the full signal."
+            )
+        self.streaming: P_bool = SimulationParameter(streaming, shape=())
+        """ (bool) Iff ``True``, keep filter states between calls to :py:meth:`.evolve` """
+
         # - Build low-pass filter
         self._filter_lowpass = (
             butter(
@@ -117,14 +125,54 @@ class FilterBankBase(Module):
         self._chunks: list = []
         self._filters: list = []
 
-        # - Initialise worker pool
-        # self._pool = Pool(self.num_workers)
+        # - Worker pool, created on first use
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    def _init_filter_state(self):
+        """
+        Register the filter states, for filter banks in streaming mode
+
+        Must be called by subclasses after building ``self._filters``.
+        """
+        if not self.streaming:
+            return
+
+        num_sections = np.shape(self._filters[0])[0]
+        self.zi: np.ndarray = State(
+            shape=(len(self._filters), num_sections, 2), init_func=np.zeros
+        )
+        """ (np.ndarray) Band-pass filter states ``(N, num_sections, 2)``, in ``sosfilt`` format """
+
+        if self._filter_lowpass is not None:
+            num_sections = np.shape(self._filter_lowpass)[0]
+            self.zi_lowpass: np.ndarray = State(
+                shape=(len(self._filters), num_sections, 2), init_func=np.zeros
+            )
+            """ (np.ndarray) Low-pass filter states ``(N, num_sections, 2)``, in ``sosfilt`` format """
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """
+        Return the persistent worker pool, creating it if necessary
+
+        A thread pool is used, since ``sosfilt`` releases the GIL while filtering.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self.num_workers)
+
+        return self._pool
 
     def _terminate(self):
-        """Terminates all processes in the worker _pool"""
+        """Terminates all threads in the worker _pool"""
 
         if self._pool is not None:
-            self._pool.close()
+            self._pool.shutdown(wait=True)
+            self._pool = None
+
+    def __getstate__(self):
+        # - Worker pools cannot be copied or pickled
+        state = self.__dict__.copy()
+        state["_pool"] = None
+        return state
 
     @staticmethod
     def _generate_chunks(l, n) -> list:
@@ -143,15 +191,19 @@ class FilterBankBase(Module):
         """Method for processing the filters each worker executes"""
 
         filters, params = args
-        signal, filter_lowpass = params
+        signal, filter_lowpass, zi, zi_lowpass = params
         filters_output = []
-        for f in filters:
-            sig = sosfilt(f, signal)
+        zf = []
+        zf_lowpass = []
+        for n, f in enumerate(filters):
+            sig, z = sosfilt(f, signal, zi=zi[n])
+            zf.append(z)
             if filter_lowpass is not None:
                 sig = np.abs(sig)
-                sig = sosfilt(filter_lowpass, sig)
+                sig, z = sosfilt(filter_lowpass, sig, zi=zi_lowpass[n])
+                zf_lowpass.append(z)
             filters_output.append(sig)
-        return filters_output
+        return filters_output, zf, zf_lowpass
 
     def evolve(
         self,
@@ -165,15 +217,53 @@ class FilterBankBase(Module):
         :param np.ndarray input:   Raw input signal
         """
 
+        # - Get initial filter states; zero unless streaming
+        num_filters = len(self._filters)
+        num_sections = np.shape(self._filters[0])[0]
+        zi = self.zi if self.streaming else np.zeros((num_filters, num_sections, 2))
+
+        zi_lowpass = None
+        if self._filter_lowpass is not None:
+            num_sections = np.shape(self._filter_lowpass)[0]
+            zi_lowpass = (
+                self.zi_lowpass
+                if self.streaming
+                else np.zeros((num_filters, num_sections, 2))
+            )
+
         # - Build arguments to map filters over input
-        args = list(product(self._chunks, [(input.T[0], self._filter_lowpass)]))
+        signal = input.T[0]
+        args = []
+        start = 0
+        for chunk in self._chunks:
+            stop = start + len(chunk)
+            args.append(
+                (
+                    chunk,
+                    (
+                        signal,
+                        self._filter_lowpass,
+                        zi[start:stop],
+                        None if zi_lowpass is None else zi_lowpass[start:stop],
+                    ),
+                )
+            )
+            start = stop
 
         # - Map the filtering process over the worker pool
-        # res = self._pool.map(self._process_filters, args)
-        res = list(map(self._process_filters, args))
+        if self.num_workers > 1 and len(args) > 1:
+            res = list(self._get_pool().map(self._process_filters, args))
+        else:
+            res = list(map(self._process_filters, args))
 
         # - Combine the results
-        filtOutput = np.concatenate(res).T
+        filtOutput = np.concatenate([r[0] for r in res]).T
+
+        # - Keep the final filter states, if streaming
+        if self.streaming:
+            self.zi = np.concatenate([r[1] for r in res])
+            if self._filter_lowpass is not None:
+                self.zi_lowpass = np.concatenate([r[2] for r in res])
 
         # - Normalise the filter outputs
         if self.normalize:
@@ -184,7 +274,7 @@ class FilterBankBase(Module):
             filtOutput -= np.mean(filtOutput)
 
         # - Return outputs
-        return filtOutput, {}, {}
+        return filtOutput, self.state() if self.streaming else {}, {}
 
 
 class ButterMelFilter(FilterBankBase):
@@ -205,6 +295,7 @@ class ButterMelFilter(FilterBankBase):
         num_workers: int = 1,
         plot: bool = False,
         use_lowpass: bool = True,
+        streaming: bool = False,
         *args,
         **kwargs,
     ):
@@ -225,6 +316,7 @@ class ButterMelFilter(FilterBankBase):
                                         responses in the range [-1, 1]). Default: ``False``
         :param int num_workers:         Number of CPU cores to use in simulation. Default: ``1``
         :param bool use_lowpass:        Iff ``True``, return the filtered rectified smoothed signal. Default: ``True``. If ``False``, simply perform the band-pass filtering.
+        :param bool streaming:          Iff ``True``, keep the filter states between calls to :py:meth:`.evolve`, so that a signal can be filtered in consecutive chunks. Default: ``False``
         :param bool plot:               Plots the filter response. Default: ``False``
         """
 
@@ -238,6 +330,7 @@ class ButterMelFilter(FilterBankBase):
             normalize=normalize,
             num_workers=num_workers,
             use_lowpass=use_lowpass,
+            streaming=streaming,
             *args,
             **kwargs,
         )
@@ -278,6 +371,9 @@ class ButterMelFilter(FilterBankBase):
         chunk_size = int(np.ceil(self.shape[-1] / num_workers))
         self._chunks = self._generate_chunks(self._filters, chunk_size)
 
+        # - Register filter states
+        self._init_filter_state()
+
         if plot:
             import matplotlib.pyplot as plt
             from matplotlib import cm
@@ -313,6 +409,7 @@ class ButterFilter(FilterBankBase):
         normalize: bool = False,
         num_workers: int = 1,
         use_lowpass: bool = True,
+        streaming: bool = False,
         *args,
         **kwargs,
     ):
@@ -332,6 +429,8 @@ class ButterFilter(FilterBankBase):
         :param bool normalize:              divide output signals by their maximum absolute value.
                                             Default: ``False``
         :param int num_workers:             number of CPU cores to use in simulation. Default: ``1``
+        :param bool use_lowpass:            Iff ``True``, return the filtered rectified smoothed signal. Default: ``True``
+        :param bool streaming:              Iff ``True``, keep the filter states between calls to :py:meth:`.evolve`, so that a signal can be filtered in consecutive chunks. Default: ``False``
         """
 
         # - Check input arguments
@@ -366,6 +465,7 @@ class ButterFilter(FilterBankBase):
             normalize=normalize,
             num_workers=num_workers,
             use_lowpass=use_lowpass,
+            streaming=streaming,
             *args,
             **kwargs,
         )
@@ -397,3 +497,6 @@ class ButterFilter(FilterBankBase):
         # - Generate chunks
         chunk_size = int(np.ceil(self.shape[-1] / num_workers))
         self._chunks = self._generate_chunks(self._filters, chunk_size)
+
+        # - Register filter states
+        self._init_filter_state()
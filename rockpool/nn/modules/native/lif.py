@@ -8,6 +8,7 @@ from rockpool.nn.modules.native.linear import kaiming
 from rockpool import TSContinuous, TSEvent
 
 import numpy as np
+from scipy.signal import lfilter
 
 from typing import Optional, Tuple, Union, Dict, Callable, Any
 from rockpool.typehints import (
@@ -65,6 +66,51 @@ def spike_subtract_threshold(
     return np.clip((x >= threshold) * np.floor(x / threshold), None, max_spikes_per_dt)
 
 
+def decay_integrate(
+    x: np.ndarray,
+    decay: FloatVector,
+    state: np.ndarray,
+) -> np.ndarray:
+    """
+    Solve a bank of leaky integrators over all time-steps at once
+
+    Computes :math:`y_t = d \\cdot (y_{t-1} + x_t)` along the time axis, with :math:`y_{-1}` given by ``state``. This is the synaptic update of a non-recurrent :py:class:`.LIF` layer, and is solved as a first-order IIR filter with :py:func:`scipy.signal.lfilter`, once for each distinct decay factor. If there are more distinct decay factors than time-steps, the integrators are stepped through time instead.
+
+    Args:
+        x (np.ndarray): Input data with shape ``(B, T, ...)``
+        decay (FloatVector): Decay factor per integrator, broadcastable to ``x.shape[2:]``
+        state (np.ndarray): Initial integrator state with shape ``(B, ...)``
+
+    Returns:
+        np.ndarray: The integrator state after each time-step, with shape ``(B, T, ...)``
+    """
+    batches, num_timesteps = x.shape[:2]
+    decay = np.broadcast_to(decay, x.shape[2:])
+    state = np.broadcast_to(state, (batches, *x.shape[2:]))
+    y = np.empty(x.shape)
+
+    decay_values, decay_index = np.unique(decay, return_inverse=True)
+    decay_index = decay_index.reshape(decay.shape)
+
+    if len(decay_values) > num_timesteps:
+        # - Step through time, vectorised over batches and integrators
+        y_t = np.array(state, float)
+        for t in range(num_timesteps):
+            y_t = (y_t + x[:, t]) * decay
+            y[:, t] = y_t
+
+        return y
+
+    # - Filter each group of integrators sharing a decay factor
+    for index, d in enumerate(decay_values):
+        mask = decay_index == index
+        y[:, :, mask] = lfilter(
+            [d], [1.0, -d], x[:, :, mask], axis=1, zi=d * state[:, None, mask]
+        )[0]
+
+    return y
+
+
 class LIF(Module):
     """
     A leaky integrate-and-fire spiking neuron model
@@ -231,6 +277,9 @@ class LIF(Module):
         self.max_spikes_per_dt: P_float = SimulationParameter(max_spikes_per_dt)
         """ (float) Maximum number of events that can be produced in each time-step """
 
+        self._block_timesteps: int = 1024
+        """ (int) Number of time-steps evolved together, bounding temporary memory use """
+
     def evolve(
         self,
         input_data: np.ndarray,
@@ -240,7 +289,7 @@ class LIF(Module):
 
         Args:
             input_data (np.ndarray): Input array of shape ``(T, Nin)`` to evolve over
-            record (bool): If ``True``,
+            record (bool): If ``True``, return the recorded synaptic, recurrent and membrane states over time. If ``False`` (default), only the output raster and final state are allocated.
 
         Returns:
             (np.ndarray, dict, dict): output, new_state, record_state
@@ -266,86 +315,69 @@ class LIF(Module):
         alpha = np.exp(-self.dt / self.tau_mem)
         beta = np.exp(-self.dt / self.tau_syn)
         noise_zeta = self.noise_std * np.sqrt(self.dt)
+        has_rec = hasattr(self, "w_rec")
 
-        # - Single-step LIF dynamics
-        def forward(
-            state: Tuple[np.ndarray, np.ndarray, np.ndarray],
-            inputs_t: Tuple[np.ndarray, np.ndarray],
-        ) -> Tuple[
-            Tuple[np.ndarray, np.ndarray, np.ndarray],
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-            np.ndarray,
-        ]:
-            """
-            Single-step LIF dynamics for a recurrent LIF layer
-
-            :param LayerState state:
-            :param Tuple[np.ndarray, np.ndarray] inputs_t: (spike_inputs_ts, current_inputs_ts)
-
-            :return: (state, Irec_ts, spikes_ts, Vmem_ts, Isyn_ts)
-                state:          (LayerState) Layer state at end of evolution
-                Irec_ts:        (np.ndarray) Recurrent input received at each neuron over time [T, N]
-                spikes_ts:      (np.ndarray) Logical spiking raster for each neuron [T, N]
-                Vmem_ts:        (np.ndarray) Membrane voltage of each neuron over time [T, N]
-                Isyn_ts:        (np.ndarray) Synaptic input current received by each neuron over time [T, N]
-            """
-            # - Unpack inputs
-            (sp_in_t, I_in_t) = inputs_t
-
-            # - Unpack state
-            spikes, Isyn, Vmem = state
-
-            # - Apply synaptic and recurrent input
-            Irec = (
-                np.dot(spikes, self.w_rec).reshape(self.size_out, self.n_synapses)
-                if hasattr(self, "w_rec")
-                else np.zeros((self.size_out, self.n_synapses))
-            )
-            Isyn += sp_in_t + Irec
-
-            # - Decay synaptic and membrane state
-            Vmem *= alpha
-            Isyn *= beta
-
-            # - Integrate membrane potentials
-            Vmem += Isyn.sum(1) + I_in_t + self.bias
+        # - Allocate the output raster, and full state records only if requested
+        spikes_ts = np.zeros((batches, num_timesteps, self.size_out))
 
-            # - Detect next spikes (with custom gradient)
-            spikes = spike_subtract_threshold(
-                Vmem, self.threshold, None, self.max_spikes_per_dt
+        if record:
+            Irec_ts = np.zeros((batches, num_timesteps, self.size_out, self.n_synapses))
+            Isyn_ts = np.zeros((batches, num_timesteps, self.size_out, self.n_synapses))
+            Vmem_ts = np.zeros((batches, num_timesteps, self.size_out))
+
+        # - Evolve in blocks of time-steps, to bound temporary memory use
+        for t_start in range(0, num_timesteps, self._block_timesteps):
+            t_stop = min(t_start + self._block_timesteps, num_timesteps)
+            block_len = t_stop - t_start
+
+            # - Generate membrane noise trace, only if noise is requested
+            noise_ts = (
+                noise_zeta * np.random.randn(batches, block_len, self.size_out)
+                if self.noise_std
+                else np.zeros((batches, block_len, 1))
             )
 
-            # - Apply subtractive membrane reset
-            Vmem = Vmem - spikes * self.threshold
-
-            # - Return state and outputs
-            return (spikes, Isyn, Vmem), (Irec, spikes, Vmem, Isyn)
-
-        # - Generate membrane noise trace
-        noise_ts = noise_zeta * np.random.randn(batches, num_timesteps, self.size_out)
+            if not has_rec:
+                # - Feed-forward synaptic currents can be solved for the whole block at once
+                isyn_block = decay_integrate(input_data[:, t_start:t_stop], beta, isyn)
+                isyn = isyn_block[:, -1].copy()
+
+                if record:
+                    Isyn_ts[:, t_start:t_stop] = isyn_block
+
+                # - Pre-compute the membrane drive over the block
+                drive_ts = isyn_block.sum(-1) + noise_ts + self.bias
+                del isyn_block
+
+            # - Evolve all batches in lock-step
+            for t in range(block_len):
+                if has_rec:
+                    # - Apply synaptic and recurrent input
+                    Irec = np.dot(spikes, self.w_rec).reshape(
+                        batches, self.size_out, self.n_synapses
+                    )
+                    isyn = (isyn + (input_data[:, t_start + t] + Irec)) * beta
+
+                    if record:
+                        Irec_ts[:, t_start + t] = Irec
+                        Isyn_ts[:, t_start + t] = isyn
+
+                    # - Decay and integrate membrane potentials
+                    vmem = vmem * alpha + (isyn.sum(-1) + noise_ts[:, t] + self.bias)
+                else:
+                    vmem = vmem * alpha + drive_ts[:, t]
+
+                # - Detect next spikes
+                spikes = spike_subtract_threshold(
+                    vmem, self.threshold, None, self.max_spikes_per_dt
+                )
 
-        Irec_ts = np.zeros((batches, num_timesteps, self.size_out, self.n_synapses))
-        spikes_ts = np.zeros((batches, num_timesteps, self.size_out))
-        Vmem_ts = np.zeros((batches, num_timesteps, self.size_out))
-        Isyn_ts = np.zeros((batches, num_timesteps, self.size_out, self.n_synapses))
+                # - Apply subtractive membrane reset
+                vmem = vmem - spikes * self.threshold
 
-        for b in range(batches):
-            for t in range(num_timesteps):
-                # - Solve layer dynamics for this timestep
-                (
-                    (spikes[b], isyn[b], vmem[b]),
-                    (
-                        Irec_ts[b, t, :, :],
-                        spikes_ts[b, t, :],
-                        Vmem_ts[b, t, :],
-                        Isyn_ts[b, t, :, :],
-                    ),
-                ) = forward(
-                    (spikes[b], isyn[b], vmem[b]),
-                    (input_data[b, t, :], noise_ts[b, t, :]),
-                )
+                spikes_ts[:, t_start + t] = spikes
+                if record:
+                    Vmem_ts[:, t_start + t] = vmem
 
         self.spikes = spikes[0]
         self.isyn = isyn[0]
@@ -354,12 +386,16 @@ class LIF(Module):
         # - Generate return arguments
         outputs = spikes_ts
 
-        record_dict = {
-            "irec": Irec_ts,
-            "spikes": spikes_ts,
-            "isyn": Isyn_ts,
-            "vmem": Vmem_ts,
-        }
+        record_dict = (
+            {
+                "irec": Irec_ts,
+                "spikes": spikes_ts,
+                "isyn": Isyn_ts,
+                "vmem": Vmem_ts,
+            }
+            if record
+            else {}
+        )
 
         # - Return outputs
         return outputs, self.state(), record_dict
@@ -222,31 +222,36 @@ class Rate(Module):
 
             return (state, activation), (rec_input, state, activation)
 
-        # - Compute random numbers for reservoir noise
-        noise = noise_zeta * rand.normal(size=input_data.shape)
-        inputs = input_data + noise
-
-        # - Loop over time
-        rec_inputs = np.zeros((batches, num_timesteps, self.size_out))
-        res_state = np.zeros((batches, num_timesteps, self.size_out))
+        # - Allocate the output, and state records only if requested
         outputs = np.zeros((batches, num_timesteps, self.size_out))
 
-        for b in range(batches):
-            for t in range(num_timesteps):
-                # - Solve layer dynamics for this time-step
+        if record:
+            rec_inputs = np.zeros((batches, num_timesteps, self.size_out))
+            res_state = np.zeros((batches, num_timesteps, self.size_out))
+
+        # - Loop over time, evolving all batches in lock-step
+        for t in range(num_timesteps):
+            # - Add reservoir noise, only if requested
+            inp = input_data[:, t, :]
+            if self.noise_std:
+                inp = inp + noise_zeta * rand.normal(size=inp.shape)
+
+            # - Solve layer dynamics for this time-step
+            (
+                (x, _),
                 (
-                    (x[b], _),
-                    (
-                        this_rec_i,
-                        this_r_s,
-                        this_out,
-                    ),
-                ) = forward((x[b], self.act_fn(x[b], self.threshold)), inputs[b, t, :])
-
-                # - Keep a record of the layer dynamics
-                rec_inputs[b, t, :] = this_rec_i
-                res_state[b, t, :] = this_r_s
-                outputs[b, t, :] = this_out
+                    this_rec_i,
+                    this_r_s,
+                    this_out,
+                ),
+            ) = forward((x, self.act_fn(x, self.threshold)), inp)
+
+            # - Keep a record of the layer dynamics
+            outputs[:, t, :] = this_out
+
+            if record:
+                rec_inputs[:, t, :] = this_rec_i
+                res_state[:, t, :] = this_r_s
 
         self.x = x[0]
 
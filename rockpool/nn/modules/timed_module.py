@@ -545,6 +545,7 @@ class TimedModule(ModuleBase, metaclass=PostInitMetaMixin):
         periodic: bool = False,
         num_channels: Optional[int] = None,
         spikes_at_bin_start: bool = False,
+        compact: bool = False,
     ) -> TSEvent:
         """
         Wrap a rasterised output array as a :py:class:`.TSEvent` object to present as output for this module
@@ -559,6 +560,7 @@ class TimedModule(ModuleBase, metaclass=PostInitMetaMixin):
             periodic (bool): Flag to indicate whether the returned :py:class:`.TSEvent` should be periodic. Default: ``False``, the :py:class:`.TSEvent` will not be periodic
             num_channels (Optional[int]): The desired number of total channels for the output :py:class:`.TSEvent` object. If not provided, the output size :py:attr:`.size_out` of the current module will be used
             spikes_at_bin_start (bool): If ``False`` (default), spike events will be considered to fall in the middle of the time bin they fall in. If ``True``, all spike events will be considered to occur at the start of the time bin they fall in.
+            compact (bool): If ``True``, the returned :py:class:`.TSEvent` stores events compactly. Default: ``False``
 
         Returns:
             TSEvent: The wrapped output raster as a :py:class:`.TSEvent` object
@@ -579,6 +581,7 @@ class TimedModule(ModuleBase, metaclass=PostInitMetaMixin):
             periodic=periodic,
             num_channels=self.size_out if num_channels is None else num_channels,
             spikes_at_bin_start=spikes_at_bin_start,
+            compact=compact,
         )
 
     def _gen_tscontinuous(
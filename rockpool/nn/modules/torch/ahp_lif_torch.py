@@ -140,7 +140,11 @@ class aLIFTorch(LIFBaseTorch):
         """
         Decay factor for AHP synapses :py:attr:`.aLIFTorch.tau_ahp`
         """
-        return torch.exp(-self.dt / self.tau_ahp).to(self.tau_ahp.device)
+        return self._memoise_leak_param(
+            "gamma",
+            ("tau_ahp",),
+            lambda: torch.exp(-self.dt / self.tau_ahp).to(self.tau_ahp.device),
+        )
 
     def forward(self, input_data: torch.Tensor) -> torch.Tensor:
         """
@@ -63,12 +63,20 @@ class LIFBitshiftTorch(LIFTorch):
 
     @property
     def alpha(self):
-        return 1 - 1 / (
-            2 ** calc_bitshift_decay(self.tau_mem, self.dt).to(self.tau_mem.device)
+        return self._memoise_leak_param(
+            "alpha",
+            ("tau_mem",),
+            lambda: 1
+            - 1
+            / (2 ** calc_bitshift_decay(self.tau_mem, self.dt).to(self.tau_mem.device)),
         )
 
     @property
     def beta(self):
-        return 1 - 1 / (
-            2 ** calc_bitshift_decay(self.tau_syn, self.dt).to(self.tau_syn.device)
+        return self._memoise_leak_param(
+            "beta",
+            ("tau_syn",),
+            lambda: 1
+            - 1
+            / (2 ** calc_bitshift_decay(self.tau_syn, self.dt).to(self.tau_syn.device)),
         )
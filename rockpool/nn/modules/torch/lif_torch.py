@@ -147,7 +147,79 @@ def bitshift_to_decay(*dashes):
     return tuple([(1 - 1 / (2**dash)).to(dash.device) for dash in dashes])
 
 
+def _prefix_scan(decay: torch.Tensor, data: torch.Tensor) -> torch.Tensor:
+    """
+    Solve :math:`y_t = d \\cdot y_{t-1} + x_t` along the time axis ``1`` with a Hillis-Steele scan, without recording operations for autograd
+
+    Args:
+        decay (torch.Tensor): Time-invariant decay factors, broadcastable to ``data.shape[2:]``
+        data (torch.Tensor): Input data with shape ``(B, T, ...)``
+
+    Returns:
+        torch.Tensor: The solution ``y`` with the same shape as ``data``
+    """
+    n_timesteps = data.shape[1]
+    decay_pow = decay
+    shift = 1
+
+    with torch.no_grad():
+        data = data.clone()
+        while shift < n_timesteps:
+            data[:, shift:] = data[:, shift:] + decay_pow * data[:, :-shift]
+            decay_pow = decay_pow * decay_pow
+            shift *= 2
+
+    return data
+
+
+class LinearScan(torch.autograd.Function):
+    """
+    Linear recurrence solved with a parallel prefix scan, with a backward pass that solves the reverse recurrence
+
+    Only the solution is stored for the backward pass, so that memory used for training grows linearly with the number of time-steps.
+    """
+
+    @staticmethod
+    def forward(ctx, decay, data):
+        output = _prefix_scan(decay, data)
+        ctx.save_for_backward(decay, output)
+        return output
+
+    @staticmethod
+    def backward(ctx, grad_output):
+        decay, output = ctx.saved_tensors
+        grad_decay = None
+
+        # - Adjoint of the recurrence, solved backwards in time
+        grad_data = _prefix_scan(decay, grad_output.flip(1)).flip(1)
+
+        if ctx.needs_input_grad[0]:
+            # - y_t depends on the decay through d * y_{t-1}
+            grad_decay = (grad_data[:, 1:] * output[:, :-1]).sum_to_size(decay.shape)
+
+        return grad_decay, grad_data if ctx.needs_input_grad[1] else None
+
+
+def linear_scan(decay: torch.Tensor, data: torch.Tensor) -> torch.Tensor:
+    """
+    Solve a linear recurrence over all time-steps with a parallel prefix scan
+
+    Computes :math:`y_t = d \\cdot y_{t-1} + x_t` with :math:`y_{-1} = 0`, along the time axis ``1`` of ``data``. The recurrence is solved with a Hillis-Steele scan in :math:`\\lceil \\log_2 T \\rceil` vectorised steps, rather than :math:`T` sequential steps. Gradients are computed by :py:class:`.LinearScan` with a second scan backwards in time, so memory used for training is :math:`O(T)`.
+
+    Args:
+        decay (torch.Tensor): Time-invariant decay factors, broadcastable to ``data.shape[2:]``
+        data (torch.Tensor): Input data with shape ``(B, T, ...)``
+
+    Returns:
+        torch.Tensor: The solution ``y`` with the same shape as ``data``
+    """
+    return LinearScan.apply(decay, data)
+
+
 class LIFBaseTorch(TorchModule):
+    _supports_scan: bool = False
+    """ (bool) ``True`` if this class implements the ``use_scan`` evolution mode """
+
     def __init__(
         self,
         shape: tuple,
@@ -170,6 +242,7 @@ class LIFBaseTorch(TorchModule):
             Callable[[Tuple], torch.tensor]
         ] = lambda s: init.kaiming_uniform_(torch.empty(s)),
         dt: P_float = 1e-3,
+        use_scan: P_bool = False,
         *args,
         **kwargs,
     ):
@@ -206,6 +279,7 @@ class LIFBaseTorch(TorchModule):
             max_spikes_per_dt (float): The maximum number of events that will be produced in a single time-step. Default: ``2**16``.
             weight_init_func (Optional[Callable[[Tuple], torch.tensor]): The initialisation function to use when generating recurrent weights. Default: ``None`` (Kaiming initialisation)
             dt (float): The time step for the forward-Euler ODE solver. Default: 1ms
+            use_scan (bool): If ``True``, solve the synaptic currents and membrane drive for all time-steps in parallel with a prefix scan, leaving only spike generation and reset as a sequential loop. Only available for feed-forward :py:class:`.LIFTorch` modules. Default: ``False``, evolve all dynamics step by step.
 
         """
 
@@ -219,6 +293,10 @@ class LIFBaseTorch(TorchModule):
                 "Training of time constants in `LIFTorch` neurons can be done only in one of the following modes: 'taus', 'decays', 'bitshifts'. `leak_mode` must be one of these values."
             )
 
+        # - Check that the scan evolution mode is implemented
+        if use_scan and not self._supports_scan:
+            raise ValueError(f"`use_scan` is not supported by {type(self).__name__}")
+
         # - Check shape argument
         if np.size(shape) == 1:
             shape = (np.array(shape).item(), np.array(shape).item())
@@ -240,6 +318,10 @@ class LIFBaseTorch(TorchModule):
         # - Initialise dummy parameters list
         self._dummy_params = ()
 
+        # - Initialise cache of derived leak parameters
+        self._leak_cache = {}
+        self._leak_cache_active = False
+
         self.leak_mode = rp.SimulationParameter(leak_mode)
         """ (str) The mode by which leaks are determined for this module. """
 
@@ -268,6 +350,12 @@ class LIFBaseTorch(TorchModule):
             if w_rec is not None:
                 raise ValueError("`w_rec` may not be provided if `has_rec` is `False`")
 
+        if has_rec and use_scan:
+            raise ValueError("`use_scan` may only be used if `has_rec` is `False`")
+
+        self._use_scan = use_scan
+        """ (bool) If ``True``, solve synaptic dynamics over all time-steps in parallel """
+
         self.noise_std: P_float = rp.SimulationParameter(noise_std)
         """ (float) Noise std.dev. injected onto the membrane of each neuron during evolution """
 
@@ -450,8 +538,14 @@ class LIFBaseTorch(TorchModule):
         # - Keep track of "record" flag for use by `forward` method
         self._record = record
 
-        # - Evolve with superclass evolution
-        output_data, _, _ = super().evolve(input_data, record)
+        # - Evolve with superclass evolution, computing leak parameters only once
+        self._leak_cache_active = True
+        try:
+            output_data, _, _ = super().evolve(input_data, record)
+        finally:
+            # - Drop cached values, which may be attached to the autograd graph of this evolution
+            self._leak_cache_active = False
+            self._leak_cache = {}
 
         # - Obtain state record dictionary
         record_dict = self._record_dict if record else {}
@@ -504,7 +598,57 @@ class LIFBaseTorch(TorchModule):
         # - Return a graph containing neurons and optional weights
         return as_GraphHolder(neurons)
 
+    def _memoise_leak_param(
+        self, name: str, sources: Tuple[str], compute_fn: Callable[[], Any]
+    ) -> Any:
+        """
+        Return a derived leak parameter, recomputing it only if its source attributes have changed
+
+        Values are only cached during a single call to :py:meth:`.evolve`, so that they are computed once per evolution and never shared between autograd graphs. Cached values are keyed on the identity and in-place version counter of each source attribute, so that setting a source attribute or modifying it in-place (e.g. by an optimiser step) invalidates the cache.
+
+        Args:
+            name (str): The name under which to cache the derived parameter
+            sources (Tuple[str]): The names of the attributes from which the parameter is derived
+            compute_fn (Callable[[], Any]): A function which computes the derived parameter
+
+        Returns:
+            Any: The value of the derived parameter
+        """
+        # - Outside of evolution, always compute the value
+        if not self._leak_cache_active:
+            return compute_fn()
+
+        source_values = [getattr(self, source, None) for source in sources]
+        key = tuple(
+            (id(value), getattr(value, "_version", None)) for value in source_values
+        ) + (self.dt,)
+
+        # - Return a cached value if it is still valid
+        entry = self._leak_cache.get(name)
+        if entry is not None and entry[1] == key:
+            return entry[2]
+
+        # - Compute and cache the value
+        value = compute_fn()
+        self._leak_cache[name] = (sources, key, value)
+
+        return value
+
     def _get_all_leak_params(self):
+        """
+        Return all decay parameters, depending on leak mode
+        """
+        sources = {
+            "taus": ("tau_mem", "tau_syn"),
+            "decays": ("alpha", "beta"),
+            "bitshifts": ("dash_mem", "dash_syn"),
+        }[self.leak_mode]
+
+        return self._memoise_leak_param(
+            "leak_params", sources, self._compute_all_leak_params
+        )
+
+    def _compute_all_leak_params(self):
         """
         Calculate and return all decay parameters, depending on leak mode
         """
@@ -555,6 +699,16 @@ class LIFBaseTorch(TorchModule):
         """
         if hasattr(self, "_dummy_params") and key in self._dummy_params:
             self._set_leak_param(key, value)
+
+        # - Invalidate cached leak parameters derived from this attribute
+        leak_cache = self.__dict__.get("_leak_cache")
+        if leak_cache:
+            self.__dict__["_leak_cache"] = {
+                name: entry
+                for name, entry in leak_cache.items()
+                if key not in entry[0] and key != "dt"
+            }
+
         return super().__setattr__(key, value)
 
     def _set_leak_param(self, name, value):
@@ -624,6 +778,8 @@ class LIFTorch(LIFBaseTorch):
     Neurons therefore share a common resting potential of ``0``, have individual firing thresholds, and perform subtractive reset of ``-V_{thr}``.
     """
 
+    _supports_scan = True
+
     def forward(self, input_data: torch.Tensor) -> torch.Tensor:
         """
         forward  method for processing data through this layer
@@ -676,6 +832,9 @@ class LIFTorch(LIFBaseTorch):
             (n_batches, n_timesteps, self.size_out), device=vmem.device
         )
 
+        if self._use_scan:
+            return self._forward_scan(input_data, vmem, isyn, noise_ts)
+
         # - Loop over time
         for t in range(n_timesteps):
             # Integrate synaptic input
@@ -721,3 +880,66 @@ class LIFTorch(LIFBaseTorch):
 
         # - Return output
         return self._record_dict["spikes"]
+
+    def _forward_scan(
+        self,
+        input_data: torch.Tensor,
+        vmem: torch.Tensor,
+        isyn: torch.Tensor,
+        noise_ts: torch.Tensor,
+    ) -> torch.Tensor:
+        """
+        Evolve a feed-forward layer, solving synaptic dynamics with a parallel scan
+
+        Args:
+            input_data (torch.Tensor): Input data with shape ``(batch, time_steps, Nout, n_synapses)``
+            vmem (torch.Tensor): Initial membrane potentials ``(batch, Nout)``
+            isyn (torch.Tensor): Initial synaptic currents ``(batch, Nout, n_synapses)``
+            noise_ts (torch.Tensor): Membrane noise ``(batch, time_steps, Nout)``
+
+        Returns:
+            torch.Tensor: Out of spikes with the shape (batch, time_steps, Nout)
+        """
+        n_batches, n_timesteps = input_data.shape[:2]
+        alpha = self.alpha.to(vmem.device)
+        beta = self.beta.to(isyn.device)
+
+        # - Solve synaptic currents over all time-steps, with initial state folded into the first step
+        syn_input = torch.cat(
+            (input_data[:, :1] + isyn.unsqueeze(1), input_data[:, 1:]), 1
+        )
+        isyn_ts = linear_scan(beta, syn_input * beta)
+
+        # - Compute the membrane drive over all time-steps
+        vmem_drive = isyn_ts.sum(3) + noise_ts + self.bias
+
+        # - Loop over time for spike generation and reset
+        for t in range(n_timesteps):
+            vmem = vmem * alpha + vmem_drive[:, t]
+
+            # - Spike generation
+            spikes = self.spike_generation_fn(
+                vmem, self.threshold, self.learning_window, self.max_spikes_per_dt
+            )
+
+            # - Apply subtractive membrane reset
+            vmem = vmem - spikes * self.threshold
+
+            # - Maintain state record
+            if self._record:
+                self._record_dict["vmem"][:, t] = vmem
+
+            # - Maintain output spike record
+            self._record_dict["spikes"][:, t] = spikes
+
+        if self._record:
+            self._record_dict["isyn"] = isyn_ts
+
+        # - Update states
+        self.vmem = vmem[0].detach()
+        if n_timesteps > 0:
+            self.isyn = isyn_ts[0, -1].detach()
+            self.spikes = spikes[0].detach()
+
+        # - Return output
+        return self._record_dict["spikes"]
@@ -79,6 +79,50 @@ def Constant(obj: Any) -> RP_Constant:
     return obj
 
 
+def _copy_mutable(data: Any) -> Any:
+    """
+    Copy data that can be modified in place (numpy arrays, torch tensors and python containers); return immutable data unchanged
+    """
+    if isinstance(data, np.ndarray):
+        return data.copy()
+    elif isinstance(data, Tensor):
+        return data.detach().clone()
+    elif isinstance(data, (list, dict, set)):
+        return deepcopy(data)
+    else:
+        return data
+
+
+class _InitData:
+    """
+    Initialisation function that restores concrete initialisation data
+
+    Holds a reference to the initialisation data, without copying. Use :py:meth:`.snapshot` to take a private copy of data that could be modified in place. Immutable data (e.g. Jax arrays) is never copied.
+    """
+
+    def __init__(self, data: Any):
+        self.data = data
+
+    def __call__(self, _) -> Any:
+        return _copy_mutable(self.data)
+
+    def snapshot(self) -> "_InitData":
+        """
+        Return an initialisation function with a private copy of any mutable data
+        """
+        data = _copy_mutable(self.data)
+        return self if data is self.data else _InitData(data)
+
+    def __copy__(self) -> "_InitData":
+        return self
+
+    def __deepcopy__(self, memo) -> "_InitData":
+        return self
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.data})"
+
+
 # -- Parameter classes
 class ParameterBase:
     """
@@ -198,7 +242,8 @@ class ParameterBase:
                 self.shape = np.shape(self.data)
 
         # - Initialise data, if not provided
-        if self.data is None:
+        concrete_data = self.data is not None
+        if not concrete_data:
             # - Get the concrete shape to use (by default: first shape option in the list)
             self.shape = self.shape[0]
 
@@ -209,15 +254,16 @@ class ParameterBase:
 
             # - Call the `init_func`
             self.data = self.init_func(self.shape)
-        else:
-            # - If concrete initialisation data is provided, then override the `init_func`
-            data_copy = deepcopy(self.data)
-            self.init_func = lambda _: data_copy
 
         # - Cast the data using the cast function
         if self.cast_fn is not None:
             self.data = self.cast_fn(self.data)
 
+        # - If concrete initialisation data is provided, then override the `init_func`
+        # - The data is only referenced here; modules take a snapshot on registration
+        if concrete_data:
+            self.init_func = _InitData(self.data)
+
     def __repr__(self):
         return f"{type(self).__name__}(data={self.data}, family={self.family}, init_func={self.init_func}, shape={self.shape})"
 
@@ -7,8 +7,9 @@ Classes to manage time series data
 # - Built-ins
 import copy
 import collections.abc
+import json
 from pathlib import Path
-from tempfile import TemporaryFile
+from tempfile import TemporaryDirectory
 from rockpool.utilities.backend_management import backend_available
 
 from typing import (
@@ -17,6 +18,7 @@ from typing import (
     Tuple,
     Optional,
     Iterable,
+    Iterator,
     TypeVar,
     Type,
     Dict,
@@ -28,6 +30,7 @@ from warnings import warn
 # - Third party libraries
 import numpy as np
 import scipy.interpolate as spint
+import scipy.sparse as spsparse
 
 # - Plotting backends
 _global_plotting_backend = None
@@ -57,7 +60,10 @@ __all__ = [
     "TimeSeries",
     "TSEvent",
     "TSContinuous",
+    "TSExpression",
     "TSDictOnDisk",
+    "TSEventBuilder",
+    "TSChunkedStore",
     "set_global_ts_plotting_backend",
     "get_global_ts_plotting_backend",
     "load_ts_from_file",
@@ -73,6 +79,24 @@ ArrayLike = Union[np.ndarray, List, Tuple]
 _TOLERANCE_ABSOLUTE = 1e-9
 _TOLERANCE_RELATIVE = 1e-6
 
+# - Number of raster elements to process at once when converting rasters to events
+_RASTER_BLOCK_ELEMENTS = 2**22
+
+# - Plotting level of detail: maximum number of points per channel for continuous series, and
+#   maximum number of events for event series, before plots are summarised
+_PLOT_MAX_POINTS = 4000
+_PLOT_MAX_EVENTS = 100000
+# - Number of time bins in event density plots
+_PLOT_DENSITY_BINS = 1000
+# - Smallest block of samples summarised in the cached min / max pyramid
+_LOD_BASE_BLOCK = 16
+
+# - Number of sample elements evaluated at once by lazy `TSContinuous` expressions
+_EXPRESSION_BLOCK_ELEMENTS = 2**16
+
+# - Maximum deviation of sample times from a uniform clock, relative to the clock period
+_CLOCK_TOLERANCE = 1e-3
+
 
 # - Global plotting backend
 def set_global_ts_plotting_backend(backend: Union[str, None], verbose=True):
@@ -207,6 +231,8 @@ def load_ts_from_file(
             periodic=loaded_data["periodic"].item(),
             num_channels=loaded_data["num_channels"].item(),
             name=name,
+            dtype_times=loaded_data["times"].dtype,
+            dtype_channels=loaded_data["channels"].dtype,
         )
 
         if "trial_start_times" in loaded_data:
@@ -218,6 +244,212 @@ def load_ts_from_file(
     return ts
 
 
+def _min_channel_dtype(num_channels: int) -> np.dtype:
+    """
+    Return the smallest unsigned integer type that can represent channel IDs ``0 .. num_channels - 1``
+
+    :param int num_channels:    Number of channels to represent
+
+    :return np.dtype: The smallest sufficient unsigned integer type
+    """
+    return np.min_scalar_type(max(int(num_channels) - 1, 0))
+
+
+def _fit_channel_dtype(
+    dtype: Union[str, type, np.dtype], num_channels: int
+) -> np.dtype:
+    """
+    Promote an integer channel type if necessary, so that it can represent ``num_channels`` channels
+
+    :param Union[str, type, np.dtype] dtype:    Current channel data type
+    :param int num_channels:                    Number of channels to represent
+
+    :return np.dtype: ``dtype``, or a wider integer type if ``dtype`` is not sufficient
+    """
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.integer):
+        return np.dtype(int)
+
+    if np.iinfo(dtype).max < num_channels - 1:
+        return np.promote_types(dtype, _min_channel_dtype(num_channels))
+
+    return dtype
+
+
+def _merged_event_dtypes(
+    series: List["TSEvent"], num_channels: int
+) -> Tuple[np.dtype, np.dtype]:
+    """
+    Determine the time and channel data types for events combined from several series
+
+    Empty series are ignored, so that combining with an empty default series preserves compact data types.
+
+    :param List[TSEvent] series:    Series that are combined
+    :param int num_channels:        Number of channels of the combined series
+
+    :return Tuple[np.dtype, np.dtype]: ``(dtype_times, dtype_channels)``
+    """
+    non_empty = [s for s in series if len(s) > 0] or series
+    dtype_times = np.result_type(*[s.times.dtype for s in non_empty])
+    dtype_channels = np.result_type(*[s.channels.dtype for s in non_empty])
+    return dtype_times, _fit_channel_dtype(dtype_channels, num_channels)
+
+
+def _merge_sorted_events(
+    times_list: List[np.ndarray], channels_list: List[np.ndarray]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Merge several lists of events, each sorted in time, into a single sorted list
+
+    Lists that follow each other in time are merged by concatenation alone, in ``O(N)``. Otherwise the sorted runs are merged with a stable sort, which detects the existing runs and costs ``O(N log k)`` for ``k`` lists. Simultaneous events are ordered by list.
+
+    :param List[np.ndarray] times_list:     Event times for each list, each sorted in time
+    :param List[np.ndarray] channels_list:  Event channels for each list
+
+    :return Tuple[np.ndarray, np.ndarray]: ``(times, channels)`` of the merged events
+    """
+    times = np.concatenate(times_list)
+    channels = np.concatenate(channels_list)
+
+    # - Lists which follow each other in time need no sorting
+    non_empty = [t for t in times_list if t.size > 0]
+    if all(prev[-1] <= next[0] for prev, next in zip(non_empty[:-1], non_empty[1:])):
+        return times, channels
+
+    # - Merge sorted runs
+    order = np.argsort(times, kind="stable")
+    return times[order], channels[order]
+
+
+def _ceil_to_dtype(
+    values: Union[float, ArrayLike], dtype: Union[str, type, np.dtype]
+) -> np.ndarray:
+    """
+    Round values up to the nearest value representable in a floating-point type
+
+    Comparisons of an array of type ``dtype`` against the rounded values are exact, such that ``times >= value`` iff ``times >= _ceil_to_dtype(value, times.dtype)``. This permits bisection on compact time arrays without converting them.
+
+    :param Union[float, ArrayLike] values:      Values to round
+    :param Union[str, type, np.dtype] dtype:    Floating-point type to round to
+
+    :return np.ndarray: Rounded values of type ``dtype``
+    """
+    values = np.asarray(values, float)
+    rounded = values.astype(dtype)
+    return np.where(
+        rounded < values, np.nextafter(rounded, np.array(np.inf, dtype)), rounded
+    )
+
+
+def _detect_clock(times: np.ndarray) -> Optional[float]:
+    """
+    Determine whether a vector of sample times lies on a uniform clock
+
+    :param np.ndarray times:    Sorted vector of sample times
+
+    :return Optional[float]:    The clock period ``dt`` if every sample time lies within ``_CLOCK_TOLERANCE * dt`` of ``times[0] + n * dt``, otherwise ``None``
+    """
+    if np.size(times) < 2:
+        return None
+
+    dt = (times[-1] - times[0]) / (np.size(times) - 1)
+    if not (np.isfinite(dt) and dt > 0):
+        return None
+
+    # - Compare against an ideal clock, rather than successive differences, to bound accumulated drift.
+    #   Work in blocks, to avoid full-size temporary arrays for long (e.g. memory-mapped) series
+    block_size = 2**16
+    for start in range(0, np.size(times), block_size):
+        block = times[start : start + block_size]
+        ideal = (np.arange(block.size) + start) * dt + times[0]
+        if np.max(np.abs(block - ideal)) > _CLOCK_TOLERANCE * dt:
+            return None
+
+    return float(dt)
+
+
+# - Arithmetic operations on `TSContinuous` samples
+_SAMPLE_OPERATIONS = {
+    "add": np.add,
+    "sub": np.subtract,
+    "mul": np.multiply,
+    "truediv": np.true_divide,
+    "floordiv": np.floor_divide,
+    "pow": np.power,
+}
+
+
+def _samples_operation(
+    operation: str,
+    samples: np.ndarray,
+    other: Union[np.ndarray, float],
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    Apply an arithmetic operation to `TSContinuous` samples, handling `NaN` values
+
+    For addition and subtraction, `NaN` values are treated as zero, unless they are present in both operands. For all other operations, the result is `NaN` wherever either operand is `NaN`. Operands without `NaN` values are processed in a single pass.
+
+    :param str operation:                   One of ``"add"``, ``"sub"``, ``"mul"``, ``"truediv"``, ``"floordiv"`` or ``"pow"``
+    :param np.ndarray samples:              First operand
+    :param Union[np.ndarray, float] other:  Second operand, broadcastable to ``samples``
+    :param Optional[np.ndarray] out:        Array in which to store the result. May be ``samples``, to operate in place. Default: ``None``, allocate a new array
+
+    :return np.ndarray: The result of the operation
+    """
+    ufunc = _SAMPLE_OPERATIONS[operation]
+
+    # - A sum is `NaN` if any element is `NaN`, without allocating a mask
+    if not (np.isnan(np.sum(samples)) or np.isnan(np.sum(other))):
+        return ufunc(samples, other, out=out)
+
+    is_nan_samples = np.isnan(samples)
+    is_nan_other = np.isnan(other)
+
+    if operation in ("add", "sub"):
+        # - Treat NaNs as zero, unless present in both operands
+        result = ufunc(
+            np.where(is_nan_samples, 0.0, samples),
+            np.where(is_nan_other, 0.0, other),
+            out=out,
+        )
+        is_nan_result = np.logical_and(is_nan_samples, is_nan_other)
+    else:
+        # - Propagate NaNs
+        result = ufunc(samples, other, out=out)
+        is_nan_result = np.logical_or(is_nan_samples, is_nan_other)
+
+    result[np.broadcast_to(is_nan_result, result.shape)] = np.nan
+    return result
+
+
+def _raster_event_blocks(
+    raster: Union[np.ndarray, "spsparse.spmatrix"]
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Find the non-zero entries of a 2D raster, in blocks of rows
+
+    Dense rasters are scanned in blocks of ``_RASTER_BLOCK_ELEMENTS`` elements, to bound the size of temporary arrays. Sparse rasters are converted to CSR format and returned as a single block.
+
+    :param Union[np.ndarray, spsparse.spmatrix] raster: A dense or sparse ``(T, C)`` raster
+
+    :return Iterator[Tuple[int, np.ndarray, np.ndarray, np.ndarray]]: Tuples ``(start, rows, cols, values)`` for each block, where ``rows`` are relative to the first row ``start`` of the block, and ``values`` are the non-zero entries in row-major order
+    """
+    if spsparse.issparse(raster):
+        # - Canonical CSR format, without modifying the original matrix
+        raster = spsparse.csr_matrix(raster, copy=True)
+        raster.sum_duplicates()
+        rows = np.repeat(np.arange(raster.shape[0]), np.diff(raster.indptr))
+        yield 0, rows, raster.indices, raster.data
+
+    else:
+        block_rows = max(_RASTER_BLOCK_ELEMENTS // max(raster.shape[1], 1), 1)
+        for start in range(0, raster.shape[0], block_rows):
+            block = raster[start : start + block_rows]
+            rows, cols = np.nonzero(block)
+            yield start, rows, cols, block[rows, cols]
+
+
 def _extend_periodic_times(
     t_start: float, t_stop: float, series: "TimeSeries"
 ) -> np.ndarray:
@@ -799,38 +1031,67 @@ class TSContinuous(TimeSeries):
         stagger: Optional[Union[float, int]] = None,
         skip: Optional[int] = None,
         dt: Optional[float] = None,
+        max_points: Optional[int] = _PLOT_MAX_POINTS,
         *args,
         **kwargs,
     ):
         """
         Visualise a time series on a line plot
 
+        If neither ``times`` nor ``dt`` are provided and the series contains more than ``max_points`` samples, the plot shows the min / max envelope of the samples over about ``max_points`` points per channel (see :py:meth:`.envelope`). When plotting with matplotlib, the envelope is recomputed for the visible time range when the plot is zoomed.
+
         :param Optional[ArrayLike] times: Time base on which to plot. Default: time base of time series
         :param Optional target:  Axes (or other) object to which plot will be added.
         :param Optional[ArrayLike] channels:  Channels of the time series to be plotted.
         :param Optional[float] stagger: Stagger to use to separate each series when plotting multiple series. (Default: `None`, no stagger)
         :param Optional[int] skip: Skip several series when plotting multiple series
         :param Optiona[float] dt: Resample time series to this timestep before plotting
+        :param Optional[int] max_points: Maximum number of points to plot per channel, before plotting a min / max envelope. ``None`` to always plot all samples. Default: 4000
 
         :return: Plot object. Either holoviews Layout, or matplotlib plot
         """
+        use_envelope = (
+            times is None
+            and dt is None
+            and max_points is not None
+            and self.times.size > max_points
+        )
+
         if dt is not None and times is None:
             times = np.arange(self.t_start, self.t_stop, dt)
             samples = self(times)
         elif times is not None:
             samples = self(times)
+        elif use_envelope:
+            times, samples = self.envelope(max_points=max_points)
         else:
             times = self.times
             samples = self.samples
 
-        if channels is not None:
-            samples = samples[:, channels]
+        def select_channels(samples: np.ndarray) -> np.ndarray:
+            if channels is not None:
+                samples = samples[:, channels]
+
+            if skip is not None and skip != 0:
+                samples = samples[:, ::skip]
+
+            if stagger is not None and stagger != 0:
+                samples = samples + np.arange(0, samples.shape[1] * stagger, stagger)
 
-        if skip is not None and skip != 0:
-            samples = samples[:, ::skip]
+            return samples
 
-        if stagger is not None and stagger != 0:
-            samples = samples + np.arange(0, samples.shape[1] * stagger, stagger)
+        samples = select_channels(samples)
+
+        def connect_envelope(ax: "mpl.axes.Axes", lines: List["mpl.lines.Line2D"]):
+            # - Recompute the envelope for the visible time range on zooming
+            def update_envelope(ax):
+                t_start, t_stop = ax.get_xlim()
+                env_times, env_samples = self.envelope(t_start, t_stop, max_points)
+                for line, data in zip(lines, select_channels(env_samples).T):
+                    line.set_data(env_times, data)
+
+            if use_envelope:
+                ax.callbacks.connect("xlim_changed", update_envelope)
 
         if target is None:
             # - Determine plotting backend
@@ -879,7 +1140,9 @@ class TSContinuous(TimeSeries):
                 ax.set_xlim(times[0], times[-1])
 
                 # - Plot the curves
-                return ax.plot(times, samples, **kwargs)
+                lines = ax.plot(times, samples, **kwargs)
+                connect_envelope(ax, lines)
+                return lines
 
             else:
                 raise RuntimeError(
@@ -904,7 +1167,7 @@ class TSContinuous(TimeSeries):
             elif _MPL_AVAILABLE and isinstance(target, mpl.axes.Axes):
                 # - Add `self.name` as label only if a label is not already present
                 kwargs["label"] = kwargs.get("label", self.name)
-                target.plot(times, samples, **kwargs)
+                connect_envelope(target, target.plot(times, samples, **kwargs))
                 return target
             else:
                 raise TypeError(
@@ -913,6 +1176,94 @@ class TSContinuous(TimeSeries):
                     + "the corresponding backend must be installed in your environment."
                 )
 
+    def envelope(
+        self,
+        t_start: Optional[float] = None,
+        t_stop: Optional[float] = None,
+        max_points: int = _PLOT_MAX_POINTS,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Summarise the samples in a time range by their min / max envelope, for plotting
+
+        The samples between ``t_start`` and ``t_stop`` are divided into consecutive blocks, such that about ``max_points`` points are returned per channel. Each block is represented by two points: the minimum of the block at the time of its first sample, and the maximum of the block at the time of its last sample. Plotting the envelope therefore shows the full range of the samples at any zoom level.
+
+        Block summaries are computed from a pyramid of min / max values, which is cached on this series and rebuilt when the samples change, so that repeated calls for different time ranges are fast.
+
+        :param Optional[float] t_start: Start of the time range. Default: `.t_start`
+        :param Optional[float] t_stop:  End of the time range. Default: `.t_stop`
+        :param int max_points:          Approximate maximum number of points to return per channel. Default: 4000
+
+        :return (np.ndarray, np.ndarray): ``(times, samples)`` of the envelope, where ``samples`` has shape ``(T, C)``. If the time range contains at most ``max_points`` samples, these are returned unchanged
+        """
+        t_start = self.t_start if t_start is None else t_start
+        t_stop = self.t_stop if t_stop is None else t_stop
+
+        # - Include the last sample before the time range, which is held at `t_start`
+        idx_start = max(np.searchsorted(self.times, t_start, side="right") - 1, 0)
+        idx_stop = np.searchsorted(self.times, t_stop, side="right")
+        num_samples = idx_stop - idx_start
+
+        if num_samples <= max_points:
+            return self.times[idx_start:idx_stop], self.samples[idx_start:idx_stop]
+
+        # - Smallest block size (a power of two) for which the envelope fits in `max_points`
+        block = 2 ** int(np.ceil(np.log2(2 * num_samples / max(max_points, 2))))
+
+        if block < _LOD_BASE_BLOCK:
+            # - Summarise the time range directly
+            block_starts = np.arange(idx_start - idx_start % block, idx_stop, block)
+            samples = self.samples[: block_starts[-1] + block]
+            mins = np.minimum.reduceat(samples, block_starts, axis=0)
+            maxs = np.maximum.reduceat(samples, block_starts, axis=0)
+
+        else:
+            # - Look up block summaries in the pyramid
+            if self._lod_pyramid is None:
+                self._lod_pyramid = self._build_lod_pyramid()
+
+            level = min(
+                int(np.log2(block // _LOD_BASE_BLOCK)), len(self._lod_pyramid) - 1
+            )
+            block = _LOD_BASE_BLOCK * 2**level
+            block_starts = np.arange(idx_start - idx_start % block, idx_stop, block)
+            mins, maxs = self._lod_pyramid[level]
+            mins = mins[block_starts // block]
+            maxs = maxs[block_starts // block]
+
+        # - Place the minimum of each block at its first sample, and the maximum at its last sample
+        block_stops = np.minimum(block_starts + block, self.times.size) - 1
+        times = np.stack([self.times[block_starts], self.times[block_stops]], axis=1)
+        samples = np.stack([mins, maxs], axis=1)
+
+        return times.flatten(), samples.reshape(-1, self.num_channels)
+
+    def _build_lod_pyramid(self) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Build a pyramid of min / max summaries of the samples, for fast plotting at any level of detail
+
+        :return List[Tuple[np.ndarray, np.ndarray]]: List of ``(mins, maxs)`` for blocks of ``_LOD_BASE_BLOCK * 2 ** level`` samples, for each level until a single block covers all samples
+        """
+        block_starts = np.arange(0, self.times.size, _LOD_BASE_BLOCK)
+        pyramid = [
+            (
+                np.minimum.reduceat(self.samples, block_starts, axis=0),
+                np.maximum.reduceat(self.samples, block_starts, axis=0),
+            )
+        ]
+
+        # - Each level combines pairs of blocks from the level below
+        while pyramid[-1][0].shape[0] > 1:
+            mins, maxs = pyramid[-1]
+            pairs = np.arange(0, mins.shape[0], 2)
+            pyramid.append(
+                (
+                    np.minimum.reduceat(mins, pairs, axis=0),
+                    np.maximum.reduceat(maxs, pairs, axis=0),
+                )
+            )
+
+        return pyramid
+
     def print(
         self,
         full: bool = False,
@@ -1061,9 +1412,9 @@ class TSContinuous(TimeSeries):
 
         :return TSContinuous:       clipped_series:     New TSContinuous clipped to bounds
         """
-        # - Create a new time series, or modify this time series
+        # - Create a new time series, or modify this time series. Arrays are replaced by `resample`, so a shallow copy suffices
         if not inplace:
-            clipped_series = self.copy()
+            clipped_series = copy.copy(self)
         else:
             clipped_series = self
 
@@ -1082,15 +1433,14 @@ class TSContinuous(TimeSeries):
             else clipped_series.times
         )
 
-        # - Mark which times lie within bounds
-        times_in_limits: np.ndarray = np.logical_and(
-            times_to_choose >= t_start, times_to_choose < t_stop
+        # - Find the sorted times which lie within bounds by bisection
+        idx_start = np.searchsorted(times_to_choose, t_start, side="left")
+        # - Include samples at time `t_stop` if requested
+        idx_stop = np.searchsorted(
+            times_to_choose, t_stop, side="right" if include_stop else "left"
         )
-        if include_stop:
-            # - Include samples at time `t_stop`
-            times_in_limits[times_to_choose == t_stop] = True
         # - Pick matching times
-        times: np.ndarray = times_to_choose[times_in_limits]
+        times: np.ndarray = np.array(times_to_choose[idx_start:idx_stop])
         if sample_limits:
             add_start: bool = times.size == 0 or times[0] > t_start
             if not clipped_series.contains(t_start):
@@ -1132,8 +1482,9 @@ class TSContinuous(TimeSeries):
         :param bool inplace:                    True -> Conduct operation in-place (Default: False; create a copy)
         :return TSContinuous:                   Time series resampled to new time base and with desired channels.
         """
+        # - Arrays are replaced below, so a shallow copy suffices
         if not inplace:
-            resampled_series = self.copy()
+            resampled_series = copy.copy(self)
         else:
             resampled_series = self
 
@@ -1421,12 +1772,19 @@ class TSContinuous(TimeSeries):
 
     ## -- Internal methods
 
-    def _create_interpolator(self):
+    def _create_interpolator(self, reuse_clock: bool = False):
         """
         Build an interpolator for the samples in this TimeSeries.
 
         Replaces the current interpolator.
+
+        :param bool reuse_clock:    If ``True``, keep the detected sample clock and cached plot summaries. Only valid if the sample times and values are unchanged. Default: ``False``
         """
+        # - Detect uniformly clocked samples, and invalidate cached plot summaries
+        if not reuse_clock:
+            self._clock_dt = _detect_clock(self._times)
+            self._lod_pyramid = None
+
         if np.size(self.times) == 0:
             self.interp = lambda t: None
 
@@ -1447,6 +1805,14 @@ class TSContinuous(TimeSeries):
 
             self.interp = single_sample
 
+        elif (
+            self._clock_dt is not None
+            and self._interp_kind in ("previous", "linear")
+            and isinstance(self._fill_value, str)
+        ):
+            # - Use direct indexing into uniformly clocked samples
+            self.interp = self._interp_clocked
+
         else:
             # - Construct interpolator
             self.interp = spint.interp1d(
@@ -1460,6 +1826,57 @@ class TSContinuous(TimeSeries):
                 fill_value=self._fill_value,
             )
 
+    def _interp_clocked(self, times: Union[int, float, ArrayLike]) -> np.ndarray:
+        """
+        Interpolate uniformly clocked samples by direct indexing
+
+        Equivalent to the ``scipy.interpolate.interp1d`` interpolator for ``interp_kind`` ``"previous"`` or ``"linear"`` with ``fill_value="extrapolate"``, but with O(1) cost per requested time point. The sample index is estimated from the clock period, then corrected against the stored sample times, so that the result does not depend on rounding of the estimate.
+
+        :param ArrayLike times: Array of ``T`` desired interpolated time points
+
+        :return np.ndarray:     Array of interpolated values, with shape ``(T, N)``
+        """
+        times = np.atleast_1d(np.asarray(times, float)).flatten()
+        sample_times = self._times
+        num_samples = sample_times.size
+
+        # - Non-finite time points are sampled as `NaN`
+        is_finite = np.isfinite(times)
+        finite_times = np.where(is_finite, times, sample_times[0])
+
+        # - Estimate the number of samples at or before each time point
+        est = np.floor((finite_times - sample_times[0]) / self._clock_dt) + 1
+        num_before = np.clip(est, 0, num_samples).astype(np.intp)
+
+        # - Correct the estimate against the stored sample times
+        is_linear = self._interp_kind == "linear"
+        next_times = sample_times[np.minimum(num_before, num_samples - 1)]
+        num_before += (num_before < num_samples) & (
+            (next_times < finite_times) if is_linear else (next_times <= finite_times)
+        )
+        prev_times = sample_times[np.maximum(num_before - 1, 0)]
+        num_before -= (num_before > 0) & (
+            (prev_times >= finite_times) if is_linear else (prev_times > finite_times)
+        )
+
+        if is_linear:
+            # - Linear interpolation and extrapolation between neighbouring samples
+            idx_lo = np.clip(num_before - 1, 0, num_samples - 2)
+            t_lo = sample_times[idx_lo]
+            y_lo = self._samples[idx_lo]
+            slope = (self._samples[idx_lo + 1] - y_lo) / (
+                sample_times[idx_lo + 1] - t_lo
+            )[:, None]
+            samples = slope * (finite_times - t_lo)[:, None] + y_lo
+
+        else:
+            # - Sample-and-hold; time points before the first sample are undefined
+            samples = self._samples[np.maximum(num_before - 1, 0)]
+            samples[num_before == 0] = np.nan
+
+        samples[~is_finite] = np.nan
+        return samples
+
     def _interpolate(self, times: Union[int, float, ArrayLike]) -> np.ndarray:
         """
         Interpolate the time series to the provided time points
@@ -1545,23 +1962,111 @@ class TSContinuous(TimeSeries):
         # - Return the sampled data
         return samples
 
-    def _compatible_shape(self, other_samples) -> np.ndarray:
+    def _compatible_shape(self, other_samples, copy: bool = True) -> np.ndarray:
         """
         Attempt to make ``other_samples`` a compatible shape to ``self.samples``.
 
         :param ArrayLike other_samples: Samples to convert
+        :param bool copy:               If ``False``, return a read-only broadcast view of ``other_samples``, without allocating a full-size array. Default: ``True``
 
         :return np.ndarray:             Array the same shape as ``self.samples``
         :raises:                        ValueError if broadcast fails
         """
         try:
-            return np.broadcast_to(other_samples, self.samples.shape).copy()
+            other_samples = np.broadcast_to(other_samples, self.samples.shape)
         except ValueError:
             raise ValueError(
-                f"TSContinuous `{self.name}`: Input data (shape {other_samples.shape})"
+                f"TSContinuous `{self.name}`: Input data (shape {np.shape(other_samples)})"
                 f" could not be broadcast to samples shape ({self.samples.shape})."
             )
 
+        return other_samples.copy() if copy else other_samples
+
+    def _other_samples(self, other: Union["TSContinuous", "TSExpression", Any]):
+        """
+        Sample the operand of an arithmetic operation on the time base of this series
+
+        Series with the same time base as ``self`` are used directly, without interpolation. Lazy expressions are evaluated.
+
+        :param Union[TSContinuous, TSExpression, Any] other: Operand
+
+        :return np.ndarray: A read-only view of the samples of ``other``, with the same shape as ``self.samples``
+        """
+        if isinstance(other, TSExpression):
+            other = other.evaluate()
+
+        if isinstance(other, TSContinuous):
+            if other.times is self.times or np.array_equal(other.times, self.times):
+                other = other.samples
+            else:
+                other = other(self.times)
+
+        return self._compatible_shape(other, copy=False)
+
+    def _apply(
+        self, operation: str, other: Union["TSContinuous", "TSExpression", Any]
+    ) -> "TSContinuous":
+        """
+        Apply an arithmetic operation, returning a new series
+
+        The samples of the new series are computed in a single pass, without first copying this series.
+
+        :param str operation:   Operation (see `_samples_operation`)
+        :param Union[TSContinuous, TSExpression, Any] other: Second operand
+
+        :return TSContinuous: The result of the operation
+        """
+        # - Operations involving lazy expressions remain lazy
+        if isinstance(other, TSExpression):
+            return NotImplemented
+
+        return self._with_samples(
+            _samples_operation(operation, self.samples, self._other_samples(other))
+        )
+
+    def _apply_inplace(
+        self, operation: str, other: Union["TSContinuous", "TSExpression", Any]
+    ) -> "TSContinuous":
+        """
+        Apply an arithmetic operation in place, reusing the sample buffer of this series
+
+        :param str operation:   Operation (see `_samples_operation`)
+        :param Union[TSContinuous, TSExpression, Any] other: Second operand
+
+        :return TSContinuous: ``self``
+        """
+        _samples_operation(
+            operation, self._samples, self._other_samples(other), out=self._samples
+        )
+
+        # - Re-create interpolator
+        self._create_interpolator()
+        return self
+
+    def _with_samples(self, samples: np.ndarray) -> "TSContinuous":
+        """
+        Return a copy of this series with new samples, without copying the current samples
+
+        :param np.ndarray samples:  New samples, on the time base of this series
+
+        :return TSContinuous: A new series
+        """
+        new_series = copy.copy(self)
+        new_series._times = self._times.copy()
+        new_series._samples = samples
+        new_series._create_interpolator()
+        return new_series
+
+    def lazy(self) -> "TSExpression":
+        """
+        Begin a lazy arithmetic expression on this series
+
+        Arithmetic operations on the returned :py:class:`.TSExpression` are recorded, and evaluated in a single pass over blocks of samples when :py:meth:`.TSExpression.evaluate` is called.
+
+        :return TSExpression: A lazy expression containing this series
+        """
+        return TSExpression(self)
+
     ## -- Magic methods
 
     def __call__(self, times: Union[int, float, ArrayLike]):
@@ -1705,90 +2210,40 @@ class TSContinuous(TimeSeries):
     # - Addition
 
     def __add__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        return self.copy().__iadd__(other_samples)
+        return self._apply("add", other_samples)
 
     def __radd__(self, other_samples: TimeSeries) -> TimeSeries:
         return self + other_samples
 
     def __iadd__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        if isinstance(other_samples, TSContinuous):
-            other_samples = self._compatible_shape(other_samples(self.times))
-        else:
-            other_samples = self._compatible_shape(other_samples)
-
-        # - Treat NaNs as zero
-        is_nan_self = np.isnan(self.samples)
-        is_nan_other = np.isnan(other_samples)
-        self.samples[is_nan_self] = 0
-        other_samples[is_nan_other] = 0
-
-        # - Perform addition
-        new_samples = self.samples + other_samples
-        self.samples = new_samples
-
-        # - Fill in nans
-        self.samples[np.logical_and(is_nan_self, is_nan_other)] = np.nan
-
-        return self
+        return self._apply_inplace("add", other_samples)
 
     # - Subtraction
 
     def __sub__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        return self.copy().__isub__(other_samples)
+        return self._apply("sub", other_samples)
 
     def __rsub__(self, other_samples: TimeSeries) -> TimeSeries:
         return -(self - other_samples)
 
     def __isub__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        if isinstance(other_samples, TSContinuous):
-            other_samples = self._compatible_shape(other_samples(self.times))
-        else:
-            other_samples = self._compatible_shape(other_samples)
-
-        # - Treat NaNs as zero
-        is_nan_self = np.isnan(self.samples)
-        is_nan_other = np.isnan(other_samples)
-        self.samples[is_nan_self] = 0
-        other_samples[is_nan_other] = 0
-
-        # - Perform subtraction
-        self.samples -= other_samples
-
-        # - Fill in nans
-        self.samples[np.logical_and(is_nan_self, is_nan_other)] = np.nan
-
-        return self
+        return self._apply_inplace("sub", other_samples)
 
     # - Multiplication
 
     def __mul__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        return self.copy().__imul__(other_samples)
+        return self._apply("mul", other_samples)
 
     def __rmul__(self, other_samples: TimeSeries) -> TimeSeries:
         return self * other_samples
 
     def __imul__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        if isinstance(other_samples, TSContinuous):
-            other_samples = self._compatible_shape(other_samples(self.times))
-        else:
-            other_samples = self._compatible_shape(other_samples)
-
-        # - Propagate NaNs
-        is_nan_self = np.isnan(self.samples)
-        is_nan_other = np.isnan(other_samples)
-
-        # - Perform multiplication
-        self.samples *= other_samples
-
-        # - Fill in nans
-        self.samples[np.logical_or(is_nan_self, is_nan_other)] = np.nan
-
-        return self
+        return self._apply_inplace("mul", other_samples)
 
     # - Division
 
     def __truediv__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        return self.copy().__itruediv__(other_samples)
+        return self._apply("truediv", other_samples)
 
     def __rtruediv__(self, other_samples: TimeSeries) -> TimeSeries:
         self_copy = self.copy()
@@ -1796,31 +2251,12 @@ class TSContinuous(TimeSeries):
         return self_copy * other_samples
 
     def __itruediv__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        if isinstance(other_samples, TSContinuous):
-            other_samples = self._compatible_shape(
-                np.reshape(other_samples(self.times), (np.size(self.times), -1))
-            )
-        else:
-            other_samples = self._compatible_shape(other_samples)
-
-        # - Propagate NaNs
-        is_nan_self = np.isnan(self.samples)
-        is_nan_other = np.isnan(other_samples)
-
-        # - Perform division
-        self.samples /= other_samples
-
-        # - Fill in nans
-        self.samples[np.logical_or(is_nan_self, is_nan_other)] = np.nan
-
-        # - Re-create interpolator
-        self._create_interpolator()
-        return self
+        return self._apply_inplace("truediv", other_samples)
 
     # - Floor division
 
     def __floordiv__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        return self.copy().__ifloordiv__(other_samples)
+        return self._apply("floordiv", other_samples)
 
     def __rfloordiv__(self, other_samples: TimeSeries) -> TimeSeries:
         self_copy = self.copy()
@@ -1828,27 +2264,12 @@ class TSContinuous(TimeSeries):
         return self_copy // (1 / other_samples)
 
     def __ifloordiv__(self, other_samples: Union[TimeSeries, Any]) -> TimeSeries:
-        if isinstance(other_samples, TSContinuous):
-            other_samples = self._compatible_shape(other_samples(self.times))
-        else:
-            other_samples = self._compatible_shape(other_samples)
-
-        # - Propagate NaNs
-        is_nan_self = np.isnan(self.samples)
-        is_nan_other = np.isnan(other_samples)
-
-        # - Perform division
-        self.samples //= other_samples
-
-        # - Fill in nans
-        self.samples[np.logical_or(is_nan_self, is_nan_other)] = np.nan
-
-        return self
+        return self._apply_inplace("floordiv", other_samples)
 
     # - Matrix multiplication
 
     def __matmul__(self, matrix) -> TimeSeries:
-        return self.copy().__imatmul__(matrix)
+        return self._with_samples(self.samples @ matrix)
 
     def __rmatmul__(self, matrix) -> TimeSeries:
         raise NotImplementedError
@@ -1860,7 +2281,7 @@ class TSContinuous(TimeSeries):
     # - Exponentiation
 
     def __pow__(self, exponent: Union[TimeSeries, Any]) -> TimeSeries:
-        return self.copy().__ipow__(exponent)
+        return self._apply("pow", exponent)
 
     def __rpow__(self, base: Union[np.ndarray, Any]) -> TimeSeries:
         new_series = self.copy()
@@ -1880,36 +2301,17 @@ class TSContinuous(TimeSeries):
         return new_series
 
     def __ipow__(self, exponent: Union[TimeSeries, Any]) -> TimeSeries:
-        if isinstance(exponent, TSContinuous):
-            exponent = self._compatible_shape(exponent(self.times))
-        else:
-            exponent = self._compatible_shape(exponent)
-
-        # - Propagate NaNs
-        is_nan_self = np.isnan(self.samples)
-        is_nan_other = np.isnan(exponent)
-
-        # - Perform exponentiation
-        self.samples **= exponent
-
-        # - Fill in nans
-        self.samples[np.logical_or(is_nan_self, is_nan_other)] = np.nan
-
-        return self
+        return self._apply_inplace("pow", exponent)
 
     # - Absolute
 
     def __abs__(self) -> TimeSeries:
-        self_copy = self.copy()
-        self_copy.samples = np.abs(self_copy.samples)
-        return self_copy
+        return self._with_samples(np.abs(self.samples))
 
     # - Negative
 
     def __neg__(self) -> TimeSeries:
-        self_copy = self.copy()
-        self_copy.samples = -self_copy.samples
-        return self_copy
+        return self._with_samples(-self.samples)
 
     ## -- Properties
 
@@ -2004,6 +2406,11 @@ class TSContinuous(TimeSeries):
                 f"TSContinuous `{self.name}`: `approx_limit_times` must be of boolean type."
             )
 
+    @property
+    def dt(self) -> Optional[float]:
+        """(Optional[float]) Sample interval, if the samples lie on a uniform clock. ``None`` otherwise"""
+        return self._clock_dt
+
     @property
     def fill_value(self):
         return self._fill_value
@@ -2022,48 +2429,238 @@ class TSContinuous(TimeSeries):
             self._create_interpolator()
 
 
-### --- Event time series
-
-
-class TSEvent(TimeSeries):
+class TSExpression:
     """
-    Represents a discrete time series, composed of binary events (present or absent). This class is primarily used to represent spike trains or event trains to communicate with spiking neuron layers, or to communicate with event-based computing systems. See :ref:`/basics/time_series.ipynb` for further explanation and examples.
-
-    `.TSEvent` supports multiple channels of event time series encapsulated by a single object, as well as periodic time series.
-
-    :Examples:
+    A lazy arithmetic expression over :py:class:`.TSContinuous` series
 
-    Build a series of several random event times
+    Expressions are created with :py:meth:`.TSContinuous.lazy`. Arithmetic operations on an expression are recorded rather than performed, and are evaluated by :py:meth:`.evaluate`. Evaluation proceeds over blocks of samples, applying the full chain of operations to each block in turn, so that intermediate results never occupy more than one block of memory.
 
-    >>> times = numpy.cumsum(numpy.random.rand(10))
-    >>> ts = TSEvent(times)
+    The result is sampled on the time base of the left-most series in the expression, and takes its attributes. Operand series with the same time base are used directly; other series are interpolated, as for eager arithmetic on :py:class:`.TSContinuous` objects. ``NaN`` values are handled identically to eager arithmetic.
 
+    Examples:
+        >>> ts_a = TSContinuous.from_clocked(np.random.rand(100000, 16), dt=1e-3)
+        >>> ts_b = TSContinuous.from_clocked(np.random.rand(100000, 16), dt=1e-3)
+        >>> ts_c = (ts_a.lazy() * 2.0 + ts_b - 1.0).evaluate()
     """
 
-    def __init__(
-        self,
-        times: Optional[ArrayLike] = None,
-        channels: Optional[Union[int, ArrayLike]] = None,
-        periodic: bool = False,
-        t_start: Optional[float] = None,
-        t_stop: Optional[float] = None,
-        name: Optional[str] = None,
-        num_channels: Optional[int] = None,
-    ):
+    def __init__(self, series: TSContinuous):
         """
-        Represent discrete events in time
+        Begin an expression containing a single series
 
-        :param Optional[ArrayLike[float]] times:     ``Tx1`` vector of event times
-        :param Optional[ArrayLike[int]] channels:     ``Tx1`` vector of event channels (Default: all events are in channel 0)
+        :param TSContinuous series: The series defining the time base of the expression
+        """
+        if not isinstance(series, TSContinuous):
+            raise TypeError("TSExpression: `series` must be a `TSContinuous` object.")
 
-        :param bool periodic:               Is this a periodic TimeSeries (Default: False; non-periodic)
+        self._series = series
+        self._operation = None
+        self._operands = ()
 
-        :param float t_start:               Explicitly specify the start time of this series. If ``None``, then ``times[0]`` is taken to be the start time
-        :param float t_stop:                Explicitly specify the stop time of this series. If ``None``, then ``times[-1]`` is taken to be the stop time
+    @classmethod
+    def _combine(cls, operation: str, *operands) -> "TSExpression":
+        """
+        Record an operation on one or more operands, at least one of which is an expression
 
-        :param Optional[str] name:                    Name of the time series (Default: None)
+        :param str operation:   The operation to record
+        :param operands:        Operands of the operation
+
+        :return TSExpression: The new expression
+        """
+        # - The left-most series defines the time base, as for eager arithmetic
+        expression = cls.__new__(cls)
+        expression._series = next(
+            op if isinstance(op, TSContinuous) else op._series
+            for op in operands
+            if isinstance(op, (TSContinuous, TSExpression))
+        )
+        expression._operation = operation
+        expression._operands = operands
+        return expression
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__} `{self._series.name}` over {self._series.times.size} samples"
+            + ("" if self._operation is None else f"; `{self._operation}` operation")
+        )
+
+    def _evaluate_block(
+        self, rows: slice, num_samples: int, times: np.ndarray
+    ) -> Tuple[np.ndarray, bool]:
+        """
+        Evaluate the expression for a block of samples
+
+        :param slice rows:          The rows of the base time trace in this block
+        :param int num_samples:     The total number of samples in the base time trace
+        :param np.ndarray times:    The time points in this block
+
+        :return Tuple[np.ndarray, bool]: The samples for this block, and a flag indicating whether the samples were allocated during evaluation and may be overwritten
+        """
+
+        def operand_block(operand) -> Tuple[np.ndarray, bool]:
+            if isinstance(operand, TSExpression):
+                return operand._evaluate_block(rows, num_samples, times)
+
+            if isinstance(operand, TSContinuous):
+                # - Use samples directly if they share this block's time base
+                if np.array_equal(operand.times[rows], times):
+                    return operand.samples[rows], False
+                else:
+                    return operand(times), True
+
+            # - Slice arrays containing one row per sample
+            if np.ndim(operand) == 2 and np.shape(operand)[0] == num_samples:
+                return np.asarray(operand)[rows], False
+
+            return operand, False
+
+        if self._operation is None:
+            return operand_block(self._series)
+
+        blocks = [operand_block(operand) for operand in self._operands]
+
+        if self._operation in ("neg", "abs"):
+            ((block, owned),) = blocks
+            ufunc = np.negative if self._operation == "neg" else np.abs
+            return ufunc(block, out=block if owned else None), True
+
+        (block, owned), (other, other_owned) = blocks
+
+        if self._operation == "matmul":
+            return block @ other, True
+
+        # - Overwrite an intermediate result, if it has the same shape as the result
+        shape = np.broadcast_shapes(np.shape(block), np.shape(other))
+        if owned and np.shape(block) == shape:
+            out = block
+        elif other_owned and np.shape(other) == shape:
+            out = other
+        else:
+            out = None
+
+        return _samples_operation(self._operation, block, other, out=out), True
+
+    def evaluate(self) -> TSContinuous:
+        """
+        Evaluate the expression, in a single pass over blocks of samples
+
+        :return TSContinuous: A new series containing the result of the expression, with the time base and attributes of the left-most series in the expression
+        """
+        times = self._series.times
+        num_samples = times.size
+        block_rows = max(
+            1, _EXPRESSION_BLOCK_ELEMENTS // max(1, self._series.num_channels)
+        )
+
+        samples = None
+        for start in range(0, max(num_samples, 1), block_rows):
+            rows = slice(start, start + block_rows)
+            block, _ = self._evaluate_block(rows, num_samples, times[rows])
+
+            # - Allocate the result once the number of channels is known
+            if samples is None:
+                samples = np.empty((num_samples,) + np.shape(block)[1:])
+
+            samples[rows] = block
+
+        return self._series._with_samples(samples)
+
+    # - Arithmetic operations
+
+    def __add__(self, other) -> "TSExpression":
+        return self._combine("add", self, other)
+
+    def __radd__(self, other) -> "TSExpression":
+        return self._combine("add", other, self)
+
+    def __sub__(self, other) -> "TSExpression":
+        return self._combine("sub", self, other)
+
+    def __rsub__(self, other) -> "TSExpression":
+        return self._combine("sub", other, self)
+
+    def __mul__(self, other) -> "TSExpression":
+        return self._combine("mul", self, other)
+
+    def __rmul__(self, other) -> "TSExpression":
+        return self._combine("mul", other, self)
+
+    def __truediv__(self, other) -> "TSExpression":
+        return self._combine("truediv", self, other)
+
+    def __rtruediv__(self, other) -> "TSExpression":
+        return self._combine("truediv", other, self)
+
+    def __floordiv__(self, other) -> "TSExpression":
+        return self._combine("floordiv", self, other)
+
+    def __rfloordiv__(self, other) -> "TSExpression":
+        return self._combine("floordiv", other, self)
+
+    def __pow__(self, exponent) -> "TSExpression":
+        return self._combine("pow", self, exponent)
+
+    def __rpow__(self, base) -> "TSExpression":
+        return self._combine("pow", base, self)
+
+    def __matmul__(self, matrix) -> "TSExpression":
+        return self._combine("matmul", self, matrix)
+
+    def __neg__(self) -> "TSExpression":
+        return self._combine("neg", self)
+
+    def __abs__(self) -> "TSExpression":
+        return self._combine("abs", self)
+
+
+### --- Event time series
+
+
+class TSEvent(TimeSeries):
+    """
+    Represents a discrete time series, composed of binary events (present or absent). This class is primarily used to represent spike trains or event trains to communicate with spiking neuron layers, or to communicate with event-based computing systems. See :ref:`/basics/time_series.ipynb` for further explanation and examples.
+
+    `.TSEvent` supports multiple channels of event time series encapsulated by a single object, as well as periodic time series.
+
+    :Examples:
+
+    Build a series of several random event times
+
+    >>> times = numpy.cumsum(numpy.random.rand(10))
+    >>> ts = TSEvent(times)
+
+    """
+
+    def __init__(
+        self,
+        times: Optional[ArrayLike] = None,
+        channels: Optional[Union[int, ArrayLike]] = None,
+        periodic: bool = False,
+        t_start: Optional[float] = None,
+        t_stop: Optional[float] = None,
+        name: Optional[str] = None,
+        num_channels: Optional[int] = None,
+        dtype_times: Union[None, str, type, np.dtype] = None,
+        dtype_channels: Union[None, str, type, np.dtype] = None,
+        compact: bool = False,
+    ):
+        """
+        Represent discrete events in time
+
+        :param Optional[ArrayLike[float]] times:     ``Tx1`` vector of event times
+        :param Optional[ArrayLike[int]] channels:     ``Tx1`` vector of event channels (Default: all events are in channel 0)
+
+        :param bool periodic:               Is this a periodic TimeSeries (Default: False; non-periodic)
+
+        :param float t_start:               Explicitly specify the start time of this series. If ``None``, then ``times[0]`` is taken to be the start time
+        :param float t_stop:                Explicitly specify the stop time of this series. If ``None``, then ``times[-1]`` is taken to be the stop time
+
+        :param Optional[str] name:                    Name of the time series (Default: None)
 
         :param Optional[int] num_channels:            Total number of channels in the data source. If ``None``, the total channel number is taken to be ``max(channels)``
+
+        :param Union[None, str, type, np.dtype] dtype_times:    Floating-point data type in which event times are stored. Default: ``None``, use ``float64``, or ``float32`` if ``compact`` is ``True``
+        :param Union[None, str, type, np.dtype] dtype_channels: Integer data type in which event channels are stored. Default: ``None``, use ``int64``, or the smallest unsigned integer type that fits ``num_channels`` if ``compact`` is ``True``
+        :param bool compact:                Iff ``True``, store events compactly by default, with ``float32`` times and the smallest sufficient unsigned integer channel type. Data types are preserved by `.TSEvent` operations. Default: ``False``
         """
 
         # - Default time trace: empty
@@ -2116,16 +2713,50 @@ class TSEvent(TimeSeries):
                     f"TSEvent `{name}`: num_channels must be None or greater than the highest channel ID."
                 )
 
+        # - Determine storage data types
+        if dtype_times is None:
+            dtype_times = np.float32 if compact else float
+
+        if dtype_channels is None:
+            dtype_channels = _min_channel_dtype(num_channels) if compact else int
+
+        if not np.issubdtype(dtype_times, np.floating):
+            raise TypeError(
+                f"TSEvent `{name}`: `dtype_times` must be a floating-point type."
+            )
+
+        channels = np.asarray(channels).flatten()
+        if np.size(channels) > 0 and (
+            np.amin(channels) < np.iinfo(dtype_channels).min
+            or num_channels - 1 > np.iinfo(dtype_channels).max
+        ):
+            raise ValueError(
+                f"TSEvent `{name}`: type `{np.dtype(dtype_channels)}` not sufficient "
+                + f"for the channels in this series ({num_channels})."
+            )
+
+        # - Convert times to storage type, and check they remain before `t_stop`
+        times = times.astype(dtype_times, copy=False)
+        if times.size > 0 and np.max(times) >= t_stop:
+            raise ValueError(
+                f"`t_stop` (here {t_stop}) must be strictly greater than the largest "
+                + f"entry in `times` when stored as `{times.dtype}` (here {np.max(times)})."
+            )
+
         # - Initialize superclass
         super().__init__(
             times=times, periodic=periodic, t_start=t_start, t_stop=t_stop, name=name
         )
+        self._times = self._times.astype(dtype_times, copy=False)
 
         # - Store total number of channels
         self._num_channels = int(num_channels)
 
         # - Store channels
-        self.channels = np.array(channels, "int").flatten()
+        self.channels = channels.astype(dtype_channels)
+
+        # - No per-channel event index until requested
+        self._channel_index = None
 
     def print(
         self,
@@ -2171,15 +2802,19 @@ class TSEvent(TimeSeries):
         time_limits: Optional[Tuple[Optional[float], Optional[float]]] = None,
         target: Union["mpl.axes.Axes", "hv.Scatter", "hv.Overlay", None] = None,
         channels: Union[ArrayLike, int, None] = None,
+        max_points: Optional[int] = _PLOT_MAX_EVENTS,
         *args,
         **kwargs,
     ):
         """
         Visualise this time series on a scatter plot
 
+        If more than ``max_points`` events are to be plotted, the plot instead shows the binned event density (events per second) of each channel as an image, over ``_PLOT_DENSITY_BINS`` time bins. In this case ``args`` and ``kwargs`` other than ``label`` are not used.
+
         :param Optional[float, float] time_limits:  Tuple with times between which to plot. Default: plot all times
         :param Optional[axis] target:               Object to which plot will be added. Default: new plot
         :param ArrayLike[int] channels:             Channels that are to be plotted. Default: plot all channels
+        :param Optional[int] max_points:            Maximum number of events to plot individually, before plotting the event density. ``None`` to always plot all events. Default: 100000
         :param args, kwargs:                        Optional arguments to pass to plotting function
 
         :return: Plot object. Either holoviews Layout, or matplotlib plot
@@ -2206,17 +2841,45 @@ class TSEvent(TimeSeries):
         # - Choose matching events
         times, channels = self(t_start, t_stop, channels)
 
+        # - Summarise large numbers of events as a binned density
+        if max_points is not None and times.size > max_points:
+            density = self._event_density(times, channels, t_start, t_stop)
+            extent = (t_start, t_stop, -0.5, self.num_channels - 0.5)
+        else:
+            density = None
+
+        def plot_mpl(ax: "mpl.axes.Axes"):
+            if density is None:
+                return ax.scatter(times, channels, *args, **kwargs)
+            else:
+                return ax.imshow(
+                    density.T,
+                    aspect="auto",
+                    origin="lower",
+                    interpolation="nearest",
+                    extent=extent,
+                    cmap="Greys",
+                    label=kwargs.get("label"),
+                )
+
+        def plot_hv():
+            if density is None:
+                plot = hv.Scatter((times, channels), *args, **kwargs)
+            else:
+                # - Image rows are ordered from the top
+                plot = hv.Image(
+                    np.flipud(density.T),
+                    bounds=(extent[0], extent[2], extent[1], extent[3]),
+                )
+            return plot.redim(x="Time", y="Channel").relabel(self.name)
+
         if target is None:
             if self._plotting_backend is None:
                 backend = _global_plotting_backend
             else:
                 backend = self._plotting_backend
             if backend == "holoviews":
-                return (
-                    hv.Scatter((times, channels), *args, **kwargs)
-                    .redim(x="Time", y="Channel")
-                    .relabel(self.name)
-                )
+                return plot_hv()
 
             elif backend == "matplotlib":
                 # - Add `self.name` as label only if a label is not already present
@@ -2244,7 +2907,7 @@ class TSEvent(TimeSeries):
                 ax.set_ylim(-1, self.num_channels)
 
                 # - Plot the curves
-                return ax.scatter(times, channels, *args, **kwargs)
+                return plot_mpl(ax)
 
             else:
                 raise RuntimeError(f"TSEvent: `{self.name}`: No plotting back-end set.")
@@ -2252,16 +2915,12 @@ class TSEvent(TimeSeries):
         else:
             # - Infer current plotting backend from type of `target`
             if _HV_AVAILABLE and isinstance(target, (hv.Curve, hv.Overlay)):
-                target *= (
-                    hv.Scatter((times, channels), *args, **kwargs)
-                    .redim(x="Time", y="Channel")
-                    .relabel(self.name)
-                )
+                target *= plot_hv()
                 return target.relabel(group=self.name)
             elif _MPL_AVAILABLE and isinstance(target, mpl.axes.Axes):
                 # - Add `self.name` as label only if a label is not already present
                 kwargs["label"] = kwargs.get("label", self.name)
-                target.scatter(times, channels, *args, **kwargs)
+                plot_mpl(target)
                 return target
             else:
                 raise TypeError(
@@ -2270,6 +2929,35 @@ class TSEvent(TimeSeries):
                     + "the corresponding backend must be installed in your environment."
                 )
 
+    def _event_density(
+        self,
+        times: np.ndarray,
+        channels: np.ndarray,
+        t_start: float,
+        t_stop: float,
+    ) -> np.ndarray:
+        """
+        Bin events into an event density raster, for plotting
+
+        :param np.ndarray times:    Event times, within ``[t_start, t_stop)``
+        :param np.ndarray channels: Event channels
+        :param float t_start:       Start time of the first bin
+        :param float t_stop:        Stop time of the last bin
+
+        :return np.ndarray: ``(_PLOT_DENSITY_BINS, num_channels)`` array of the event rate in each time bin and channel, in events per second
+        """
+        bin_duration = (t_stop - t_start) / _PLOT_DENSITY_BINS
+        time_bins = np.clip(
+            ((times.astype(float) - t_start) / bin_duration).astype(int),
+            0,
+            _PLOT_DENSITY_BINS - 1,
+        )
+        counts = np.bincount(
+            time_bins * self.num_channels + channels,
+            minlength=_PLOT_DENSITY_BINS * self.num_channels,
+        )
+        return counts.reshape(_PLOT_DENSITY_BINS, self.num_channels) / bin_duration
+
     ## -- Methods for manipulating timeseries
 
     def clip(
@@ -2294,14 +2982,15 @@ class TSEvent(TimeSeries):
         :return `.TSEvent`:                         `.TSEvent` containing events from the requested channels
         """
 
+        # - Extract matching events
+        time_data, channel_data = self(t_start, t_stop, channels)
+
         if not inplace:
-            new_series = self.copy()
+            # - Event data is replaced, so it need not be copied
+            new_series = self._shallow_copy()
         else:
             new_series = self
 
-        # - Extract matching events
-        time_data, channel_data = new_series(t_start, t_stop, channels)
-
         # - Update new timeseries
         new_series._times = time_data
         if t_start is not None:
@@ -2315,7 +3004,9 @@ class TSEvent(TimeSeries):
                     channel_data, return_inverse=True
                 )
                 num_channels = unique_channels.size
-                new_series._channels = np.arange(num_channels)[channel_indices]
+                new_series._channels = np.arange(
+                    num_channels, dtype=channel_data.dtype
+                )[channel_indices]
             else:
                 new_series._channels = channel_data
             new_series._num_channels = (
@@ -2351,7 +3042,9 @@ class TSEvent(TimeSeries):
                 f"TSEvent `{new_series.name}`: "
                 + f"`channel_map` must be of size {new_series.num_channels}."
             )
-        new_series.channels = channel_map[new_series.channels]
+        new_series.channels = channel_map[new_series.channels].astype(
+            _fit_channel_dtype(new_series.channels.dtype, np.amax(channel_map) + 1)
+        )
 
         return new_series
 
@@ -2365,7 +3058,8 @@ class TSEvent(TimeSeries):
         num_timesteps: int = None,
         channels: np.ndarray = None,
         add_events: bool = False,
-    ) -> np.ndarray:
+        sparse: bool = False,
+    ) -> Union[np.ndarray, spsparse.csr_matrix]:
         """
         Return a rasterized version of the time series data, where each data point represents a time step
 
@@ -2394,6 +3088,7 @@ class TSEvent(TimeSeries):
         :param Optional[ArrayLike[int]] channels:   Channels from which data is to be used. Default: ``None`` (use all channels)
         :param bool add_events:                     If ``True``, return an integer raster containing number of events for each time step and channel. Default: ``False``, merge simultaneous events in a single channel, and return a boolean raster
         :param bool endpoint:                       If ``True``, an extra time bin is added to the raster after ``t_stop``, to ensure that any events occurring at ``t_stop`` are included in the raster. Default: ``False``, do not include events occurring at ``t_stop``.
+        :param bool sparse:                         If ``True``, return the raster as a :py:class:`scipy.sparse.csr_matrix`, without allocating a dense ``(T, C)`` array. Default: ``False``, return a dense array
 
         :return ArrayLike:  event_raster            Boolean matrix with ``True`` indicating presence of events for each time step and channel. If ``add_events == True``, the raster consists of integers indicating the number of events per time step and channel. First axis corresponds to time, second axis to channel.
         """
@@ -2449,43 +3144,56 @@ class TSEvent(TimeSeries):
 
         # - Create raster for storing event data
         raster_type = int if add_events else bool
-        event_raster = np.zeros((num_timesteps, channels.size), raster_type)
+        raster_shape = (num_timesteps, channels.size)
 
         # - Handle empty time series
-        if len(series) == 0:
-            return event_raster
+        if len(series) == 0 or num_timesteps <= 0:
+            if sparse:
+                return spsparse.csr_matrix(raster_shape, dtype=raster_type)
+            return np.zeros(raster_shape, raster_type)
 
         # - Select data according to time base
         event_times = series.times
         event_channels = series.channels
 
         ## -- Convert input events and samples to boolean or integer raster
-        # - Only consider rasters that have non-zero length
-        if num_timesteps > 0:
-            # - Compute indices for event times and filter to valid time bins
-            time_indices = np.floor((event_times - t_start) / dt).astype(int)
-            time_indices = time_indices[time_indices < num_timesteps]
-
-            if add_events:
-                # - Accumulate events per time step and channel
-                for idx_t, idx_ch in zip(time_indices, event_channels):
-                    event_raster[idx_t, idx_ch] += 1
+        # - Compute indices for event times and filter to valid time bins
+        time_indices = np.floor((event_times.astype(float) - t_start) / dt).astype(int)
+        valid_events = time_indices < num_timesteps
+        time_indices = time_indices[valid_events]
+        event_channels = event_channels[valid_events]
+
+        if sparse:
+            # - Duplicate events are summed on conversion to CSR
+            event_raster = spsparse.csr_matrix(
+                (np.ones(time_indices.size, int), (time_indices, event_channels)),
+                shape=raster_shape,
+            )
+            return event_raster if add_events else event_raster.astype(bool)
+
+        event_raster = np.zeros(raster_shape, raster_type)
+        if add_events:
+            # - Accumulate events per time step and channel, over a flattened index
+            if np.all(event_channels < raster_shape[1]):
+                event_raster += np.bincount(
+                    time_indices * raster_shape[1] + event_channels,
+                    minlength=event_raster.size,
+                ).reshape(raster_shape)
             else:
-                # - Print a warning if there are multiple spikes in one time step and channel
-                if (
-                    (
-                        np.diff(np.c_[time_indices, event_channels], axis=0)
-                        == np.zeros(2)
-                    )
-                    .all(axis=1)
-                    .any(axis=0)
-                ):
-                    print(
-                        f"TSEvent `{self.name}`: There are channels with multiple events"
-                        + " per time step. Consider using a smaller `dt` or setting `add_events = True`."
-                    )
-                # - Mark spiking indices with True
-                event_raster[time_indices, event_channels] = True
+                np.add.at(event_raster, (time_indices, event_channels), 1)
+        else:
+            # - Print a warning if there are multiple spikes in one time step and channel
+            if (
+                (np.diff(np.c_[time_indices, event_channels], axis=0) == np.zeros(2))
+                .all(axis=1)
+                .any(axis=0)
+            ):
+                print(
+                    f"TSEvent `{self.name}`: There are channels with multiple events"
+                    + " per time step. Consider using a smaller `dt` or setting `add_events = True`."
+                )
+            # - Mark spiking indices with True
+            event_raster[time_indices, event_channels] = True
 
         # - Return the raster
         return event_raster
@@ -2536,6 +3244,7 @@ class TSEvent(TimeSeries):
         periodic: bool = False,
         num_channels: Optional[int] = None,
         spikes_at_bin_start: bool = False,
+        compact: bool = False,
     ) -> "TSEvent":
         """
         Create a `.TSEvent` object from a raster array
@@ -2563,38 +3272,55 @@ class TSEvent(TimeSeries):
         :param bool periodic:               The ``periodic`` flag passed to the new time series
         :param Optional[int] num_channels:  The ``num_channels`` argument passed to the new time series. Default: ``None``, use the number of channels ``C`` in ``raster``
         :param bool spikes_at_bin_start:    Iff ``True``, then spikes in ``raster`` are considered to occur at the start of the time bin. If ``False``, then spikes occur half-way through each time bin. Default: ``False``, spikes occur half-way through each time bin.
+        :param bool compact:                Iff ``True``, the returned series stores events compactly (see `.TSEvent`). Default: ``False``
+
+        ``raster`` may be a dense array of any numeric or boolean type, or a ``scipy.sparse`` matrix. Dense rasters are not converted to a different type, and are scanned in blocks of rows, such that the memory used in addition to ``raster`` scales with the number of events rather than with the size of ``raster``.
 
         :return TSEvent: A new `.TSEvent` containing the events in ``raster``
         """
 
-        # - Make sure ``raster`` is a numpy array of integer type
-        raster = np.asarray(raster, int)
+        # - Use ``raster`` in its own data type, and reshape if the array is 1d
+        if not spsparse.issparse(raster):
+            raster = np.asarray(raster)
+            if len(raster.shape) == 1:
+                raster = np.atleast_2d(raster).T
 
-        # - Reshape if the array is 1d
-        if len(raster.shape) == 1:
-            raster = np.atleast_2d(raster).T
+        num_rows, num_cols = raster.shape
 
         # - Compute `t_stop` if not provided
         if t_stop is None:
-            t_stop = raster.shape[0] * dt + t_start
-
-        # - Find spike events
-        spike_present = raster > 0
-        spikes_per_bin = raster[spike_present]
-        spikes = np.repeat(np.argwhere(raster), spikes_per_bin, axis=0)
+            t_stop = num_rows * dt + t_start
 
         # - Determine the number of channels
-        num_channels = raster.shape[1] if num_channels is None else num_channels
+        num_channels = num_cols if num_channels is None else num_channels
+        dtype_channels = _min_channel_dtype(max(num_cols, num_channels))
+
+        # - Convert each block of non-zero entries to events
+        times_list = [np.zeros(0)]
+        channels_list = [np.zeros(0, dtype_channels)]
+        for start, rows, cols, counts in _raster_event_blocks(raster):
+            # - Each bin contains the (truncated) integer number of events in that bin
+            if counts.dtype != bool:
+                counts = counts.astype(int)
+                if (counts != 1).any():
+                    rows = np.repeat(rows, np.clip(counts, 0, None))
+                    cols = np.repeat(cols, np.clip(counts, 0, None))
+
+            times_list.append(
+                (rows + start) * dt + t_start + dt / 2 * int(not spikes_at_bin_start)
+            )
+            channels_list.append(cols.astype(dtype_channels))
 
         # - Convert to a new TSEvent object and return
         return TSEvent(
-            spikes[:, 0] * dt + t_start + dt / 2 * int(not spikes_at_bin_start),
-            spikes[:, 1],
+            np.concatenate(times_list),
+            np.concatenate(channels_list),
             name=name,
             periodic=periodic,
             num_channels=num_channels,
             t_start=t_start,
             t_stop=t_stop,
+            compact=compact,
         )
 
     def to_dict(
@@ -2731,22 +3457,25 @@ class TSEvent(TimeSeries):
         if not series_list:
             return appended_series
 
-        # - Merge all samples
-        times_new = np.concatenate([series.times for series in series_list])
-        channels_new = np.concatenate(
+        # - Preserve data types of the combined series
+        num_channels_new = int(np.sum(nums_channels))
+        dtype_times, dtype_channels = _merged_event_dtypes(
+            series_list, num_channels_new
+        )
+
+        # - Merge all samples, exploiting that each series is sorted in time
+        times_new, channels_new = _merge_sorted_events(
+            [series.times for series in series_list],
             [
-                series.channels + shift
+                series.channels.astype(int) + shift
                 for series, shift in zip(series_list, channel_shifts)
-            ]
+            ],
         )
-
-        # - Sort on time and merge
-        sort_indices = np.argsort(times_new)
-        appended_series._times = times_new[sort_indices]
-        appended_series._channels = channels_new[sort_indices].astype(int)
+        appended_series._times = times_new.astype(dtype_times)
+        appended_series._channels = channels_new.astype(dtype_channels)
         appended_series._t_start = t_start_new
         appended_series._t_stop = t_stop_new
-        appended_series._num_channels = int(np.sum(nums_channels))
+        appended_series._num_channels = num_channels_new
 
         return appended_series
 
@@ -2875,34 +3604,134 @@ class TSEvent(TimeSeries):
                 f"TSEvent `{self.name}`: Can only merge with `TSEvent` objects."
             )
 
-        # - Apply delay
-        series_list = [
-            series.delay(delay) for series, delay in zip(series_list, delay_list)
+        # - Apply delay, without copying the series
+        series_list = series_list[: len(delay_list)]
+        delay_list = delay_list[: len(series_list)]
+        times_list = [
+            series.times + delay if delay != 0 else series.times
+            for series, delay in zip(series_list, delay_list)
         ]
+
+        # - Determine t_start and t_stop
+        t_start_new = min(
+            series.t_start + delay for series, delay in zip(series_list, delay_list)
+        )
+        t_stop_new = max(
+            series.t_stop + delay for series, delay in zip(series_list, delay_list)
+        )
+
         # - Determine number of channels
         merged_series._num_channels = max(series.num_channels for series in series_list)
-        # - Determine t_start and t_stop
-        t_start_new = min(series.t_start for series in series_list)
-        t_stop_new = max(series.t_stop for series in series_list)
-        # - Merge all samples
-        times_new = np.concatenate([series.times for series in series_list])
-        channels_new = np.concatenate([series.channels for series in series_list])
+
+        # - Preserve data types of the merged series
+        dtype_times, dtype_channels = _merged_event_dtypes(
+            series_list, merged_series._num_channels
+        )
+
+        # - Merge all samples, exploiting that each series is sorted in time
+        times_new, channels_new = _merge_sorted_events(
+            times_list, [series.channels for series in series_list]
+        )
 
         # - Remove events with same times and channels
         if remove_duplicates:
             times_new, channels_new = np.unique((times_new, channels_new), axis=1)
 
-        # - Sort on time and merge
-        sort_indices = np.argsort(times_new)
-        merged_series._times = times_new[sort_indices]
-        merged_series._channels = channels_new[sort_indices].astype(int)
+        merged_series._times = times_new.astype(dtype_times)
+        merged_series._channels = channels_new.astype(dtype_channels)
         merged_series._t_start = t_start_new
         merged_series._t_stop = t_stop_new
 
         return merged_series
 
+    ## -- Methods for indexing events by channel
+
+    def build_channel_index(self) -> "TSEvent":
+        """
+        Build an index of the events in this series, grouped by channel
+
+        Event indices are grouped by channel in CSR format, with the events in each channel sorted in time. Once built, time-window queries for selected channels with :py:meth:`.__call__` and :py:meth:`.clip` cost ``O(C log N + k)`` for ``C`` selected channels and ``k`` matching events, instead of scanning the whole time window. The index is discarded when the event times or channels of this series are replaced.
+
+        :return TSEvent:    ``self``, with the index built
+        """
+        order = np.argsort(self._channels, kind="stable")
+        indptr = np.searchsorted(
+            self._channels[order], np.arange(self.num_channels + 1)
+        )
+        self._channel_index = (
+            self._times,
+            self._channels,
+            order,
+            indptr,
+            self._times[order],
+        )
+        return self
+
+    def _has_channel_index(self) -> bool:
+        """
+        Check whether a per-channel index exists and matches the current events
+
+        :return bool: ``True`` iff the index built by :py:meth:`.build_channel_index` can be used
+        """
+        channel_index = getattr(self, "_channel_index", None)
+        return (
+            channel_index is not None
+            and channel_index[0] is self._times
+            and channel_index[1] is self._channels
+        )
+
+    def _call_channel_index(
+        self, t_start: float, t_stop: float, channels: Union[int, ArrayLike]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return events in a time window for selected channels, using the per-channel index
+
+        :param float t_start:                       Time from which on events are returned
+        :param float t_stop:                        Time until which events are returned
+        :param Union[int, ArrayLike] channels:      Channels of which events are returned
+
+        :return:
+            np.ndarray  Times of events
+            np.ndarray  Channels of events
+        """
+        channels = np.unique(channels)
+
+        # - Check `channels` for validity
+        if channels.size > 0 and not (
+            np.min(channels) >= 0 and np.max(channels) < self.num_channels
+        ):
+            raise IndexError(
+                f"TSEvent `{self.name}`: `channels` must be between 0 and {self.num_channels}."
+            )
+
+        _, _, order, indptr, channel_times = self._channel_index
+        window = _ceil_to_dtype([t_start, t_stop], channel_times.dtype)
+
+        # - Find the time window within each selected channel by bisection
+        selected = [np.zeros(0, int)]
+        for ch in channels[channels < indptr.size - 1]:
+            ch_start, ch_stop = indptr[ch], indptr[ch + 1]
+            idx_start, idx_stop = ch_start + np.searchsorted(
+                channel_times[ch_start:ch_stop], window
+            )
+            selected.append(order[idx_start:idx_stop])
+
+        # - Restore the time order of the selected events
+        event_indices = np.sort(np.concatenate(selected))
+        return self._times[event_indices], self._channels[event_indices]
+
     ## -- Internal methods
 
+    def _shallow_copy(self) -> "TSEvent":
+        """
+        Return a shallow copy of ``self``, for replacing the event data without copying it
+
+        :return TSEvent: A new :py:class:`TSEvent` sharing the event arrays of ``self``
+        """
+        new_series = copy.copy(self)
+        new_series._channel_index = None
+        return new_series
+
     def _matching_channels(
         self,
         channels: Union[int, ArrayLike, None] = None,
@@ -2976,21 +3805,36 @@ class TSEvent(TimeSeries):
             all_times = _extend_periodic_times(t_start, t_stop, self)
             num_reps = int(np.round(all_times.size / self.channels.size))
             all_channels = np.tile(self.channels, num_reps)
-        else:
-            all_times = self.times
-            all_channels = self.channels
 
-        # - Events with matching channels
-        channel_matches = self._matching_channels(channels, all_channels)
+            # - Events with matching channels
+            channel_matches = self._matching_channels(channels, all_channels)
+
+            # - Ignore events from stop time onwards
+            choose_events_stop: np.ndarray = all_times < t_stop
+
+            # - Extract matching events and return
+            choose_events: np.ndarray = (
+                (all_times >= t_start) & (choose_events_stop) & channel_matches
+            )
+            return all_times[choose_events], all_channels[choose_events]
 
-        # - Ignore events from stop time onwards
-        choose_events_stop: np.ndarray = all_times < t_stop
+        # - Use the per-channel index if available
+        if channels is not None and self._has_channel_index():
+            return self._call_channel_index(t_start, t_stop, channels)
 
-        # - Extract matching events and return
-        choose_events: np.ndarray = (
-            (all_times >= t_start) & (choose_events_stop) & channel_matches
+        # - Event times are sorted, so find the time window by bisection
+        idx_start, idx_stop = np.searchsorted(
+            self._times, _ceil_to_dtype([t_start, t_stop], self._times.dtype)
         )
-        return all_times[choose_events], all_channels[choose_events]
+        window_times = self._times[idx_start:idx_stop]
+        window_channels = self._channels[idx_start:idx_stop]
+
+        if channels is None:
+            return window_times.copy(), window_channels.copy()
+
+        # - Extract events with matching channels and return
+        channel_matches = self._matching_channels(channels, window_channels)
+        return window_times[channel_matches], window_channels[channel_matches]
 
     def __getitem__(self, ind: Union[ArrayLike, slice, int]) -> "TSEvent":
         """
@@ -3005,7 +3849,7 @@ class TSEvent(TimeSeries):
         indexed_times: np.ndarray = np.atleast_1d(self.times[ind])
         indexed_channels: np.ndarray = np.atleast_1d(self.channels[ind])
         # - New TSEvent with the selected events
-        new_series = self.copy()
+        new_series = self._shallow_copy()
         new_series._times = indexed_times
         new_series._channels = indexed_channels
         return new_series
@@ -3115,8 +3959,8 @@ class TSEvent(TimeSeries):
                 + "The time trace must be sorted and not decreasing"
             )
 
-        # - Store new time trace
-        self._times = np.atleast_1d(new_times).flatten().astype(float)
+        # - Store new time trace, preserving the storage data type
+        self._times = np.atleast_1d(new_times).flatten().astype(self._times.dtype)
 
         if np.size(self._times) > 0:
             # - Fix t_start and t_stop
@@ -3146,23 +3990,650 @@ class TSEvent(TimeSeries):
             )
 
 
+### --- Incremental construction of event time series
+class TSEventBuilder:
+    """
+    Accumulate events in chunks, and build a single :py:class:`.TSEvent` in one pass
+
+    Appending to a :py:class:`.TSEvent` with :py:meth:`.TSEvent.append_t` in a loop copies all existing events on each call. `.TSEventBuilder` instead collects chunks of events, and merges them once when :py:meth:`.build` is called, so that long event trains can be constructed in linear time.
+
+    :Examples:
+
+    >>> builder = TSEventBuilder()
+    >>> for chunk in chunks:
+    ...     builder.append_t(chunk)
+    >>> ts = builder.build()
+    """
+
+    def __init__(
+        self,
+        t_start: float = 0.0,
+        num_channels: Optional[int] = None,
+        name: Optional[str] = None,
+        **kwargs,
+    ):
+        """
+        Accumulate events for a new :py:class:`.TSEvent`
+
+        :param float t_start:                   Start time of the series to build. Default: ``0.``
+        :param Optional[int] num_channels:      Number of channels of the series to build. Default: ``None``, infer from the appended events
+        :param Optional[str] name:              Name of the series to build. Default: ``None``
+        :param kwargs:                          Additional keyword arguments passed to :py:class:`.TSEvent` on :py:meth:`.build`, e.g. ``compact``
+        """
+        self._t_start = float(t_start)
+        self._t_stop = float(t_start)
+        self._num_channels = 0 if num_channels is None else int(num_channels)
+        self._name = name
+        self._kwargs = kwargs
+
+        # - Type in which event times will be stored by the built series
+        dtype_times = kwargs.get("dtype_times")
+        if dtype_times is None:
+            dtype_times = np.float32 if kwargs.get("compact", False) else float
+        self._dtype_times = np.dtype(dtype_times)
+
+        self._times = []
+        self._channels = []
+
+    def append(
+        self,
+        times: ArrayLike,
+        channels: Union[int, ArrayLike] = 0,
+        t_stop: Optional[float] = None,
+    ) -> "TSEventBuilder":
+        """
+        Append a chunk of events
+
+        Events in different chunks may overlap in time; they will be merged on :py:meth:`.build`.
+
+        :param ArrayLike[float] times:              Event times in this chunk
+        :param Union[int, ArrayLike[int]] channels: Event channels in this chunk, or a single channel for all events. Default: ``0``
+        :param Optional[float] t_stop:              Stop time of this chunk. The stop time of the built series will be at least ``t_stop``. Default: ``None``
+
+        :return TSEventBuilder: ``self``, to permit chaining
+        """
+        times = np.atleast_1d(times).flatten().astype(float)
+        channels = np.atleast_1d(channels).flatten().astype(int)
+        if channels.size == 1:
+            channels = np.repeat(channels, times.size)
+
+        if channels.size != times.size:
+            raise ValueError(
+                "TSEventBuilder: `channels` must have the same number of elements as `times`, or be an integer."
+            )
+
+        # - Sort this chunk if required
+        if (np.diff(times) < 0).any():
+            order = np.argsort(times, kind="stable")
+            times = times[order]
+            channels = channels[order]
+
+        if times.size > 0:
+            if times[0] < self._t_start:
+                raise ValueError(
+                    f"TSEventBuilder: Events must not occur before `t_start` ({self._t_start})."
+                )
+
+            # - Series must stop after the last event, as stored in the built series
+            last_time = times[-1].astype(self._dtype_times)
+            self._t_stop = max(
+                self._t_stop,
+                float(np.nextafter(last_time, np.array(np.inf, self._dtype_times))),
+            )
+            self._num_channels = max(self._num_channels, int(np.amax(channels)) + 1)
+
+            self._times.append(times)
+            self._channels.append(channels)
+
+        if t_stop is not None:
+            self._t_stop = max(self._t_stop, float(t_stop))
+
+        return self
+
+    def append_t(
+        self, series: "TSEvent", offset: Optional[float] = None
+    ) -> "TSEventBuilder":
+        """
+        Append a :py:class:`.TSEvent` along the time axis
+
+        As for :py:meth:`.TSEvent.append_t`, ``series.t_start`` is shifted to the current :py:attr:`.t_stop` + ``offset``.
+
+        :param TSEvent series:              Series to append
+        :param Optional[float] offset:      Offset between the current stop time and the start of ``series``. Default: ``None``, no offset
+
+        :return TSEventBuilder: ``self``, to permit chaining
+        """
+        if not isinstance(series, TSEvent):
+            raise TypeError("TSEventBuilder: Can only append `TSEvent` objects.")
+
+        offset = 0.0 if offset is None else offset
+        delay = self.t_stop + offset - series.t_start
+        self._num_channels = max(self._num_channels, series.num_channels)
+        return self.append(
+            series.times + delay, series.channels, t_stop=series.t_stop + delay
+        )
+
+    def build(self, t_stop: Optional[float] = None) -> "TSEvent":
+        """
+        Merge the accumulated events into a new :py:class:`.TSEvent`
+
+        :param Optional[float] t_stop:  Stop time of the new series. Must be later than all events. Default: ``None``, use :py:attr:`.t_stop`
+
+        :return TSEvent: A new :py:class:`.TSEvent` containing all appended events
+        """
+        times, channels = _merge_sorted_events(
+            self._times or [np.zeros(0)], self._channels or [np.zeros(0, int)]
+        )
+
+        return TSEvent(
+            times,
+            channels,
+            t_start=self._t_start,
+            t_stop=self.t_stop if t_stop is None else t_stop,
+            name=self._name,
+            num_channels=self._num_channels,
+            **self._kwargs,
+        )
+
+    @property
+    def t_stop(self) -> float:
+        """(float) Current stop time of the series being built. Later than all appended events, and not before the stop time of any appended chunk"""
+        return self._t_stop
+
+    def __len__(self):
+        return sum(t.size for t in self._times)
+
+
+### --- Chunked on-disk storage for long recordings
+class TSChunkedStore:
+    """
+    Append-only on-disk store for an arbitrarily long :py:class:`.TSEvent` or :py:class:`.TSContinuous`
+
+    A store is a directory containing one time-partitioned chunk per call to :py:meth:`.append`, and an index ``index.json`` recording the start and stop time of each chunk. The arrays of each chunk are stored as raw ``.npy`` files, and are accessed through memory maps. Recordings can therefore be written incrementally, and windows can be read from them without loading the full recording into memory.
+
+    The store can be re-opened later by creating a new :py:class:`.TSChunkedStore` on the same directory.
+
+    :Examples:
+
+    Record the output of a :py:class:`.TimedModule` over several evolutions:
+
+    >>> store = TSChunkedStore("recording")
+    >>> for ts_input in input_chunks:
+    ...     output, _, _ = mod(ts_input)
+    ...     store.append(output)
+
+    Read back a window of the recording:
+
+    >>> ts = store.read(t_start = 10., t_stop = 11.)
+    """
+
+    _index_filename = "index.json"
+
+    def __init__(self, path: Union[str, Path]):
+        """
+        Open a chunked store, creating an empty store if ``path`` does not contain one
+
+        :param Union[str, Path] path:   Directory containing the store
+        """
+        self.path = Path(path)
+
+        if (self.path / self._index_filename).exists():
+            with open(self.path / self._index_filename, "r") as f:
+                self._index = json.load(f)
+        else:
+            self.path.mkdir(parents=True, exist_ok=True)
+            self._index = {"ts_type": None, "t_start": None, "t_stop": None}
+            self._index["chunks"] = []
+
+        # - Chunk limits, for bisection
+        self._chunk_t_start = np.array([c["t_start"] for c in self._index["chunks"]])
+        self._chunk_t_stop = np.array([c["t_stop"] for c in self._index["chunks"]])
+
+    def _chunk_file(self, index: int, array: str) -> Path:
+        return self.path / f"chunk_{index:06d}_{array}.npy"
+
+    def _write_index(self):
+        # - Replace the index in a single step, so that an interrupted write leaves a consistent store
+        tmp_file = self.path / (self._index_filename + ".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(self._index, f)
+        tmp_file.replace(self.path / self._index_filename)
+
+    def append(
+        self, series: Union["TSEvent", "TSContinuous"], offset: Optional[float] = None
+    ) -> "TSChunkedStore":
+        """
+        Append a time series to the store as a new chunk
+
+        By default the times of ``series`` are stored unchanged, as for the consecutive outputs of a :py:class:`.TimedModule`. ``series`` must then not start before :py:attr:`.t_stop`. If ``offset`` is provided, ``series`` is instead shifted to start at :py:attr:`.t_stop` + ``offset``, as for :py:meth:`.TSEvent.append_t`.
+
+        :param Union[TSEvent, TSContinuous] series: Non-periodic series to append. Must be of the same class as previously appended series
+        :param Optional[float] offset:              If not ``None``, shift ``series`` to start ``offset`` after the current stop time. Default: ``None``, do not shift ``series``
+
+        :return TSChunkedStore: ``self``, to permit chaining
+        """
+        if not isinstance(series, (TSEvent, TSContinuous)):
+            raise TypeError(
+                "TSChunkedStore: Can only append `TSEvent` or `TSContinuous` objects."
+            )
+
+        if series.periodic:
+            raise ValueError("TSChunkedStore: Cannot append periodic series.")
+
+        ts_type = type(series).__name__
+        if self._index["ts_type"] is None:
+            # - The first series defines the store
+            self._index.update(
+                {
+                    "ts_type": ts_type,
+                    "t_start": float(series.t_start),
+                    "t_stop": float(series.t_start),
+                    "name": series.name,
+                    "num_channels": int(series.num_channels),
+                }
+            )
+            if isinstance(series, TSContinuous):
+                self._index["units"] = series.units
+                self._index["interp_kind"] = series._interp_kind
+
+        elif ts_type != self._index["ts_type"]:
+            raise TypeError(
+                f"TSChunkedStore: Can only append `{self._index['ts_type']}` objects to this store."
+            )
+
+        elif (
+            isinstance(series, TSContinuous)
+            and series.num_channels != self._index["num_channels"]
+        ):
+            raise ValueError(
+                f"TSChunkedStore: `series` must have {self._index['num_channels']} channels."
+            )
+
+        # - Shift the series if requested
+        delay = 0.0 if offset is None else self.t_stop + offset - series.t_start
+        t_start = float(series.t_start + delay)
+
+        if t_start < self.t_stop:
+            raise ValueError(
+                f"TSChunkedStore: `series` must not start before the end of the store (t = {self.t_stop})."
+            )
+
+        # - Write the arrays of a non-empty series as a new chunk
+        if not series.isempty():
+            index = len(self._index["chunks"])
+            times = series.times + delay if delay != 0.0 else series.times
+            np.save(self._chunk_file(index, "times"), times)
+
+            if isinstance(series, TSEvent):
+                np.save(self._chunk_file(index, "channels"), series.channels)
+                self._index["num_channels"] = max(
+                    self._index["num_channels"], int(series.num_channels)
+                )
+            else:
+                np.save(self._chunk_file(index, "samples"), series.samples)
+
+            self._index["chunks"].append(
+                {
+                    "t_start": t_start,
+                    "t_stop": float(series.t_stop + delay),
+                    "size": int(times.size),
+                }
+            )
+            self._chunk_t_start = np.append(self._chunk_t_start, t_start)
+            self._chunk_t_stop = np.append(
+                self._chunk_t_stop, self._index["chunks"][-1]["t_stop"]
+            )
+
+        # - Update the index
+        self._index["t_stop"] = max(self.t_stop, float(series.t_stop + delay))
+        self._write_index()
+
+        return self
+
+    def _chunk_arrays(self, index: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Memory-map the arrays of a single chunk
+
+        :param int index:   Index of the chunk
+
+        :return Tuple[np.ndarray, np.ndarray]:  ``(times, data)``, where ``data`` are the event channels or the samples of the chunk
+        """
+        data_name = "channels" if self._index["ts_type"] == "TSEvent" else "samples"
+        return (
+            np.load(self._chunk_file(index, "times"), mmap_mode="r"),
+            np.load(self._chunk_file(index, data_name), mmap_mode="r"),
+        )
+
+    def load_chunk(self, index: int) -> Union["TSEvent", "TSContinuous"]:
+        """
+        Return a single chunk of the store as a time series
+
+        The arrays of the returned series are read-only memory maps onto the chunk files. Use :py:meth:`~.TimeSeries.copy` to obtain a series which can be modified in place.
+
+        :param int index:   Index of the chunk to return
+
+        :return Union[TSEvent, TSContinuous]: The series stored in chunk ``index``
+        """
+        chunk = self._index["chunks"][index]
+        times, data = self._chunk_arrays(index % len(self))
+
+        if self._index["ts_type"] == "TSEvent":
+            series = TSEvent(
+                t_start=chunk["t_start"],
+                t_stop=chunk["t_stop"],
+                name=self._index["name"],
+                num_channels=self._index["num_channels"],
+            )
+            series._times = times
+            series._channels = data
+        else:
+            series = TSContinuous(
+                t_start=chunk["t_start"],
+                t_stop=chunk["t_stop"],
+                name=self._index["name"],
+                units=self._index["units"],
+                interp_kind=self._index["interp_kind"],
+            )
+            series._times = times
+            series._samples = data
+            series._create_interpolator()
+
+        return series
+
+    def read(
+        self,
+        t_start: Optional[float] = None,
+        t_stop: Optional[float] = None,
+        channels: Union[int, ArrayLike, None] = None,
+    ) -> Union["TSEvent", "TSContinuous"]:
+        """
+        Read a time window from the store
+
+        Only the chunks that overlap the window are accessed, and only the parts of those chunks within the window are read from disk. As for :py:meth:`.TSEvent.clip`, events at ``t_stop`` are excluded. As for :py:meth:`.TSContinuous.clip`, continuous series are sampled at ``t_start`` and ``t_stop``.
+
+        The window is clamped to the time range of the store, for event and continuous stores alike.
+
+        :param Optional[float] t_start:                 Start time of the window. Default: ``None``, start of the store
+        :param Optional[float] t_stop:                  Stop time of the window. Default: ``None``, end of the store
+        :param Union[int, ArrayLike, None] channels:    Channels to return. Default: ``None``, return all channels
+
+        :return Union[TSEvent, TSContinuous]:   A new series containing the requested window
+
+        :raises ValueError: If the store is empty, or if the window does not overlap the store
+        """
+        if self._index["ts_type"] is None:
+            raise ValueError("TSChunkedStore: The store is empty.")
+
+        is_event = self._index["ts_type"] == "TSEvent"
+
+        # - Clamp the window to the range of the store. Continuous samples are only defined up to the end of the last chunk
+        store_t_stop = (
+            float(self._chunk_t_stop[-1])
+            if not is_event and self._chunk_t_stop.size > 0
+            else self.t_stop
+        )
+        t_start = self.t_start if t_start is None else float(t_start)
+        t_stop = store_t_stop if t_stop is None else float(t_stop)
+        if t_start > store_t_stop or t_stop < self.t_start:
+            raise ValueError(
+                f"TSChunkedStore: The window [{t_start}, {t_stop}] does not overlap the store [{self.t_start}, {store_t_stop}]."
+            )
+
+        t_start = max(t_start, self.t_start)
+        t_stop = min(t_stop, store_t_stop)
+
+        # - Find the chunks overlapping the window by bisection
+        first_chunk = np.searchsorted(self._chunk_t_stop, t_start, side="left")
+        last_chunk = np.searchsorted(self._chunk_t_start, t_stop, side="right")
+
+        if not is_event:
+            # - Include the sample held at `t_start`, which may lie in an earlier chunk
+            first_chunk = max(first_chunk - 1, 0)
+
+        # - Read the window from each chunk
+        times_list = []
+        data_list = []
+        for index in range(first_chunk, last_chunk):
+            times, data = self._chunk_arrays(index)
+            if is_event:
+                idx_start, idx_stop = np.searchsorted(
+                    times, _ceil_to_dtype([t_start, t_stop], times.dtype)
+                )
+            else:
+                idx_start = max(np.searchsorted(times, t_start, side="right") - 1, 0)
+                idx_stop = np.searchsorted(times, t_stop, side="right")
+
+            times_list.append(np.array(times[idx_start:idx_stop]))
+            data_list.append(np.array(data[idx_start:idx_stop]))
+
+        # - Concatenation promotes to a type that represents the data of every chunk
+        times = np.concatenate(times_list or [np.zeros(0)])
+
+        if is_event:
+            channel_data = np.concatenate(data_list or [np.zeros(0, int)])
+            series = TSEvent(
+                times,
+                channel_data,
+                t_start=t_start,
+                t_stop=t_stop,
+                name=self._index["name"],
+                num_channels=self._index["num_channels"],
+                dtype_times=times.dtype,
+                dtype_channels=_fit_channel_dtype(
+                    channel_data.dtype, self._index["num_channels"]
+                ),
+            )
+            return (
+                series
+                if channels is None
+                else series.clip(channels=channels, inplace=True)
+            )
+
+        samples = np.concatenate(
+            data_list or [np.zeros((0, self._index["num_channels"]))]
+        )
+        if times.size == 0:
+            raise ValueError(
+                f"TSChunkedStore: The store contains no samples before t = {t_stop}."
+            )
+
+        # - Keep only the last sample at or before `t_start`
+        idx_start = max(np.searchsorted(times, t_start, side="right") - 1, 0)
+        series = TSContinuous(
+            times[idx_start:],
+            samples[idx_start:],
+            t_stop=self._chunk_t_stop[last_chunk - 1],
+            name=self._index["name"],
+            units=self._index["units"],
+            interp_kind=self._index["interp_kind"],
+        )
+        return series.clip(t_start, t_stop, channels=channels)
+
+    @property
+    def t_start(self) -> Optional[float]:
+        """(Optional[float]) Start time of the store, or ``None`` if nothing has been appended"""
+        return self._index["t_start"]
+
+    @property
+    def t_stop(self) -> Optional[float]:
+        """(Optional[float]) Stop time of the store, or ``None`` if nothing has been appended. New series may not start before this time"""
+        return self._index["t_stop"]
+
+    @property
+    def num_channels(self) -> Optional[int]:
+        """(Optional[int]) Number of channels of the stored series"""
+        return self._index.get("num_channels")
+
+    @property
+    def chunk_times(self) -> np.ndarray:
+        """(np.ndarray) ``(N, 2)`` array of the start and stop times of each chunk"""
+        return np.stack([self._chunk_t_start, self._chunk_t_stop], axis=-1).reshape(
+            -1, 2
+        )
+
+    def __len__(self):
+        """len(store) - Number of chunks in the store"""
+        return len(self._index["chunks"])
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__} of {self._index['ts_type']} at `{self.path}`"
+            + f" from t={self.t_start} to {self.t_stop}. Chunks: {len(self)}"
+        )
+
+
 ### --- Dict-like object to store TimeSeries on disk
+class _TSOnDisk:
+    """
+    Storage for a single `TimeSeries` in a temporary directory
+
+    The array attributes of the series are written as raw ``.npy`` files, which can be read back through memory maps. All other attributes are small, and are held in memory. The directory is removed when this object is garbage-collected.
+
+    Files are opened once, on the first call to :py:meth:`.writeable_copy`, and kept open so that further copies can be mapped without reading or re-opening the files.
+    """
+
+    # - Attributes derived from the stored arrays, which are rebuilt on loading
+    _derived_attributes = ("interp", "_channel_index", "_lod_pyramid")
+
+    def __init__(self, series: TimeSeries):
+        """
+        Write the arrays of a `TimeSeries` to a new temporary directory
+
+        :param TimeSeries series:   The time series to store
+        """
+        self._directory = TemporaryDirectory(prefix="rockpool_ts_")
+        self.ts_class = type(series)
+        self.attributes = {}
+        self.array_files = {}
+        self.nbytes = 0
+
+        # - Open files and array layouts, for mapping copy-on-write arrays
+        self._array_layouts = {}
+
+        for name, value in series.__dict__.items():
+            if name in self._derived_attributes:
+                self.attributes[name] = None
+            elif isinstance(value, np.ndarray):
+                # - Store arrays as raw `.npy` files
+                filename = Path(self._directory.name) / f"{name.lstrip('_')}.npy"
+                np.save(filename, np.asarray(value))
+                self.array_files[name] = filename
+                self.nbytes += value.nbytes
+            else:
+                self.attributes[name] = value
+
+    def load(self, mmap: bool = True) -> TimeSeries:
+        """
+        Reconstruct the stored `TimeSeries`, with read-only arrays
+
+        :param bool mmap:   If ``True`` (default), the arrays of the returned series are read-only memory maps onto the stored files. Otherwise the arrays are read into memory, and also marked read-only.
+
+        :return TimeSeries: The stored time series
+        """
+        series = self.ts_class.__new__(self.ts_class)
+        series.__dict__.update(self.attributes)
+
+        for name, filename in self.array_files.items():
+            array = np.load(filename, mmap_mode="r" if mmap else None)
+            array.flags.writeable = False
+            setattr(series, name, array)
+
+        # - Rebuild the interpolator of continuous series
+        if isinstance(series, TSContinuous):
+            series._create_interpolator()
+
+        return series
+
+    def _array_layout(self, name: str) -> Tuple[Any, dict]:
+        """
+        Return an open file and the layout of a stored array, opening the file and reading its header on first use
+
+        :param str name:    Name of the array attribute
+
+        :return Tuple[Any, dict]:   ``(file, layout)``, where ``layout`` contains the keyword arguments ``dtype``, ``shape``, ``order`` and ``offset`` for :py:class:`numpy.memmap`
+        """
+        if name not in self._array_layouts:
+            file = open(self.array_files[name], "rb")
+            read_header = (
+                np.lib.format.read_array_header_1_0
+                if np.lib.format.read_magic(file) == (1, 0)
+                else np.lib.format.read_array_header_2_0
+            )
+            shape, fortran_order, dtype = read_header(file)
+            layout = {
+                "dtype": dtype,
+                "shape": shape,
+                "order": "F" if fortran_order else "C",
+                "offset": file.tell(),
+            }
+            self._array_layouts[name] = (file, layout)
+
+        return self._array_layouts[name]
+
+    def writeable_copy(self, series: TimeSeries) -> TimeSeries:
+        """
+        Copy a series returned by :py:meth:`.load`, such that the arrays of the copy can be modified without affecting ``series`` or the stored files
+
+        The arrays of the copy are copy-on-write memory maps onto the stored files, which are kept open. No data is read or copied until it is accessed, and only modified pages are copied into memory.
+
+        :param TimeSeries series:   A series returned by :py:meth:`.load`
+
+        :return TimeSeries: A shallow copy of ``series`` with writeable arrays
+        """
+        series_copy = copy.copy(series)
+
+        for name in self.array_files:
+            file, layout = self._array_layout(name)
+            if np.prod(layout["shape"]) == 0:
+                # - Empty arrays cannot be memory-mapped
+                array = np.zeros(layout["shape"], layout["dtype"])
+            else:
+                array = np.memmap(file, mode="c", **layout)
+            setattr(series_copy, name, array)
+
+        # - Point the interpolator of continuous series at the new arrays
+        if isinstance(series_copy, TSContinuous):
+            series_copy._create_interpolator(reuse_clock=True)
+
+        return series_copy
+
+
 class TSDictOnDisk(collections.abc.MutableMapping):
     """
-    Behaves like a dict. However, if a `TimeSeries` is added, it will be stored in a temporary file to reduce main memory usage.
+    Behaves like a dict. However, if a `TimeSeries` is added, it will be stored in a temporary directory to reduce main memory usage.
+
+    The arrays of each stored `TimeSeries` are written as ``.npy`` files, and by default are accessed through memory maps, such that sampling or clipping a long stored series only reads the required parts from disk. Recently accessed series are kept in a least-recently-used cache, limited to a total of ``cache_bytes`` bytes of array data.
+
+    With ``mmap = True``, series returned by `TSDictOnDisk` can be modified in place without affecting the stored series. Their arrays are copy-on-write memory maps onto the stored files, so that only modified pages are copied into memory. With ``mmap = False``, returned series share read-only arrays with the cache; use :py:meth:`~.TimeSeries.copy` to obtain a series which can be modified in place.
+
+    Accessing a cached series neither reads the stored files nor copies the cached arrays.
     """
 
-    def __init__(self, data: Union[Dict, "TSDictOnDisk"] = {}):
+    def __init__(
+        self,
+        data: Union[Dict, "TSDictOnDisk"] = {},
+        cache_bytes: int = 2**27,
+        mmap: bool = True,
+    ):
         """
         TSDictOnDisk - dict-like container that stores TimeSeries in temporary files to save memory.
 
-        :param Union[Dict, TSDictOnDisk] data:   Data with which the object should be instantiatied.
+        :param Union[Dict, TSDictOnDisk] data:  Data with which the object should be instantiatied.
+        :param int cache_bytes:                 Maximum total size of the arrays of cached `TimeSeries`, in bytes. Series larger than this are never cached. Default: 128 MiB
+        :param bool mmap:                       If ``True`` (default), access stored arrays through memory maps. Otherwise, read them fully into memory when a series is loaded.
         """
 
         # - Dict to hold non-`TimeSeries` objects, to emulate behavior of a normal dict
         self._mapping = {}
-        # - Dict for handles to temporary files that store `TimeSeries`
+        # - Dict for `_TSOnDisk` objects, that store `TimeSeries` in temporary directories
         self._mapping_ts = {}
+
+        # - Least-recently-used cache of loaded `TimeSeries`
+        self.cache_bytes = cache_bytes
+        self.mmap = mmap
+        self._cache = collections.OrderedDict()
+        self._cache_nbytes = 0
+
         # - Add provided data to `self`.
         self.update(data)
 
@@ -3186,6 +4657,23 @@ class TSDictOnDisk(collections.abc.MutableMapping):
         else:
             self._mapping.update(data)
 
+    def _uncache(self, key: Hashable):
+        """
+        Remove a `TimeSeries` from the cache, if present
+
+        :param Hashable key:    Key of the series to remove
+        """
+        if key in self._cache:
+            del self._cache[key]
+            self._cache_nbytes -= self._mapping_ts[key].nbytes
+
+    def clear_cache(self):
+        """
+        Remove all loaded `TimeSeries` from the cache
+        """
+        self._cache.clear()
+        self._cache_nbytes = 0
+
     def __getitem__(self, key: Hashable) -> Any:
         """
         dod[key] - Access an object of `self` by its key.
@@ -3193,8 +4681,30 @@ class TSDictOnDisk(collections.abc.MutableMapping):
             The object to which the `key` corresponds.
         """
         if key in self._mapping_ts:
-            # - Load `TimeSeries` from temporary file
-            return load_ts_from_file(self._mapping_ts[key])
+            if key in self._cache:
+                # - Mark as most recently used
+                self._cache.move_to_end(key)
+                series = self._cache[key]
+
+            else:
+                # - Load `TimeSeries` from temporary directory
+                stored = self._mapping_ts[key]
+                series = stored.load(self.mmap)
+
+                if stored.nbytes <= self.cache_bytes:
+                    # - Evict least recently used series until the new series fits in the cache
+                    while self._cache_nbytes + stored.nbytes > self.cache_bytes:
+                        self._uncache(next(iter(self._cache)))
+
+                    self._cache[key] = series
+                    self._cache_nbytes += stored.nbytes
+
+            # - Return a copy, so that changes do not affect the cache
+            if self.mmap:
+                return self._mapping_ts[key].writeable_copy(series)
+            else:
+                return copy.copy(series)
+
         else:
             # - Return value stored under `key`.
             return self._mapping[key]
@@ -3203,10 +4713,13 @@ class TSDictOnDisk(collections.abc.MutableMapping):
         """
         dod[key] = value - Add an object to self together with a (hashable) key.
         """
+        # - Make sure an outdated series is not returned from the cache
+        if key in self._mapping_ts:
+            self._uncache(key)
+
         if isinstance(value, TimeSeries):
-            # - Store `TimeSeries` in a temporary file, whose handle is added as value to `self._mapping_ts`.
-            self._mapping_ts[key] = TemporaryFile()
-            value.save(self._mapping_ts[key])
+            # - Store `TimeSeries` in a temporary directory, handled by a `_TSOnDisk` object
+            self._mapping_ts[key] = _TSOnDisk(value)
             # - Make sure existing keys are overwritten, also in `self._mapping`.
             if key in self._mapping:
                 del self._mapping[key]
@@ -3221,6 +4734,7 @@ class TSDictOnDisk(collections.abc.MutableMapping):
         """del dod[key] - Delete an object from self by its key."""
         # - Delete the object corresponding to `key` from the correct dict.
         if key in self._mapping_ts:
+            self._uncache(key)
             del self._mapping_ts[key]
         else:
             del self._mapping[key]
@@ -5,7 +5,16 @@ To run a benchmark, use the function :func:`.benchmark_neurons`.
 TO plot benchmark results, use the function :func:`.plot_benchmark_results`.
 
 The list of benchmark functions are in `all_lif_benchmarks`.
+
+To measure the peak memory used during evolution, use the function :func:`.benchmark_neurons_memory` with the benchmarks in `all_memory_benchmarks`.
+
+To measure the speedup of multi-core filter banks against the number of workers, use the benchmarks in `all_filter_bank_benchmarks`.
+
+To measure the cost of flattening and unflattening Jax networks against network size, use the benchmarks in `all_jax_tree_benchmarks`.
 """
 
 from .benchmark_utils import *
 from .lif_benchmarks import *
+from .memory_benchmarks import *
+from .filter_bank_benchmarks import *
+from .jax_tree_benchmarks import *
@@ -5,6 +5,7 @@ Utilities for performing benchmarking
 from typing import Callable, Tuple, List, Optional
 
 from time import time
+import tracemalloc
 import warnings
 
 try:
@@ -15,7 +16,13 @@ except:
         return obj
 
 
-__all__ = ["timeit", "benchmark_neurons", "plot_benchmark_results"]
+__all__ = [
+    "timeit",
+    "peak_memory",
+    "benchmark_neurons",
+    "benchmark_neurons_memory",
+    "plot_benchmark_results",
+]
 
 
 def timeit(
@@ -61,6 +68,34 @@ def timeit(
     return collected_times
 
 
+def peak_memory(callable: Callable, warmup_calls: int = 1) -> int:
+    """
+    Measure the peak memory allocated during the execution of a callable
+
+    :func:`peak_memory` performs warm-up by calling the function one or more times (argument ``warmup_calls``), then calls the function once while tracing memory allocations with :py:mod:`tracemalloc`. Allocations made by ``numpy`` are included in the trace.
+
+    :func:`peak_memory` returns the peak memory allocated during the call, in bytes, above the memory in use before the call.
+
+    Arguments:
+        callable (Callable): A function to measure. Must accept no arguments.
+        warmup_calls (int): The number of warm-up calls to make. Default: ``1``
+    """
+    # - Warmup
+    for _ in range(warmup_calls):
+        callable()
+
+    # - Trace a single run
+    tracemalloc.start()
+    try:
+        baseline, _ = tracemalloc.get_traced_memory()
+        callable()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak - baseline
+
+
 def benchmark_neurons(
     prepare_fn: Callable,
     create_fn: Callable,
@@ -141,6 +176,58 @@ def benchmark_neurons(
     return creation_times, evolution_times, layer_sizes, benchmark_desc
 
 
+def benchmark_neurons_memory(
+    prepare_fn: Callable,
+    evolve_fn: Callable,
+    benchmark_desc: Optional[str] = None,
+    layer_sizes: List[int] = [10, 100, 1000, 10000],
+    num_batches: int = 1,
+    num_timesteps: int = 10000,
+) -> Tuple[List, List, str]:
+    """
+    Benchmark the peak memory used when evolving neuron layers
+
+    A memory benchmark is defined by the functions :func:`prepare_fn` and :func:`evolve_fn`, with the same signatures as for :func:`.benchmark_neurons`. :func:`prepare_fn` is called once per layer size, then the peak memory allocated by a single call to :func:`evolve_fn` is measured with :func:`.peak_memory`.
+
+    Arguments:
+        prepare_fn (Callable): A callable which prepares a benchmark. Signature: ``def prepare_fn(num_batches: int, num_timesteps: int, layer_size: int) -> object``
+        evolve_fn (Callable): A callable which evolves a layer. Signature: ``def evolve_fn(bench_obj: object) -> None``
+        benchmark_desc (str): A description of the benchmark, which will be returned
+        layer_sizes (List[int]): A list of layer sizes which should be benchmarked. Default: ``[10, 100, 1000, 10000]``
+        num_batches (int): The number of batches to test in evolution. Default: ``1``
+        num_timesteps (int): The number of timesteps to test in evolution. Default: ``10000``
+
+    Returns:
+        (peak_bytes, layer_sizes, benchmark_desc)
+    """
+    peak_bytes = []
+
+    # - Perform a benchmark for each layer size
+    for l_size in tqdm(layer_sizes):
+        try:
+            # - Prepare benchmark
+            bench_obj = prepare_fn(num_batches, num_timesteps, l_size)
+
+            # - Measure peak memory during evolution
+            peak_bytes.append(peak_memory(lambda: evolve_fn(bench_obj)))
+
+        except Exception as e:
+            # - Fail nicely with a warning if a benchmark dies
+            warnings.warn(
+                f"Memory benchmarking for layer size {l_size} failed with error {str(e)}."
+            )
+
+            # - No results for this run
+            peak_bytes.append(None)
+
+    # - Build a description of the benchmark
+    benchmark_desc = f"{benchmark_desc}; " if benchmark_desc is not None else ""
+    benchmark_desc = f"{benchmark_desc}B = {num_batches}, T = {num_timesteps}"
+
+    # - Return benchmark results
+    return peak_bytes, layer_sizes, benchmark_desc
+
+
 def plot_benchmark_results(
     creation_times: List,
     evolution_times: List,
@@ -0,0 +1,54 @@
+"""
+Define benchmark functions for filter bank layers
+
+Use these with :func:`.benchmark_neurons` to measure the speedup of multi-core filtering against the number of workers. Here the layer size is the number of filters in the filter bank, and the number of time steps is the number of audio samples.
+
+Examples:
+    >>> from rockpool.utilities.benchmarking import benchmark_neurons, butter_mel_filter_benchmark
+    >>> results = [
+    ...     benchmark_neurons(*butter_mel_filter_benchmark(num_workers), layer_sizes=[64], num_batches=1, num_timesteps=160000)
+    ...     for num_workers in [1, 2, 4, 8]
+    ... ]
+"""
+
+__all__ = [
+    "butter_mel_filter_benchmark",
+    "all_filter_bank_benchmarks",
+]
+
+
+def butter_mel_filter_benchmark(num_workers: int = 1):
+    from rockpool.nn.modules import ButterMelFilter
+    import numpy as np
+
+    fs = 16000.0
+
+    def prepare_fn(batch_size, time_steps, layer_size):
+        mod = ButterMelFilter(layer_size, fs=fs, num_workers=num_workers)
+        input_static = np.random.randn(time_steps, 1)
+
+        mod(input_static)
+
+        bench_obj = (layer_size, mod, input_static)
+
+        return bench_obj
+
+    def create_fn(bench_obj):
+        (layer_size, _, _) = bench_obj
+        ButterMelFilter(layer_size, fs=fs, num_workers=num_workers)
+
+    def evolve_fn(bench_obj):
+        (_, mod, input_static) = bench_obj
+        mod(input_static)
+
+    benchmark_title = f"ButterMelFilter (numpy backend), num_workers = {num_workers}"
+
+    return prepare_fn, create_fn, evolve_fn, benchmark_title
+
+
+all_filter_bank_benchmarks = [
+    lambda: butter_mel_filter_benchmark(num_workers=1),
+    lambda: butter_mel_filter_benchmark(num_workers=2),
+    lambda: butter_mel_filter_benchmark(num_workers=4),
+    lambda: butter_mel_filter_benchmark(num_workers=8),
+]
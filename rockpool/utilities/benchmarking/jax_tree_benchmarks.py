@@ -0,0 +1,59 @@
+"""
+Define benchmark functions for Jax pytree handling of modules
+
+Use these with :func:`.benchmark_neurons` to measure the cost of flattening and unflattening a Jax network against network size. Jax flattens and unflattens modules on every call to a transformed function, such as a function compiled with :py:func:`jax.jit`. Here the layer size is the number of neurons in each layer, and the "creation" time is the time taken for a flatten / unflatten round-trip of the network.
+
+Examples:
+    >>> from rockpool.utilities.benchmarking import benchmark_neurons, jax_tree_round_trip_benchmark
+    >>> results = [
+    ...     benchmark_neurons(*jax_tree_round_trip_benchmark(num_layers), layer_sizes=[16, 256], num_batches=1, num_timesteps=10)
+    ...     for num_layers in [1, 4, 16]
+    ... ]
+"""
+
+__all__ = [
+    "jax_tree_round_trip_benchmark",
+    "all_jax_tree_benchmarks",
+]
+
+
+def jax_tree_round_trip_benchmark(num_layers: int = 4):
+    from rockpool.nn.modules import LinearJax, LIFJax
+    from rockpool.nn.combinators import Sequential
+    import numpy as np
+    import jax
+
+    def prepare_fn(batch_size, time_steps, layer_size):
+        mods = []
+        for _ in range(num_layers):
+            mods.extend([LinearJax((layer_size, layer_size)), LIFJax(layer_size)])
+        net = Sequential(*mods)
+
+        evolve_jit = jax.jit(lambda net, input: net(input)[0])
+        input_static = np.random.rand(batch_size, time_steps, layer_size)
+
+        evolve_jit(net, input_static)
+
+        bench_obj = (net, evolve_jit, input_static)
+
+        return bench_obj
+
+    def create_fn(bench_obj):
+        (net, _, _) = bench_obj
+        leaves, treedef = jax.tree_util.tree_flatten(net)
+        jax.tree_util.tree_unflatten(treedef, leaves)
+
+    def evolve_fn(bench_obj):
+        (net, evolve_jit, input_static) = bench_obj
+        evolve_jit(net, input_static)
+
+    benchmark_title = f"Jax tree round-trip, {num_layers} LIF layers"
+
+    return prepare_fn, create_fn, evolve_fn, benchmark_title
+
+
+all_jax_tree_benchmarks = [
+    lambda: jax_tree_round_trip_benchmark(num_layers=1),
+    lambda: jax_tree_round_trip_benchmark(num_layers=4),
+    lambda: jax_tree_round_trip_benchmark(num_layers=16),
+]
@@ -0,0 +1,66 @@
+"""
+Define memory benchmark functions for native neuron layers
+
+Use these with :func:`.benchmark_neurons_memory` to compare the peak memory used by an evolution with and without recording internal state.
+
+Examples:
+    >>> from rockpool.utilities.benchmarking import benchmark_neurons_memory, lif_memory_benchmark
+    >>> peak_rec, sizes, _ = benchmark_neurons_memory(*lif_memory_benchmark(record=True))
+    >>> peak_norec, sizes, _ = benchmark_neurons_memory(*lif_memory_benchmark(record=False))
+"""
+
+__all__ = [
+    "lif_memory_benchmark",
+    "rate_memory_benchmark",
+    "all_memory_benchmarks",
+]
+
+
+def lif_memory_benchmark(record: bool = False):
+    from rockpool.nn.modules import LIF
+    import numpy as np
+
+    def prepare_fn(batch_size, time_steps, layer_size):
+        mod = LIF(layer_size)
+        input_static = np.random.rand(batch_size, time_steps, layer_size)
+
+        bench_obj = (layer_size, mod, input_static)
+
+        return bench_obj
+
+    def evolve_fn(bench_obj):
+        (_, mod, input_static) = bench_obj
+        mod(input_static, record=record)
+
+    benchmark_title = f"LIF (numpy backend), record = {record}"
+
+    return prepare_fn, evolve_fn, benchmark_title
+
+
+def rate_memory_benchmark(record: bool = False):
+    from rockpool.nn.modules import Rate
+    import numpy as np
+
+    def prepare_fn(batch_size, time_steps, layer_size):
+        mod = Rate(layer_size)
+        input_static = np.random.rand(batch_size, time_steps, layer_size)
+
+        bench_obj = (layer_size, mod, input_static)
+
+        return bench_obj
+
+    def evolve_fn(bench_obj):
+        (_, mod, input_static) = bench_obj
+        mod(input_static, record=record)
+
+    benchmark_title = f"Rate (numpy backend), record = {record}"
+
+    return prepare_fn, evolve_fn, benchmark_title
+
+
+all_memory_benchmarks = [
+    lambda: lif_memory_benchmark(record=True),
+    lambda: lif_memory_benchmark(record=False),
+    lambda: rate_memory_benchmark(record=True),
+    lambda: rate_memory_benchmark(record=False),
+]
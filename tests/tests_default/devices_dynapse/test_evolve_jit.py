@@ -55,3 +55,44 @@ def test_evolve():
 
     for key in rec:
         assert_array_almost_equal(rec[key], rec_jit[key])
+
+
+def test_evolve_checkpoint():
+    """
+    test_evolve_checkpoint checks that a checkpointed network evolves in the same way as the original network
+    """
+    import pytest
+
+    pytest.importorskip("samna")
+    pytest.importorskip("jax")
+    import numpy as np
+    from rockpool.devices.dynapse import DynapSim
+    from numpy.testing import assert_array_equal, assert_array_almost_equal
+
+    # - Hyper-parameters
+    np.random.seed(2023)
+
+    T = 1003
+    Nrec = 60
+    f = 0.01
+
+    # - Build the networks
+    net = DynapSim(Nrec, has_rec=True)
+    net_ckpt = DynapSim(Nrec, has_rec=True, checkpoint_every=100)
+    net_ckpt = net_ckpt.set_attributes(net.parameters())
+
+    # - Random input data
+    spike_train = np.random.rand(1, T, Nrec) < f
+
+    # - Checkpointed evolution matches, including a partial chunk
+    out, state, _ = net(spike_train)
+    out_ckpt, state_ckpt, _ = net_ckpt(spike_train)
+    assert_array_equal(out, out_ckpt)
+
+    for key in state:
+        assert_array_almost_equal(state[key], state_ckpt[key])
+
+    # - Chunk lengths must be positive integers
+    for checkpoint_every in [0, -1, 2.5]:
+        with pytest.raises(ValueError):
+            DynapSim(Nrec, checkpoint_every=checkpoint_every)
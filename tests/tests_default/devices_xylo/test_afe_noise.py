@@ -0,0 +1,61 @@
+import pytest
+import numpy as np
+
+
+def test_one_over_f_filter():
+    from rockpool.devices.xylo.afe_noise import _one_over_f_sos
+    from scipy import signal
+
+    Fs = 110_000.0
+
+    for F_KNEE, F_ALPHA in [(158.0, 1.0), (70_000.0, 1.0), (1000.0, 0.5)]:
+        sos = _one_over_f_sos(Fs, F_KNEE, F_ALPHA)
+        f = np.geomspace(10.0, Fs / 2, 200)[:-1]
+        _, h = signal.sosfreqz(sos, f, fs=Fs)
+        target = np.maximum(1.0, (F_KNEE / f) ** F_ALPHA)
+
+        # - The causal filter follows the 1/f spectrum used by `_generateNoise`
+        assert np.all(np.abs(20 * np.log10(np.abs(h) / target)) < 3.0)
+
+    # - No shaping without 1/f noise
+    sos = _one_over_f_sos(Fs, 158.0, 0.0)
+    _, h = signal.sosfreqz(sos, fs=Fs)
+    assert np.allclose(np.abs(h), 1.0)
+
+
+def test_stream_noise():
+    from rockpool.devices.xylo.syns61201 import AFESim
+    from rockpool.devices.xylo.afe_noise import _NOISE_FRAME_LENGTH
+    from scipy import signal
+
+    fs = 110_000
+    T = 2**19
+    F_KNEE = 158.0
+    noise_args = (1.0, F_KNEE, 1.0)
+
+    afesim = AFESim(fs=fs, seed=1, streaming=True)
+    noise = afesim._stream_noise(2, T, *noise_args, 1)[:, 0]
+
+    # - Noise is independent of the chunking of the stream
+    afesim = AFESim(fs=fs, seed=1, streaming=True)
+    chunks = np.diff([0, 1000, 20000, 3 * _NOISE_FRAME_LENGTH + 5, T])
+    noise_chunked = np.concatenate(
+        [afesim._stream_noise(2, c, *noise_args, 1)[:, 0] for c in chunks]
+    )
+    assert np.array_equal(noise, noise_chunked)
+
+    # - No jumps at the boundaries of the white noise frames
+    d_noise = np.diff(noise)
+    boundaries = np.arange(_NOISE_FRAME_LENGTH, T, _NOISE_FRAME_LENGTH) - 1
+    assert np.all(np.abs(d_noise[boundaries]) < 5 * np.std(d_noise))
+
+    # - 1/f noise extends below the frame frequency
+    f, psd = signal.welch(noise, fs=fs, nperseg=2**17)
+
+    def band_power(f_low, f_high):
+        return np.mean(psd[(f >= f_low) & (f < f_high)])
+
+    assert fs / _NOISE_FRAME_LENGTH > 6.0
+    ratio_db = 10 * np.log10(band_power(3.0, 6.0) / band_power(800.0, 1200.0))
+    target_db = 20 * np.log10(F_KNEE / np.sqrt(3.0 * 6.0))
+    assert ratio_db == pytest.approx(target_db, abs=6.0)
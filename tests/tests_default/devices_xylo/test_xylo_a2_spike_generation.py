@@ -223,3 +223,55 @@ def test_afesim2():
         np.sqrt(norm(spike_rate_avg_rastered) * norm(spike_rate_avg_original)) + EPS
     )
     assert rel_distance <= REL_ERR_MAX
+
+
+def test_afesim2_streaming():
+    """tests that streaming AFESim gives identical output for any chunking of the input"""
+
+    from rockpool.devices.xylo.syns61201 import AFESim
+
+    fs = 110_000
+    sig_len = int(0.2 * fs)
+    sig = 50.0e-3 * np.sin(2 * np.pi * 1000 * np.arange(sig_len) / fs)
+
+    def evolve_chunks(num_chunks):
+        afesim = AFESim(fs=fs, seed=1, streaming=True)
+        return np.concatenate(
+            [np.asarray(afesim(chunk)[0]) for chunk in np.array_split(sig, num_chunks)]
+        )
+
+    spikes = evolve_chunks(1)
+    spikes_chunked = evolve_chunks(7)
+
+    assert spikes.shape == (sig_len, 16)
+    assert np.array_equal(spikes, spikes_chunked)
+
+
+def test_afesim2_streaming_reset():
+    """tests that streaming noise is reproduced after resetting or restoring the state"""
+
+    from rockpool.devices.xylo.syns61201 import AFESim
+
+    fs = 110_000
+    sig_len = int(0.2 * fs)
+    sig = 50.0e-3 * np.sin(2 * np.pi * 1000 * np.arange(sig_len) / fs)
+
+    afesim = AFESim(fs=fs, seed=1, streaming=True)
+    spikes = np.asarray(afesim(sig)[0])
+
+    # - Evolving after a reset is identical to evolving a fresh module
+    afesim = afesim.reset_state()
+    assert np.array_equal(spikes, np.asarray(afesim(sig)[0]))
+
+    # - Evolving from a restored state is identical to continuing the evolution
+    split = sig_len // 3
+    afesim = AFESim(fs=fs, seed=1, streaming=True)
+    _, state, _ = afesim(sig[:split])
+    spikes_cont = np.asarray(afesim(sig[split:])[0])
+
+    afesim = AFESim(fs=fs, seed=1, streaming=True)
+    afesim = afesim.set_attributes(state)
+    assert np.array_equal(spikes_cont, np.asarray(afesim(sig[split:])[0]))
+
+    # - No noise buffers are carried in the module state, only filter states
+    assert all(np.size(v) <= 3 * 4 * 2 * 16 for v in state.values())
@@ -566,3 +566,74 @@ def test_xylo_vs_xylosim():
     assert np.all(rec_sim["Vmem_out"] == rec_xylo["Vmem_out"])
     assert np.all(rec_sim["Isyn_out"] == rec_xylo["Isyn_out"])
     assert np.all(rec_sim["Spikes"] == rec_xylo["Spikes"])
+
+
+def test_numpy_engine():
+    import pytest
+
+    pytest.importorskip("xylosim")
+
+    from rockpool.devices.xylo.syns61300 import XyloSim
+    from types import SimpleNamespace
+    import numpy as np
+
+    np.random.seed(2)
+
+    Nin = 4
+    Nhidden = 8
+    Nout = 2
+
+    # - Build a minimal configuration object
+    neurons = [
+        SimpleNamespace(
+            alias_target=2 if n == 5 else None,
+            threshold=np.random.randint(1, 500),
+            v_mem_decay=np.random.randint(0, 8),
+            i_syn_decay=np.random.randint(0, 8),
+            i_syn2_decay=np.random.randint(0, 8),
+        )
+        for n in range(Nhidden)
+    ]
+    neurons_out = [
+        SimpleNamespace(
+            threshold=np.random.randint(1, 500),
+            v_mem_decay=np.random.randint(0, 8),
+            i_syn_decay=np.random.randint(0, 8),
+        )
+        for n in range(Nout)
+    ]
+    config = SimpleNamespace(
+        synapse2_enable=True,
+        input=SimpleNamespace(
+            weights=np.random.randint(-128, 128, (Nin, Nhidden)),
+            syn2_weights=np.random.randint(-128, 128, (Nin, Nhidden)),
+            weight_bit_shift=4,
+        ),
+        reservoir=SimpleNamespace(
+            weights=np.random.randint(-128, 128, (Nhidden, Nhidden)),
+            syn2_weights=np.random.randint(-128, 128, (Nhidden, Nhidden)),
+            weight_bit_shift=2,
+            neurons=neurons,
+        ),
+        readout=SimpleNamespace(
+            weights=np.random.randint(-128, 128, (Nhidden, Nout)),
+            weight_bit_shift=1,
+            neurons=neurons_out,
+        ),
+    )
+
+    mod_xylosim = XyloSim.from_config(config)
+    mod_numpy = XyloSim.from_config(config, engine="numpy", output_mode="Vmem")
+
+    # - Evolve a batch with the numpy engine and compare with XyloSim
+    B, T = 2, 200
+    input_raster = np.random.randint(0, 3, (B, T, Nin))
+    out_batch, _, rec_batch = mod_numpy(input_raster, record=True)
+
+    for b in range(B):
+        mod_xylosim.reset_state()
+        _, _, rec = mod_xylosim(input_raster[b], record=True)
+
+        assert np.array_equal(rec["Vmem_out"], out_batch[b])
+        for k in rec:
+            assert np.array_equal(rec[k], rec_batch[k][b]), k
@@ -138,3 +138,38 @@ def test_ExpSynJax_constant():
     vgf = jax.jit(jax.value_and_grad(loss))
     l, g = vgf(esMod.parameters(), esMod, sp_rand)
     print(l, g)
+
+
+def test_ExpSynJax_checkpoint():
+    from rockpool.nn.modules import ExpSynJax
+    import numpy as np
+    import jax
+
+    T = 1003
+    N = 4
+
+    esMod = ExpSynJax(N, rng_key=jax.random.PRNGKey(0))
+    esMod_ckpt = ExpSynJax(N, checkpoint_every=100, rng_key=jax.random.PRNGKey(0))
+
+    sp_rand = np.random.rand(2, T, N) < 0.1
+
+    out, ns, _ = esMod(sp_rand)
+    out_ckpt, ns_ckpt, _ = jax.jit(esMod_ckpt)(sp_rand)
+    assert np.allclose(out, out_ckpt)
+    assert np.allclose(ns["isyn"], ns_ckpt["isyn"])
+
+    def loss(params, net, input):
+        net = net.set_attributes(params)
+        output, _, _ = net(input)
+        return np.sum(output**2)
+
+    g = jax.grad(loss)(esMod.parameters(), esMod, sp_rand)
+    g_ckpt = jax.grad(loss)(esMod_ckpt.parameters(), esMod_ckpt, sp_rand)
+    assert np.allclose(g["tau"], g_ckpt["tau"], rtol=1e-4)
+
+    # - Chunk lengths must be positive integers
+    import pytest
+
+    for checkpoint_every in [0, -1, 2.5]:
+        with pytest.raises(ValueError):
+            ExpSynJax(N, checkpoint_every=checkpoint_every)
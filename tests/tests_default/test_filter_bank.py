@@ -127,3 +127,76 @@ def test_butter_filter():
 
     # evolve()
     ts_output = lyr.evolve(signal)
+
+
+def test_filter_bank_streaming():
+    from rockpool.nn.modules import ButterMelFilter, ButterFilter
+    import numpy as np
+    import pytest
+    import scipy
+
+    fs, f_max, duration = (10e3, 5e3, 1.0)
+    times = np.arange(0.0, duration, 1 / fs)
+    signal = np.reshape(scipy.signal.chirp(times, 0.0, duration, f_max), (-1, 1))
+    chunk = int(10e-3 * fs)
+
+    for kwargs in [
+        {"fs": fs, "shape": 16},
+        {"fs": fs, "shape": 16, "use_lowpass": False},
+    ]:
+        # - Filter the full signal at once
+        lyr = ButterMelFilter(**kwargs)
+        output_full, _, _ = lyr(signal)
+
+        # - Filter the signal in 10 ms chunks
+        lyr = ButterMelFilter(**kwargs, streaming=True)
+        output_chunks = [
+            lyr(signal[i : i + chunk])[0] for i in range(0, signal.shape[0], chunk)
+        ]
+        assert np.allclose(np.concatenate(output_chunks), output_full)
+
+        # - Resetting the state restarts the filters
+        lyr.reset_state()
+        output, state, _ = lyr(signal)
+        assert np.allclose(output, output_full)
+        assert "zi" in state
+
+    lyr = ButterFilter(
+        fs=fs, frequency=np.linspace(1000, 4000, 4), bandwidth=200, streaming=True
+    )
+    output_full, _, _ = ButterFilter(
+        fs=fs, frequency=np.linspace(1000, 4000, 4), bandwidth=200
+    )(signal)
+    output_chunks = [
+        lyr(signal[i : i + chunk])[0] for i in range(0, signal.shape[0], chunk)
+    ]
+    assert np.allclose(np.concatenate(output_chunks), output_full)
+
+    # - Streaming is incompatible with normalisation
+    with pytest.raises(ValueError):
+        ButterMelFilter(fs=fs, streaming=True, normalize=True)
+
+
+def test_filter_bank_workers():
+    from rockpool.nn.modules import ButterMelFilter
+    import numpy as np
+
+    fs = 10e3
+    signal = np.random.randn(int(fs), 1)
+
+    output_serial, _, _ = ButterMelFilter(fs=fs, shape=16)(signal)
+
+    # - Parallel filtering gives identical results
+    lyr = ButterMelFilter(fs=fs, shape=16, num_workers=4)
+    output_parallel, _, _ = lyr(signal)
+    assert np.array_equal(output_parallel, output_serial)
+    assert lyr._pool is not None
+
+    # - Shutting down the pool is clean, and the pool is recreated on demand
+    lyr._terminate()
+    assert lyr._pool is None
+    lyr._terminate()
+
+    output_parallel, _, _ = lyr(signal)
+    assert np.array_equal(output_parallel, output_serial)
+    lyr._terminate()
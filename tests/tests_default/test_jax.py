@@ -149,6 +149,120 @@ def test_rate_jax_tree():
     tree_unflatten(treedef, tree)
 
 
+def test_jax_tree_round_trip():
+    from rockpool.nn.modules import RateJax, LIFJax, LinearJax
+    from rockpool.nn.combinators import Sequential
+    import jax
+    import numpy as np
+
+    net = Sequential(LinearJax((2, 3)), LIFJax(3), RateJax(3, has_rec=True))
+    leaves, treedef = jax.tree_util.tree_flatten(net)
+    net_rt = jax.tree_util.tree_unflatten(treedef, leaves)
+
+    # - Round-trip preserves structure, attributes and configuration
+    assert jax.tree_util.tree_structure(net_rt) == treedef
+    assert str(net_rt) == str(net)
+    assert net_rt[1]._init_args.keys() == net[1]._init_args.keys()
+    for a, b in zip(jax.tree_util.tree_leaves(net_rt), leaves):
+        assert a is b
+
+    # - Round-tripped module evolves identically, with and without jit
+    input = np.random.rand(10, 2)
+    out, state, _ = net(input)
+    out_rt, state_rt, _ = net_rt(input)
+    assert np.allclose(out, out_rt)
+    assert np.allclose(out, jax.jit(lambda m, x: m(x)[0])(net_rt, input))
+
+    # - Functional API still works on the round-tripped module
+    net_rt = net_rt.set_attributes(state_rt)
+    assert np.allclose(net_rt[1].vmem, state["1_LIFJax"]["vmem"])
+
+    net_rt = net_rt.reset_state()
+    assert np.allclose(net_rt[1].vmem, 0.0)
+
+    w = np.array(net_rt[0].weight)
+    net_rt = net_rt.reset_parameters()
+    assert not np.allclose(net_rt[0].weight, w)
+    assert net_rt[2].w_rec.shape == (3, 3)
+
+
+def test_jax_tree_jit_configuration():
+    from rockpool.nn.modules import LIFJax
+    import jax
+    import numpy as np
+
+    num_traces = []
+
+    @jax.jit
+    def round_trip(mod):
+        num_traces.append(1)
+        return mod
+
+    # - Modules with different configurations do not share compiled functions
+    assert round_trip(LIFJax(4, spiking_output=True)).spiking_output
+    assert not round_trip(LIFJax(4, spiking_output=False)).spiking_output
+    assert round_trip(LIFJax(4, use_scan=True))._use_scan
+    assert not round_trip(LIFJax(4))._use_scan
+    assert round_trip(LIFJax(4, checkpoint_every=5))._checkpoint_every == 5
+    assert len(num_traces) == 4
+
+    # - Separately constructed modules with the same configuration share compiled functions
+    mod = round_trip(LIFJax(4, spiking_output=True))
+    assert mod.spiking_output
+    assert len(num_traces) == 4
+
+
+def test_rate_jax_record_checkpoint():
+    from rockpool.nn.modules import RateJax
+    import jax
+    import numpy as np
+
+    N = 4
+    T = 103
+    input = np.random.rand(2, T, N)
+
+    mod = RateJax(N, has_rec=True, rng_key=jax.random.PRNGKey(0))
+    mod_ckpt = RateJax(
+        N,
+        has_rec=True,
+        w_rec=mod.w_rec,
+        checkpoint_every=10,
+        rng_key=jax.random.PRNGKey(0),
+    )
+
+    # - States are only recorded if requested
+    out, _, r_d = mod(input)
+    assert r_d == {}
+
+    out_rec, _, r_d = mod(input, record=True)
+    assert np.allclose(out, out_rec)
+    assert r_d["x"].shape == (2, T, N)
+
+    # - Checkpointed evolution and gradients match, including a partial chunk
+    out_ckpt, ns_ckpt, r_d_ckpt = jax.jit(lambda mod, input: mod(input, record=True))(
+        mod_ckpt, input
+    )
+    assert np.allclose(out, out_ckpt)
+    assert np.allclose(r_d["x"], r_d_ckpt["x"])
+
+    def loss(params, mod):
+        mod = mod.set_attributes(params)
+        out, _, _ = mod(input)
+        return np.sum(out**2)
+
+    grads = jax.grad(loss)(mod.parameters(), mod)
+    grads_ckpt = jax.grad(loss)(mod_ckpt.parameters(), mod_ckpt)
+    for k in grads:
+        assert np.allclose(grads[k], grads_ckpt[k], rtol=1e-4)
+
+    # - Chunk lengths must be positive integers
+    import pytest
+
+    for checkpoint_every in [0, -1, 2.5]:
+        with pytest.raises(ValueError):
+            RateJax(N, checkpoint_every=checkpoint_every)
+
+
 def test_ffwd_net():
     from rockpool.nn.modules import RateJax
     from rockpool.nn.modules import JaxModule
@@ -33,3 +33,85 @@ def test_lif():
     print("evolving recurrent")
     o, ns, r_d = lyr(np.random.rand(T, N))
     o, ns, r_d = lyr(np.random.rand(batches, T, N))
+
+
+def test_lif_batched_engine():
+    from rockpool.nn.modules import LIF
+    from rockpool.nn.modules.native.lif import spike_subtract_threshold
+
+    import numpy as np
+
+    def reference_evolve(mod, input_data, noise_ts):
+        # - Step each batch and time-step individually
+        batches, T, _ = input_data.shape
+        input_data = input_data.reshape(batches, T, mod.size_out, mod.n_synapses)
+        alpha = np.exp(-mod.dt / mod.tau_mem)
+        beta = np.exp(-mod.dt / mod.tau_syn)
+
+        spikes_ts = np.zeros((batches, T, mod.size_out))
+        vmem_ts = np.zeros((batches, T, mod.size_out))
+        for b in range(batches):
+            spikes = np.zeros(mod.size_out)
+            isyn = np.zeros((mod.size_out, mod.n_synapses))
+            vmem = np.zeros(mod.size_out)
+            for t in range(T):
+                irec = (
+                    np.dot(spikes, mod.w_rec).reshape(mod.size_out, mod.n_synapses)
+                    if hasattr(mod, "w_rec")
+                    else 0.0
+                )
+                isyn = (isyn + input_data[b, t] + irec) * beta
+                vmem = vmem * alpha + isyn.sum(1) + noise_ts[b, t] + mod.bias
+                spikes = spike_subtract_threshold(
+                    vmem, mod.threshold, None, mod.max_spikes_per_dt
+                )
+                vmem = vmem - spikes * mod.threshold
+                spikes_ts[b, t] = spikes
+                vmem_ts[b, t] = vmem
+
+        return spikes_ts, vmem_ts
+
+    batches, T, Nin, N = 3, 50, 8, 4
+    input_data = np.random.rand(batches, T, Nin) * 2
+
+    for kwargs in [
+        {},
+        {"has_rec": True},
+        {"noise_std": 0.1},
+        {"max_spikes_per_dt": 1},
+        {"tau_syn": np.random.rand(N, 2) * 50e-3 + 5e-3},
+    ]:
+        mod = LIF((Nin, N), **kwargs)
+
+        np.random.seed(1)
+        out, _, rd = mod(input_data, record=True)
+
+        np.random.seed(1)
+        noise_ts = (
+            mod.noise_std * np.sqrt(mod.dt) * np.random.randn(batches, T, mod.size_out)
+        )
+        spikes_ref, vmem_ref = reference_evolve(mod, input_data, noise_ts)
+
+        assert np.allclose(out, spikes_ref)
+        assert np.allclose(rd["vmem"], vmem_ref)
+
+
+def test_lif_record_free():
+    from rockpool.nn.modules import LIF
+
+    import numpy as np
+
+    for has_rec in [False, True]:
+        mod = LIF((8, 4), has_rec=has_rec)
+        mod._block_timesteps = 7
+        input_data = np.random.rand(2, 50, 8)
+
+        out_rec, state_rec, rd = mod(input_data, record=True)
+        mod = mod.reset_state()
+        out, state, rd_empty = mod(input_data, record=False)
+
+        assert rd_empty == {}
+        assert set(rd.keys()) == {"irec", "isyn", "vmem", "spikes"}
+        assert np.allclose(out, out_rec)
+        for k in state:
+            assert np.allclose(state[k], state_rec[k])
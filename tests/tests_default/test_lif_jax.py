@@ -326,6 +326,123 @@ def test_lif_jax_batches():
     lyr = lyr.set_attributes(n_s)
 
 
+def test_lif_jax_ffwd():
+    import pytest
+
+    pytest.importorskip("jax")
+
+    from rockpool.nn.modules.jax.lif_jax import LIFJax
+    import jax
+    import numpy as np
+
+    batches = 2
+    Nin = 8
+    N = 4
+    T = 100
+
+    input = np.random.rand(batches, T, Nin) * 0.5
+    kwargs = {
+        "tau_mem": 50e-3,
+        "tau_syn": np.random.rand(N, 2) * 50e-3 + 10e-3,
+        "threshold": 0.7,
+        "rng_key": jax.random.PRNGKey(1),
+    }
+    lyr = LIFJax((Nin, N), **kwargs)
+
+    # - Feed-forward modules have no recurrent weights or input
+    assert not hasattr(lyr, "w_rec")
+    out, ns, r_d = lyr(input, record=True)
+    assert np.all(r_d["irec"] == 0.0)
+
+    # - Feed-forward modules remain feed-forward under jit
+    out_jit, _, _ = jax.jit(lambda mod, input: mod(input))(lyr, input)
+    assert np.allclose(out, out_jit)
+
+    # - Solving synaptic currents with a parallel scan matches step-by-step evolution
+    lyr_scan = LIFJax((Nin, N), use_scan=True, **kwargs)
+    out_scan, ns_scan, r_d_scan = jax.jit(lambda mod, input: mod(input, record=True))(
+        lyr_scan, input
+    )
+    assert np.allclose(r_d["isyn"], r_d_scan["isyn"], atol=1e-4)
+    assert np.allclose(r_d["vmem"], r_d_scan["vmem"], atol=1e-3)
+    assert np.allclose(ns["isyn"], ns_scan["isyn"], atol=1e-4)
+
+    def loss(params, mod):
+        mod = mod.set_attributes(params)
+        out, _, _ = mod(input)
+        return np.sum(out**2)
+
+    grads = jax.grad(loss)(lyr.parameters(), lyr)
+    grads_scan = jax.grad(loss)(lyr_scan.parameters(), lyr_scan)
+    for k in grads:
+        assert np.allclose(grads[k], grads_scan[k], rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        LIFJax(N, has_rec=True, use_scan=True)
+
+    from rockpool.nn.modules.jax.jax_lif_ode import LIFODEJax
+
+    with pytest.raises(ValueError):
+        LIFODEJax(N, use_scan=True)
+
+
+def test_lif_jax_record_checkpoint():
+    import pytest
+
+    pytest.importorskip("jax")
+
+    from rockpool.nn.modules.jax.lif_jax import LIFJax
+    import jax
+    import numpy as np
+
+    N = 4
+    T = 205
+    input = np.random.rand(2, T, N) * 0.5
+
+    for kwargs in [{"has_rec": True}, {"use_scan": True}]:
+        lyr = LIFJax(N, threshold=0.5, rng_key=jax.random.PRNGKey(0), **kwargs)
+        lyr_ckpt = LIFJax(
+            N,
+            threshold=0.5,
+            checkpoint_every=20,
+            rng_key=jax.random.PRNGKey(0),
+            **kwargs,
+            **({"w_rec": lyr.w_rec} if "has_rec" in kwargs else {}),
+        )
+
+        # - States are only recorded if requested
+        out, ns, r_d = lyr(input)
+        assert r_d == {}
+
+        out_rec, ns_rec, r_d = lyr(input, record=True)
+        assert np.allclose(out, out_rec)
+        assert np.allclose(ns["vmem"], r_d["vmem"][0, -1])
+        assert set(r_d.keys()) == {"irec", "isyn", "spikes", "vmem"}
+
+        # - Checkpointed evolution matches, including a partial chunk
+        out_ckpt, ns_ckpt, r_d_ckpt = jax.jit(
+            lambda mod, input: mod(input, record=True)
+        )(lyr_ckpt, input)
+        assert np.allclose(out, out_ckpt)
+        assert np.allclose(r_d["vmem"], r_d_ckpt["vmem"], atol=1e-5)
+        assert np.allclose(ns["isyn"], ns_ckpt["isyn"], atol=1e-5)
+
+        def loss(params, mod):
+            mod = mod.set_attributes(params)
+            out, _, _ = mod(input)
+            return np.sum(out**2)
+
+        grads = jax.grad(loss)(lyr.parameters(), lyr)
+        grads_ckpt = jax.grad(loss)(lyr_ckpt.parameters(), lyr_ckpt)
+        for k in grads:
+            assert np.allclose(grads[k], grads_ckpt[k], rtol=1e-4, equal_nan=True)
+
+    # - Chunk lengths must be positive integers
+    for checkpoint_every in [0, -1, 2.5]:
+        with pytest.raises(ValueError):
+            LIFJax(N, checkpoint_every=checkpoint_every)
+
+
 def test_linear_lif():
     import pytest
 
@@ -513,3 +513,119 @@ def test_LIFTorch_initialization_bitshifts():
         raise AssertionError(
             "ValueError was not raised for wrong parameter initilization"
         )
+
+
+def test_LIFTorch_scan():
+    from rockpool.nn.modules.torch.lif_torch import LIFTorch
+    import torch
+
+    n_synapses = 2
+    n_neurons = 5
+    n_batches = 3
+    T = 50
+    tau_mem = torch.rand(n_neurons) * 50e-3 + 10e-3
+    tau_syn = torch.rand(n_neurons, n_synapses) * 50e-3 + 10e-3
+    input_data = torch.rand(n_batches, T, n_synapses * n_neurons) * 0.5
+
+    results = []
+    for use_scan in [False, True]:
+        mod = LIFTorch(
+            shape=(n_synapses * n_neurons, n_neurons),
+            tau_mem=tau_mem,
+            tau_syn=tau_syn,
+            use_scan=use_scan,
+        )
+        data = input_data.clone().requires_grad_(True)
+        out, ns, rd = mod(data, record=True)
+        (out.sum() + rd["vmem"].sum()).backward()
+        results.append((out, ns, rd, data.grad, mod.tau_mem.grad, mod.tau_syn.grad))
+
+    (out, ns, rd, *grads), (out_s, ns_s, rd_s, *grads_s) = results
+
+    assert torch.allclose(out, out_s)
+    assert torch.allclose(rd["isyn"], rd_s["isyn"], atol=1e-4)
+    assert torch.allclose(rd["vmem"], rd_s["vmem"], atol=1e-4)
+    for k in ns:
+        assert torch.allclose(ns[k], ns_s[k], atol=1e-4)
+    for g, g_s in zip(grads, grads_s):
+        assert torch.allclose(g, g_s, rtol=1e-3, atol=1e-4)
+
+    # - Scan mode is only available for feed-forward modules
+    with pytest.raises(ValueError):
+        LIFTorch(n_neurons, has_rec=True, use_scan=True)
+
+    # - Scan mode is rejected by modules that do not implement it
+    from rockpool.nn.modules.torch.ahp_lif_torch import aLIFTorch
+
+    with pytest.raises(ValueError):
+        aLIFTorch(n_neurons, use_scan=True)
+
+
+def test_linear_scan_memory():
+    from rockpool.nn.modules.torch.lif_torch import linear_scan
+    import torch
+
+    decay = torch.rand(4, 2, requires_grad=True)
+    data = torch.randn(2, 4096, 4, 2, requires_grad=True)
+
+    # - Measure the tensors saved for the backward pass
+    saved_bytes = [0]
+
+    def pack(tensor):
+        saved_bytes[0] += tensor.numel() * tensor.element_size()
+        return tensor
+
+    with torch.autograd.graph.saved_tensors_hooks(pack, lambda tensor: tensor):
+        output = linear_scan(decay, data)
+
+    # - Memory used for training grows linearly with the number of time-steps
+    data_bytes = data.numel() * data.element_size()
+    assert saved_bytes[0] <= 2 * data_bytes
+
+    # - Gradients match a sequential evolution
+    output.sum().backward()
+    grads = decay.grad, data.grad
+    decay.grad = data.grad = None
+
+    state = torch.zeros_like(data[:, 0])
+    outputs = []
+    for t in range(data.shape[1]):
+        state = decay * state + data[:, t]
+        outputs.append(state)
+    torch.stack(outputs, 1).sum().backward()
+
+    assert torch.allclose(output, torch.stack(outputs, 1), atol=1e-4)
+    assert torch.allclose(grads[0], decay.grad, rtol=1e-3)
+    assert torch.allclose(grads[1], data.grad, rtol=1e-3, atol=1e-4)
+
+
+def test_LIFTorch_leak_cache():
+    from rockpool.nn.modules.torch.lif_torch import LIFTorch
+    import torch
+
+    mod = LIFTorch(4)
+
+    # - Count computations of leak parameters
+    n_calls = [0]
+    compute_fn = mod._compute_all_leak_params
+
+    def counting_compute_fn():
+        n_calls[0] += 1
+        return compute_fn()
+
+    mod._compute_all_leak_params = counting_compute_fn
+
+    # - Leak parameters are computed once per evolution
+    opt = torch.optim.SGD(mod.parameters().astorch(), lr=1e-3)
+    for _ in range(3):
+        n_calls[0] = 0
+        out, _, _ = mod(torch.rand(1, 20, 4) * 2)
+        assert n_calls[0] == 1
+
+        out.sum().backward()
+        opt.step()
+        opt.zero_grad()
+
+    # - Decays follow changes to the time constants
+    mod.tau_mem = torch.ones(4) * 50e-3
+    assert torch.allclose(mod.alpha, torch.exp(-mod.dt / mod.tau_mem))
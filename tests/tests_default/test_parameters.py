@@ -71,3 +71,44 @@ def test_parameters():
     mod = TestMod(None, Parameter(Constant(3)))
     assert "param" not in mod.parameters()
     assert "param" in mod.simulation_parameters()
+
+
+def test_init_data_snapshot():
+    from rockpool.parameters import Parameter
+    from rockpool.nn.modules import Module
+
+    import numpy as np
+
+    class TestMod(Module):
+        def __init__(self, shape, param, *args, **kwargs):
+            super().__init__(shape=shape, *args, **kwargs)
+            self.param = param
+
+        def evolve(self, *args, **kwargs):
+            pass
+
+    data = np.random.rand(3, 4)
+
+    # - Concrete initialisation data is only referenced by the parameter
+    param = Parameter(data)
+    assert param.init_func.data is data
+
+    # - Modules take a snapshot of mutable data by default
+    mod = TestMod(data.shape, Parameter(data.copy()))
+    mod.param[:] = 0.0
+    mod.reset_parameters()
+    assert np.allclose(mod.param, data)
+
+    mod.param = np.zeros_like(data)
+    mod.reset_parameters()
+    assert np.allclose(mod.param, data)
+
+    # - Opting out of snapshots keeps only a reference to the data
+    init_data = data.copy()
+    mod = TestMod(data.shape, Parameter(init_data), snapshot_init_data=False)
+    assert mod.param is init_data
+
+    mod.param = np.zeros_like(data)
+    mod.reset_parameters()
+    assert np.allclose(mod.param, data)
+    assert mod.param is not init_data
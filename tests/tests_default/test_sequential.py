@@ -369,3 +369,31 @@ def test_FFwdStack_torch():
     # - Test parameters
     print(seq.parameters())
     print(seq.state())
+
+
+def test_Sequential_record():
+    from rockpool.nn.combinators import Sequential, Residual
+    from rockpool.nn.modules import Linear, LinearJax, Rate
+
+    import numpy as np
+
+    input_data = np.random.rand(10, 2)
+
+    # - Intermediate outputs are only retained when recording
+    seq = Sequential(Linear((2, 3)), Rate(3), Linear((3, 2)))
+    out, _, rec = seq(input_data)
+    assert rec == {}
+
+    out, _, rec = seq(input_data, record=True)
+    assert "1_Rate" in rec
+    assert np.allclose(rec["2_Linear_output"], out)
+    assert rec["2_Linear_output"] is not out
+
+    res = Residual(Linear((2, 3)), Linear((3, 2)))
+    _, _, rec = res(input_data)
+    assert rec == {}
+
+    # - Jax outputs are recorded without copying
+    seq = Sequential(LinearJax((2, 3)), LinearJax((3, 2)))
+    out, _, rec = seq(input_data, record=True)
+    assert rec["1_LinearJax_output"] is out
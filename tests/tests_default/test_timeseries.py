@@ -387,6 +387,53 @@ def test_continuous_inplace_mutation():
     assert ts1.t_start == 0
 
 
+def test_continuous_inplace_arithmetic_lazy():
+    from rockpool import TSContinuous, TSExpression
+    import numpy as np
+
+    np.random.seed(1)
+    samples_a = np.random.rand(1000, 3)
+    samples_a[5, 1] = np.nan
+    samples_b = np.random.rand(1000, 3) + 0.5
+    samples_b[[5, 9], [1, 2]] = np.nan
+
+    ts_a = TSContinuous.from_clocked(samples_a, dt=1e-3, name="a")
+    ts_b = TSContinuous.from_clocked(samples_b, dt=1e-3)
+
+    # - In-place operations reuse the sample buffer, with unchanged NaN handling
+    ts = ts_a.copy()
+    buffer = ts.samples
+    ts += ts_b
+    assert np.isnan(ts.samples[5, 1]) and not np.isnan(ts.samples[9, 2])
+    ts *= 2.0
+    ts -= np.ones(3)
+    ts /= 4.0
+    assert ts.samples is buffer
+    assert np.allclose(
+        ts.samples, ((ts_a + ts_b) * 2.0 - 1.0).samples / 4.0, equal_nan=True
+    )
+
+    # - Out-of-place results do not share data with their operands
+    ts_sum = ts_a + 1.0
+    ts_sum.times += 1.0
+    assert ts_a.t_start == 0.0
+
+    # - Lazy expressions match eager evaluation
+    w = np.random.rand(3, 2)
+    for expression, eager in [
+        (ts_a.lazy() * 2.0 + ts_b - 1.0, ts_a * 2.0 + ts_b - 1.0),
+        (3.0 - ts_a.lazy() / ts_b, 3.0 - ts_a / ts_b),
+        (abs(-ts_a.lazy()) ** 2 + ts_b.lazy(), abs(-ts_a) ** 2 + ts_b),
+        ((ts_b + ts_a.lazy()) @ w, (ts_b + ts_a) @ w),
+    ]:
+        assert isinstance(expression, TSExpression)
+        ts_result = expression.evaluate()
+        assert ts_result.name == eager.name
+        assert ts_result.samples.shape == eager.samples.shape
+        assert np.allclose(ts_result.samples, eager.samples, equal_nan=True)
+        assert np.all(np.isnan(ts_result.samples) == np.isnan(eager.samples))
+
+
 def test_continuous_append_c():
     """
     Test append_c method of TSContinuous
@@ -636,6 +683,113 @@ def test_continuous_from_clocked():
     ts = TSContinuous.from_clocked(data, dt=0.1, name="test")
 
 
+def test_continuous_clocked_interpolation():
+    from rockpool import TSContinuous
+    import numpy as np
+    import scipy.interpolate as spint
+
+    np.random.seed(1)
+    data = np.random.rand(50, 3)
+    dt = 1e-3
+
+    # - Non-uniform series are not clocked
+    assert TSContinuous([0, 1, 3], [0, 1, 2]).dt is None
+
+    for interp_kind in ["previous", "linear"]:
+        ts = TSContinuous.from_clocked(
+            data, dt=dt, t_start=0.5, interp_kind=interp_kind
+        )
+        assert np.isclose(ts.dt, dt)
+        assert not isinstance(ts.interp, spint.interp1d)
+
+        # - Compare against the scipy interpolator
+        ref_interp = spint.interp1d(
+            ts.times,
+            ts.samples,
+            kind=interp_kind,
+            axis=0,
+            assume_sorted=True,
+            bounds_error=False,
+            fill_value="extrapolate",
+        )
+        times = np.r_[
+            ts.times,
+            np.nextafter(ts.times, np.inf)[:-1],
+            np.nextafter(ts.times, -np.inf)[1:],
+            np.random.uniform(ts.t_start, ts.times[-1], 100),
+        ]
+        assert np.array_equal(ts(times), ref_interp(times))
+
+        # - Resampling uses the same path
+        assert np.array_equal(ts.resample(times).samples, ref_interp(times))
+
+    # - Sample-and-hold up to `t_stop`
+    ts = TSContinuous.from_clocked(data, dt=2**-10)
+    assert np.array_equal(ts(ts.t_stop), data[-1:])
+    assert np.array_equal(ts.to_clocked(2**-12), np.repeat(data, 4, axis=0))
+
+
+def test_continuous_envelope():
+    from rockpool import TSContinuous
+    import numpy as np
+
+    np.random.seed(1)
+    data = np.cumsum(np.random.randn(100000, 3), axis=0)
+    ts = TSContinuous.from_clocked(data, dt=1e-3)
+
+    # - Short time ranges are returned unchanged
+    times, samples = ts.envelope(10, 11, max_points=2000)
+    assert np.all(samples == data[10000:11001])
+
+    # - Envelopes preserve the range of the samples, for direct and cached summaries
+    for t_start, t_stop, max_points in [(0, 100, 500), (20.5, 30.5, 1000), (1, 2, 200)]:
+        times, samples = ts.envelope(t_start, t_stop, max_points)
+        ref = data[int(np.round(t_start * 1e3)) : int(np.round(t_stop * 1e3)) + 1]
+        assert samples.shape[0] <= max_points + 2
+        assert np.all(np.diff(times) >= 0)
+        assert np.all(samples.min(0) <= ref.min(0))
+        assert np.all(samples.max(0) >= ref.max(0))
+
+    # - Cached summaries are rebuilt when samples change
+    assert ts._lod_pyramid is not None
+    ts.samples = -data
+    assert ts._lod_pyramid is None
+    assert np.all(ts.envelope(max_points=500)[1].max(0) == -data.min(0))
+
+
+def test_plot_level_of_detail():
+    import pytest
+
+    mpl = pytest.importorskip("matplotlib")
+    mpl.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from rockpool import TSContinuous, TSEvent
+    from rockpool.timeseries import set_global_ts_plotting_backend
+    import numpy as np
+
+    set_global_ts_plotting_backend("matplotlib")
+
+    # - Long continuous series are plotted as an envelope, recomputed on zooming
+    ts = TSContinuous.from_clocked(np.random.rand(100000, 2), dt=1e-3)
+    plt.figure()
+    lines = ts.plot(max_points=1000)
+    assert len(lines[0].get_xdata()) <= 1002
+    plt.gca().set_xlim(10, 10.5)
+    assert np.all(lines[0].get_xdata() == ts.times[10000:10501])
+    plt.close()
+
+    # - Many events are plotted as a density
+    tse = TSEvent(
+        np.sort(np.random.rand(1000)), np.arange(1000) % 4, t_start=0, t_stop=1
+    )
+    plt.figure()
+    image = tse.plot(max_points=100)
+    assert np.isclose(image.get_array().sum() * 1e-3, 1000)
+    assert isinstance(tse.plot(max_points=None), mpl.collections.PathCollection)
+    plt.close()
+
+
 def test_event_tstop():
     import pytest
     from rockpool import TSEvent
@@ -786,6 +940,285 @@ def test_event_raster():
     assert raster.shape == (0, 0)
 
 
+def test_event_raster_add_events_sparse():
+    """
+    Test TSEvent raster function accumulating events, with dense and sparse output
+    """
+    from rockpool import TSEvent
+    import numpy as np
+    import scipy.sparse as spsparse
+
+    times = [0.1, 0.2, 0.3, 1.5, 2.2, 2.7, 2.9]
+    channels = [0, 0, 1, 2, 1, 1, 1]
+    testTSEvent = TSEvent(times, channels, num_channels=4, t_stop=3)
+
+    expected = np.zeros((3, 4), int)
+    expected[0, 0] = 2
+    expected[0, 1] = 1
+    expected[1, 2] = 1
+    expected[2, 1] = 3
+
+    # - Dense accumulated raster
+    raster = testTSEvent.raster(dt=1, add_events=True)
+    assert np.array_equal(raster, expected)
+
+    # - Sparse accumulated and boolean rasters
+    raster_sparse = testTSEvent.raster(dt=1, add_events=True, sparse=True)
+    assert spsparse.isspmatrix_csr(raster_sparse)
+    assert np.array_equal(raster_sparse.toarray(), expected)
+
+    raster_sparse = testTSEvent.raster(dt=1, sparse=True)
+    assert raster_sparse.dtype == bool
+    assert np.array_equal(raster_sparse.toarray(), expected > 0)
+
+    # - Sparse raster of empty series
+    raster_sparse = TSEvent(num_channels=2).raster(dt=0.1, t_stop=1, sparse=True)
+    assert raster_sparse.shape == (10, 2)
+    assert raster_sparse.nnz == 0
+
+
+def test_event_window_queries():
+    """
+    Test TSEvent time-window queries by bisection and with a per-channel index
+    """
+    from rockpool import TSEvent
+    import numpy as np
+
+    np.random.seed(1)
+    times = np.sort(np.random.rand(1000) * 10)
+    channels = np.random.randint(0, 8, 1000)
+    testTSEvent = TSEvent(times, channels, t_stop=10.0, num_channels=10)
+
+    def brute_force(t_start, t_stop, chans):
+        include = (times >= t_start) & (times < t_stop)
+        if chans is not None:
+            include &= np.isin(channels, chans)
+        return times[include], channels[include]
+
+    queries = [(0.0, 10.0, None), (2.5, 2.6, None), (3.0, 7.0, [1, 4])]
+    queries += [(5.0, 9.0, 3), (1.0, 4.0, [9]), (times[10], times[20], [0, 2, 5])]
+
+    def check_queries():
+        for t_start, t_stop, chans in queries:
+            t, ch = testTSEvent(t_start, t_stop, chans)
+            t_exp, ch_exp = brute_force(t_start, t_stop, chans)
+            assert np.array_equal(t, t_exp)
+            assert np.array_equal(ch, ch_exp)
+
+            clipped = testTSEvent.clip(t_start, t_stop, chans)
+            assert np.array_equal(clipped.times, t_exp)
+            assert np.array_equal(clipped.channels, ch_exp)
+
+    # - Queries by bisection
+    check_queries()
+
+    # - Queries with a per-channel index
+    testTSEvent.build_channel_index()
+    assert testTSEvent._has_channel_index()
+    check_queries()
+
+    # - Returned data must not share memory with the original series
+    clipped = testTSEvent.clip(0.0, 5.0)
+    clipped.times[:] = 0.0
+    assert np.array_equal(testTSEvent.times, times)
+
+    # - Index is discarded when events are replaced
+    testTSEvent.channels = (channels + 1) % 10
+    assert not testTSEvent._has_channel_index()
+    channels = (channels + 1) % 10
+    check_queries()
+
+
+def test_event_compact_dtypes(tmp_path):
+    """
+    Test TSEvent compact storage, and preservation of data types over operations
+    """
+    import pytest
+    from rockpool import TSEvent
+    from rockpool.timeseries import load_ts_from_file
+    import numpy as np
+
+    np.random.seed(1)
+    times = np.sort(np.random.rand(500) * 10)
+    channels = np.random.randint(0, 300, 500)
+    ts = TSEvent(times, channels, t_stop=10.0, num_channels=300, compact=True)
+    ts_full = TSEvent(times, channels, t_stop=10.0, num_channels=300)
+
+    def check_dtypes(series):
+        assert series.times.dtype == np.float32
+        assert series.channels.dtype == np.uint16
+
+    check_dtypes(ts)
+    assert ts_full.times.dtype == float
+    assert ts_full.channels.dtype == int
+
+    # - Operations preserve data types
+    check_dtypes(ts.clip(2.0, 5.0, [1, 2, 3]))
+    check_dtypes(ts.delay(1.0))
+    check_dtypes(ts.merge(ts, delay=0.5))
+    check_dtypes(TSEvent.concatenate_t([ts, ts]))
+    check_dtypes(ts[10:20])
+
+    # - Queries and rasters match the full-precision series
+    for query in [(1.0, 2.0, None), (0.0, 10.0, [0, 5, 299])]:
+        assert np.array_equal(ts(*query)[1], ts_full(*query)[1])
+
+    assert np.array_equal(
+        ts.raster(0.1, add_events=True), ts_full.raster(0.1, add_events=True)
+    )
+
+    # - Saving and loading preserves data types
+    ts.save(str(tmp_path / "ts_compact"))
+    check_dtypes(load_ts_from_file(str(tmp_path / "ts_compact.npz")))
+
+    # - Channel data type must be sufficient
+    with pytest.raises(ValueError):
+        TSEvent(times, channels, t_stop=10.0, dtype_channels="uint8")
+
+
+def test_event_merge_builder():
+    """
+    Test merging many sorted TSEvent series, and incremental construction with TSEventBuilder
+    """
+    from rockpool import TSEvent, TSEventBuilder
+    import numpy as np
+
+    np.random.seed(1)
+    series = [
+        TSEvent(np.sort(np.random.rand(50)), ch, t_start=0.0, t_stop=1.0)
+        for ch in range(20)
+    ]
+
+    # - Merging overlapping series gives all events, sorted in time
+    merged = series[0].merge(series[1:])
+    all_times = np.concatenate([s.times for s in series])
+    all_channels = np.concatenate([s.channels for s in series])
+    order = np.argsort(all_times, kind="stable")
+    assert np.array_equal(merged.times, all_times[order])
+    assert np.array_equal(merged.channels, all_channels[order])
+    assert merged.num_channels == 20
+
+    # - Builder matches concatenation in time
+    builder = TSEventBuilder()
+    for s in series:
+        builder.append_t(s, offset=0.5)
+    built = builder.build()
+    concatenated = TSEvent.concatenate_t(series, offset=0.5)
+    assert len(builder) == len(concatenated)
+    assert np.allclose(built.times, concatenated.times)
+    assert np.array_equal(built.channels, concatenated.channels)
+    assert np.isclose(built.t_stop, concatenated.t_stop)
+
+    # - Overlapping raw chunks are merged on build
+    built = TSEventBuilder().append([0.5, 0.7], 1).append([0.1, 0.6], [0, 2]).build()
+    assert np.array_equal(built.times, [0.1, 0.5, 0.6, 0.7])
+    assert np.array_equal(built.channels, [0, 1, 2, 1])
+    assert built.num_channels == 3
+    assert built.t_stop > 0.7
+
+    # - Compact builders stop after the last event as stored in `float32`
+    built = TSEventBuilder(compact=True).append([0.05, 0.1], [0, 1]).build()
+    assert built.times.dtype == np.float32
+    assert built.t_stop > built.times[-1]
+
+
+def test_chunked_store(tmp_path):
+    import pytest
+    from rockpool import TSEvent, TSContinuous, TSChunkedStore
+    import numpy as np
+
+    # - Append event series in chunks
+    store = TSChunkedStore(tmp_path / "events")
+    series = [
+        TSEvent(
+            np.sort(np.random.rand(100)) + i,
+            np.arange(100) % 4,
+            t_start=i,
+            t_stop=i + 1,
+        )
+        for i in range(5)
+    ]
+    for ts in series:
+        store.append(ts)
+    full = TSEvent.concatenate_t(series)
+
+    assert len(store) == 5
+    assert np.all(store.chunk_times == [[i, i + 1] for i in range(5)])
+    assert isinstance(store.load_chunk(2).times, np.memmap)
+
+    # - Read windows from a re-opened store
+    store = TSChunkedStore(tmp_path / "events")
+    for t_start, t_stop in [(0.5, 3.2), (1, 2), (None, None)]:
+        ts = store.read(t_start, t_stop)
+        ts_ref = full.clip(t_start, t_stop)
+        assert np.all(ts.times == ts_ref.times)
+        assert np.all(ts.channels == ts_ref.channels)
+        assert ts.t_start == ts_ref.t_start and ts.t_stop == ts_ref.t_stop
+
+    assert np.all(store.read(1, 2, channels=1).channels == 1)
+
+    # - Series must not overlap the store, unless shifted with an offset
+    with pytest.raises(ValueError):
+        store.append(series[0])
+    store.append(series[0], offset=1.0)
+    assert store.t_stop == 7
+
+    # - Windows are clamped to the range of the store
+    ts = store.read(-1, 10)
+    assert ts.t_start == 0 and ts.t_stop == 7
+    assert len(ts) == 600
+    with pytest.raises(ValueError):
+        store.read(8, 10)
+
+    # - Series must be of the same class
+    with pytest.raises(TypeError):
+        store.append(TSContinuous([0, 1], [0, 1]))
+
+    # - Chunks with different data types are read without loss of precision
+    store = TSChunkedStore(tmp_path / "mixed")
+    precise = TSEvent([0.1234567891, 0.5], [0, 3], t_stop=1)
+    store.append(precise)
+    store.append(TSEvent([1.5], [299], t_start=1, t_stop=2, compact=True))
+    ts = store.read()
+    assert ts.times.dtype == np.float64
+    assert np.all(ts.times[:2] == precise.times)
+    assert np.all(ts.channels == [0, 3, 299])
+
+    store = TSChunkedStore(tmp_path / "mixed_channels")
+    store.append(TSEvent([0.5], [3], t_stop=1, compact=True))
+    store.append(TSEvent([1.5], [299], t_start=1, t_stop=2))
+    ts = store.read(0, 1)
+    assert ts.num_channels == 300
+    assert np.iinfo(ts.channels.dtype).max >= 299
+
+    # - Continuous series
+    data = np.random.rand(1000, 2)
+    store = TSChunkedStore(tmp_path / "continuous")
+    for i in range(10):
+        store.append(
+            TSContinuous(
+                np.arange(100) + i * 100,
+                data[i * 100 : (i + 1) * 100],
+                t_stop=(i + 1) * 100,
+            )
+        )
+    full = TSContinuous(np.arange(1000), data, t_stop=1000)
+
+    for t_start, t_stop in [(50.5, 320.2), (100, 200), (199.5, 200.5)]:
+        ts = store.read(t_start, t_stop)
+        ts_ref = full.clip(t_start, t_stop)
+        assert np.all(ts.times == ts_ref.times)
+        assert np.all(ts.samples == ts_ref.samples)
+
+    # - Windows are clamped to the range of the store
+    ts = store.read(950.5, 1200)
+    assert ts.t_stop == 1000
+    assert np.all(ts.samples == full.clip(950.5, 1000).samples)
+    assert store.read(-10, 10).t_start == 0
+    with pytest.raises(ValueError):
+        store.read(1100, 1200)
+
+
 def test_event_from_raster():
     """
     Test TSEvent from_raster method
@@ -839,6 +1272,43 @@ def test_event_from_raster():
     assert test_raster.shape == (20, 5)
 
 
+def test_event_from_raster_types():
+    """
+    Test TSEvent from_raster with raster data types, sparse rasters and raster blocks
+    """
+    from rockpool import TSEvent
+    import rockpool.timeseries as ts_module
+    import numpy as np
+    import scipy.sparse as sparse
+
+    np.random.seed(1)
+    raster = np.random.randint(0, 3, (100, 6)) * (np.random.rand(100, 6) > 0.5)
+    ts_ref = TSEvent.from_raster(raster, dt=1e-3, t_start=0.5)
+
+    # - Float values are truncated to event counts
+    for raster_typed in [raster.astype("uint8"), raster.astype("float32") + 0.3]:
+        ts = TSEvent.from_raster(raster_typed, dt=1e-3, t_start=0.5)
+        assert np.all(ts.times == ts_ref.times)
+        assert np.all(ts.channels == ts_ref.channels)
+
+    # - Sparse rasters
+    for raster_sparse in [sparse.csr_matrix(raster), sparse.coo_matrix(raster)]:
+        ts = TSEvent.from_raster(raster_sparse, dt=1e-3, t_start=0.5)
+        assert np.all(ts.times == ts_ref.times)
+        assert np.all(ts.channels == ts_ref.channels)
+
+    # - Processing in small row blocks gives the same result
+    block_elements = ts_module._RASTER_BLOCK_ELEMENTS
+    try:
+        ts_module._RASTER_BLOCK_ELEMENTS = 7
+        ts = TSEvent.from_raster(raster > 0, dt=1e-3, t_start=0.5, compact=True)
+    finally:
+        ts_module._RASTER_BLOCK_ELEMENTS = block_elements
+
+    assert ts.channels.dtype == np.uint8
+    assert np.all(ts.raster(1e-3) == (raster > 0))
+
+
 def test_event_raster_explicit_num_channels():
     """
     Test TSEvent raster method when the function is initialized with explicit number of Channels
@@ -1347,6 +1817,97 @@ def test_tsdictondisk():
         assert dod_0[k] == v
 
 
+def test_tsdictondisk_cache():
+    from rockpool import TSEvent, TSContinuous, TSDictOnDisk
+    import numpy as np
+    import pytest
+
+    tsc = TSContinuous.from_clocked(np.random.rand(1000, 2), dt=1e-3, name="tsc")
+    tsc.beyond_range_exception = False
+    tse = TSEvent(np.sort(np.random.rand(100)), np.arange(100) % 3, t_stop=1)
+
+    # - Cache is large enough for one series only
+    dod = TSDictOnDisk(
+        {"tsc": tsc, "tse": tse}, cache_bytes=tsc.times.nbytes + tsc.samples.nbytes
+    )
+
+    # - Series are read through memory maps, preserving all attributes
+    tsc_loaded = dod["tsc"]
+    assert isinstance(tsc_loaded.samples, np.memmap)
+    assert np.all(tsc_loaded.samples == tsc.samples)
+    assert tsc_loaded.dt == tsc.dt
+    assert not tsc_loaded.beyond_range_exception
+    assert np.all(tsc_loaded.clip(0.2, 0.3).samples == tsc.clip(0.2, 0.3).samples)
+    assert list(dod._cache) == ["tsc"]
+
+    # - Loading another series evicts the least recently used series
+    assert np.all(dod["tse"](0.2, 0.5)[0] == tse(0.2, 0.5)[0])
+    assert list(dod._cache) == ["tse"]
+
+    # - Returned series are copies, which can be modified without affecting the store
+    tse_loaded = dod["tse"]
+    tse_loaded.name = "changed"
+    tse_loaded.channels[0] = 3
+    assert dod["tse"].name == tse.name
+    assert dod["tse"].channels[0] == tse.channels[0]
+
+    tsc_loaded = dod["tsc"]
+    tsc_loaded += 1
+    assert np.allclose(tsc_loaded.samples, tsc.samples + 1)
+    assert np.allclose(tsc_loaded(0.5), tsc(0.5) + 1)
+    assert np.all(dod["tsc"].samples == tsc.samples)
+
+    # - Overwriting a key drops the cached series
+    dod["tse"] = tsc
+    assert "tse" not in dod._cache
+    assert np.all(dod["tse"].samples == tsc.samples)
+
+    # - Series can be read fully into memory, and share read-only arrays with the cache
+    dod = TSDictOnDisk({"tsc": tsc}, mmap=False)
+    assert not isinstance(dod["tsc"].samples, np.memmap)
+    assert np.all(dod["tsc"].samples == tsc.samples)
+    assert np.shares_memory(dod["tsc"].samples, dod["tsc"].samples)
+
+    tsc_loaded = dod["tsc"]
+    with pytest.raises(ValueError):
+        tsc_loaded.samples[0] = -1
+
+    tsc_loaded = tsc_loaded.copy()
+    tsc_loaded.samples[0] = -1
+    assert np.all(dod["tsc"].samples == tsc.samples)
+
+
+def test_tsdictondisk_cache_hit(monkeypatch):
+    from rockpool import TSContinuous, TSDictOnDisk
+    import numpy as np
+    import builtins
+    import tracemalloc
+
+    tsc = TSContinuous.from_clocked(np.random.rand(100_000, 4), dt=1e-3)
+    nbytes = tsc.times.nbytes + tsc.samples.nbytes
+
+    for mmap in [True, False]:
+        dod = TSDictOnDisk({"tsc": tsc}, mmap=mmap)
+        dod["tsc"]
+        dod["tsc"]
+
+        # - Cache hits neither open files nor allocate new arrays
+        def fail(*args, **kwargs):
+            raise AssertionError("Stored files must not be opened on a cache hit")
+
+        with monkeypatch.context() as m:
+            m.setattr(builtins, "open", fail)
+            m.setattr(np, "load", fail)
+
+            tracemalloc.start()
+            tsc_loaded = dod["tsc"]
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        assert peak < nbytes / 10
+        assert np.all(tsc_loaded.samples == tsc.samples)
+
+
 def test_event_raster_periodic_iss5():
     from rockpool import TSEvent
     import numpy as np
@@ -56,3 +56,112 @@ def test_specification_V2():
     output_raster_vmem, _, _ = mod_xylo_sim_vmem(input_raster)
     output_raster_isyn, _, _ = mod_xylo_sim_isyn(input_raster)
     output_raster_spike, _, _ = mod_xylo_sim_spike(input_raster)
+
+
+def test_numpy_engine_V2():
+    from rockpool.devices.xylo.syns61201 import XyloSim
+
+    import numpy as np
+
+    np.random.seed(1)
+
+    Nin = 4
+    Nhidden = 10
+    Nout = 2
+
+    spec = {
+        "weights_in": np.random.randint(-128, 128, (Nin, Nhidden, 2)),
+        "weights_rec": np.random.randint(-128, 128, (Nhidden, Nhidden, 2)),
+        "weights_out": np.random.randint(-128, 128, (Nhidden, Nout)),
+        "dash_mem": np.random.randint(0, 8, Nhidden),
+        "dash_mem_out": np.random.randint(0, 8, Nout),
+        "dash_syn": np.random.randint(0, 8, Nhidden),
+        "dash_syn_2": np.random.randint(0, 8, Nhidden),
+        "dash_syn_out": np.random.randint(0, 8, Nout),
+        "threshold": np.random.randint(1, 1000, Nhidden),
+        "threshold_out": np.random.randint(1, 1000, Nout),
+        "bias": np.random.randint(-20, 20, Nhidden),
+        "bias_out": np.random.randint(-20, 20, Nout),
+        "weight_shift_in": 4,
+        "weight_shift_rec": 3,
+        "weight_shift_out": 2,
+        "aliases": [[3], [], [0]] + [[] for _ in range(Nhidden - 3)],
+    }
+
+    mod_xylosim = XyloSim.from_specification(**spec)
+    mod_numpy = XyloSim.from_specification(**spec, engine="numpy")
+
+    # - Evolve a batch with the numpy engine
+    B, T = 3, 200
+    input_raster = np.random.randint(0, 20, (B, T, Nin)) * (
+        np.random.rand(B, T, Nin) < 0.2
+    )
+    out_batch, _, rec_batch = mod_numpy(input_raster, record=True)
+    assert out_batch.shape == (B, T, Nout)
+
+    # - Compare each batch with the XyloSim back-end
+    for b in range(B):
+        mod_xylosim.reset_state()
+        out, _, rec = mod_xylosim(input_raster[b], record=True)
+
+        assert np.array_equal(out, out_batch[b])
+        for k in rec:
+            assert np.array_equal(rec[k], rec_batch[k][b]), k
+
+    # - Unbatched evolution continues from the module state
+    mod_numpy.reset_state()
+    mod_xylosim.reset_state()
+    for _ in range(2):
+        out, _, rec = mod_xylosim(input_raster[0], record=True)
+        out_np, _, rec_np = mod_numpy(input_raster[0], record=True)
+        assert np.array_equal(out, out_np)
+        for k in rec:
+            assert np.array_equal(rec[k], rec_np[k]), k
+
+    # - The XyloSim back-end rejects batched input
+    with pytest.raises(ValueError):
+        mod_xylosim(input_raster)
+
+
+def test_synapse_cache_V2():
+    from rockpool.devices.xylo.syns61201 import XyloSim
+
+    import numpy as np
+
+    np.random.seed(3)
+
+    Nin = 4
+    Nhidden = 6
+    Nout = 2
+
+    spec = {
+        "weights_in": np.random.randint(-4, 4, (Nin, Nhidden, 2)),
+        "weights_rec": np.random.randint(-4, 4, (Nhidden, Nhidden, 2)),
+        "weights_out": np.random.randint(-4, 4, (Nhidden, Nout)),
+        "threshold": np.ones(Nhidden, "int") * 3,
+        "threshold_out": np.ones(Nout, "int") * 3,
+    }
+
+    # - Synapse lists are reused for identical weights
+    mod_a = XyloSim.from_specification(**spec)
+    mod_b = XyloSim.from_specification(**spec)
+    assert mod_a._xylo_sim_params.synapses_in is mod_b._xylo_sim_params.synapses_in
+    assert mod_a._xylo_layer is not mod_b._xylo_layer
+
+    # - Synapse lists match the dense weights
+    for pre, syns in enumerate(mod_a._xylo_sim_params.synapses_rec):
+        w = np.zeros((Nhidden, 2), int)
+        for syn in syns:
+            w[syn.target_neuron_id, syn.target_synapse_id] = syn.weight
+        assert np.array_equal(w, spec["weights_rec"][pre])
+
+    # - Modules sharing synapses evolve independently
+    input_raster = np.random.randint(0, 2, (100, Nin))
+    out_a, _, _ = mod_a(input_raster)
+    out_b, _, _ = mod_b(input_raster)
+    assert np.array_equal(out_a, out_b)
+
+    # - Different weights produce new synapse lists
+    spec["weights_in"] = spec["weights_in"] + 1
+    mod_c = XyloSim.from_specification(**spec)
+    assert mod_c._xylo_sim_params.synapses_in is not mod_a._xylo_sim_params.synapses_in